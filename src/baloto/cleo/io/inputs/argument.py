@@ -46,8 +46,6 @@ class Argument(BaseInputModel):
         default: str | list[str] | None = None,
         choices: Sequence[str] | None = None,
     ):
-        arg: Argument = cls.__new__(Argument)
-        arg.name = name
         return cls(
             name=name,
             required=required,
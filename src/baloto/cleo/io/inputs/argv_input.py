@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import itertools
 import sys
 from typing import Any
 from typing import TYPE_CHECKING
@@ -8,6 +7,8 @@ from typing import TYPE_CHECKING
 from baloto.cleo.exceptions.errors import CleoNoSuchOptionError
 from baloto.cleo.exceptions.errors import CleoRuntimeError
 from baloto.cleo.io.inputs.input import Input
+from baloto.cleo.io.inputs.tokens import TokenIndex
+from baloto.cleo.io.inputs.tokens import TokenKind
 
 if TYPE_CHECKING:
     from baloto.cleo.io.inputs.definition import Definition
@@ -31,24 +32,39 @@ class ArgvInput(Input):
             self._script_name = None
 
         self._tokens = argv
-        self._parsed: list[str] = []
+        self._token_index: TokenIndex | None = None
+        # The position of the next token to parse
+        self._cursor = 0
 
         super().__init__(definition=definition)
 
+    @property
+    def token_index(self) -> TokenIndex:
+        """
+        The tokens classified once, raw option queries read this index.
+        """
+        # _set_tokens() clears the index whenever the tokens change
+        if self._token_index is None:
+            self._token_index = TokenIndex(self._tokens)
+        return self._token_index
+
     @property
     def first_argument(self) -> str | None:
+        index = self.token_index
         is_option = False
-        for i, token in zip(itertools.count(start=0, step=1), self._tokens):
-            eq_tokens = list(itertools.takewhile(lambda t: token.startswith("-"), self._tokens))
-            if eq_tokens:
-                if "=" in token or len(self._tokens) == (i + 1):
+        for i, (token, kind) in enumerate(zip(index.tokens, index.kinds)):
+            if kind is TokenKind.SEPARATOR:
+                continue
+
+            if kind is TokenKind.LONG_OPTION or kind is TokenKind.SHORT_OPTION:
+                if "=" in token or len(index.tokens) == (i + 1):
                     continue
-                name = token[2:] if token.startswith("--") else token[-1]
+                name = token[2:] if kind is TokenKind.LONG_OPTION else token[-1]
                 if not (name in self._options or self._definition.has_shortcut(name)):
                     continue
                 if name not in self._options:
                     name = self._definition.shortcut_to_name(name)
-                if name in self._options and self._tokens[i + 1] == self._options[name]:
+                if name in self._options and index.tokens[i + 1] == self._options[name]:
                     is_option = True
 
                 continue
@@ -71,17 +87,7 @@ class ArgvInput(Input):
         if not isinstance(values, list):
             values = [values]
 
-        for token in self._tokens:
-            if only_params and token == "--":
-                return False
-
-            for value in values:
-                leading = value + "=" if value.startswith("--") else value
-
-                if token == value or (leading != "" and token.startswith(leading)):
-                    return True
-
-        return False
+        return self.token_index.first(values, only_params) is not None
 
     def parameter_option(
         self, values: str | list[str], default: Any = False, only_params: bool = False
@@ -89,57 +95,52 @@ class ArgvInput(Input):
         if not isinstance(values, list):
             values = [values]
 
-        tokens = self._tokens[:]
-        while tokens:
-            token = tokens.pop(0)
-            if only_params and token == "--":
-                return default
-
-            for value in values:
-                if token == value:
-                    try:
-                        return tokens.pop(0)
-                    except IndexError:
-                        return None
-
-                # Options with values:
-                # For long options, test for '--option=' at beginning
-                # For short options, test for '-o' at beginning
-                leading = value + "=" if value.startswith("--") else value
+        match = self.token_index.first(values, only_params)
+        if match is None:
+            return default
 
-                if token == value or (leading != "" and token.startswith(leading)):
-                    return token[len(leading)]
-
-        return False
+        # '--option value' returns the next token, '--option=value' and '-ovalue' the rest
+        return match[1]
 
     def _parse(self) -> None:
-        parse_options = True
-        self._parsed = self._tokens[:]
+        index = self.token_index
+        self._cursor = 0
 
-        try:
-            token = self._parsed.pop(0)
-        except IndexError:
-            return
+        while self._cursor < len(index.tokens):
+            position = self._cursor
+            token = index.tokens[position]
+            self._cursor += 1
 
-        while token is not None:
-            if parse_options and token == "":
+            kind = index.kinds[position]
+            if token == "" and position < index.separator:
                 self._parse_argument(token)
-            elif parse_options and token == "--":
-                parse_options = False
-            elif parse_options and token.startswith("--"):
+            elif kind is TokenKind.SEPARATOR:
+                continue
+            elif kind is TokenKind.LONG_OPTION:
                 self._parse_long_option(token)
-            elif parse_options and token.startswith("-") and token != "-":
+            elif kind is TokenKind.SHORT_OPTION:
                 self._parse_short_option(token)
             else:
                 self._parse_argument(token)
 
-            try:
-                token = self._parsed.pop(0)
-            except IndexError:
-                return
+    def _next_token(self) -> str | None:
+        """
+        Consumes the next token when it is not an option, the value of an option.
+        """
+        index = self.token_index
+        if self._cursor >= len(index.tokens):
+            return None
+
+        next_token = index.tokens[self._cursor]
+        if next_token.startswith("-") and next_token != "":
+            return None
+
+        self._cursor += 1
+        return next_token
 
     def _set_tokens(self, tokens: list[str]) -> None:
         self._tokens = tokens
+        self._token_index = None
 
     def _parse_short_option(self, token: str) -> None:
         name = token[1:]
@@ -177,11 +178,8 @@ class ArgvInput(Input):
 
         pos = name.find("=")
         if pos != -1:
-            value = name[pos + 1 :]
-            if not value:
-                self._parsed.insert(0, value)
-
-            self._add_long_option(name[:pos], value)
+            # An explicit empty value '--name=' does not take the next token
+            self._add_long_option(name[:pos], name[pos + 1 :])
         else:
             self._add_long_option(name, None)
 
@@ -245,14 +243,10 @@ class ArgvInput(Input):
         if not (value is None or option.accepts_value):
             raise CleoRuntimeError(f'The "--{name}" option does not accept a value')
 
-        if value in ("", None) and option.accepts_value and self._parsed:
+        if value is None and option.accepts_value:
             # If the option accepts a value, either required or optional,
             # we check if there is one
-            next_token = self._parsed.pop(0)
-            if not next_token.startswith("-") or next_token in ("", None):
-                value = next_token
-            else:
-                self._parsed.insert(0, next_token)
+            value = self._next_token()
 
         if value is None:
             if option.is_value_required():
@@ -7,6 +7,8 @@ from typing import Any
 from baloto.cleo.exceptions.errors import CleoLogicError
 from baloto.cleo.io.inputs.argument import Argument
 from baloto.cleo.io.inputs.option import Option
+from baloto.cleo.io.inputs.tokens import TokenIndex
+from baloto.cleo.io.inputs.tokens import TokenKind
 
 
 __all__ = ("Definition",)
@@ -366,6 +368,64 @@ class Definition:
 
         return self._shortcuts[shortcut]
 
+    def extract_options(self, tokens: Sequence[str]) -> tuple[list[str], list[str]]:
+        """
+        Splits raw tokens, in a single pass, into the ones belonging to the options of
+        this definition (with their values) and the rest, both keeping their order.
+
+        Unknown options are left with the rest, so are the tokens after ``--``.
+        """
+        index = TokenIndex(tokens)
+        extracted: list[str] = []
+        remaining: list[str] = []
+
+        position = 0
+        while position < len(index.tokens):
+            token = index.tokens[position]
+            kind = index.kinds[position]
+            position += 1
+
+            if kind is TokenKind.LONG_OPTION:
+                name, equals, _ = token[2:].partition("=")
+                option = self._options.get(name)
+                takes_next = option is not None and not equals and option.accepts_value
+            elif kind is TokenKind.SHORT_OPTION:
+                name = token[1:]
+                if name in self._shortcuts:
+                    option = self.option_for_shortcut(name)
+                    takes_next = option.accepts_value
+                elif name[0] in self._shortcuts and self.option_for_shortcut(name[0]).accepts_value:
+                    # A value with no space, '-ofoo'
+                    option = self.option_for_shortcut(name[0])
+                    takes_next = False
+                elif all(
+                    shortcut in self._shortcuts
+                    and not self.option_for_shortcut(shortcut).accepts_value
+                    for shortcut in name
+                ):
+                    # A set of flags, '-nq'
+                    option = self.option_for_shortcut(name[0])
+                    takes_next = False
+                else:
+                    option = None
+            else:
+                option = None
+
+            if option is None:
+                remaining.append(token)
+                continue
+
+            extracted.append(token)
+            if (
+                takes_next
+                and position < index.separator
+                and index.kinds[position] is TokenKind.ARGUMENT
+            ):
+                extracted.append(index.tokens[position])
+                position += 1
+
+        return extracted, remaining
+
     def synopsis(self, short: bool = False) -> str:
         elements = []
 
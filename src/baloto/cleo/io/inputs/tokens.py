@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+__all__ = ("TokenKind", "TokenIndex")
+
+
+class TokenKind(enum.Enum):
+    LONG_OPTION = "long"
+    SHORT_OPTION = "short"
+    SEPARATOR = "separator"
+    ARGUMENT = "argument"
+
+
+class TokenIndex:
+    """
+    Classifies the raw tokens of an input in a single pass.
+
+    Besides the kind of every token, the index keeps the first position where every
+    raw parameter (``--name``, ``--name=``, ``-v``, ``-vv`` ...) appears before and after
+    the ``--`` separator, so raw option queries are dictionary lookups instead of
+    scanning the tokens again.
+    """
+
+    __slots__ = ("tokens", "kinds", "separator", "_params", "_all")
+
+    def __init__(self, tokens: Sequence[str]) -> None:
+        self.tokens = tuple(tokens)
+        self.kinds: list[TokenKind] = []
+        self.separator = len(self.tokens)
+        # raw parameter -> (position, value), the value is what follows the parameter
+        self._params: dict[str, tuple[int, str | None]] = {}
+        self._all: dict[str, tuple[int, str | None]] = {}
+
+        options = True
+        for position, token in enumerate(self.tokens):
+            if options and token == "--":
+                kind = TokenKind.SEPARATOR
+                self.separator = position
+                options = False
+            elif options and token.startswith("--"):
+                kind = TokenKind.LONG_OPTION
+            elif options and token.startswith("-") and token != "-":
+                kind = TokenKind.SHORT_OPTION
+            else:
+                kind = TokenKind.ARGUMENT
+            self.kinds.append(kind)
+            self._index(position, token, self._all)
+            if options:
+                self._index(position, token, self._params)
+
+    def _index(self, position: int, token: str, index: dict[str, tuple[int, str | None]]) -> None:
+        following = self.tokens[position + 1] if position + 1 < len(self.tokens) else None
+        index.setdefault(token, (position, following))
+        if token.startswith("--"):
+            equals = token.find("=")
+            if equals != -1:
+                # '--name=value' answers the '--name' parameter
+                index.setdefault(token[:equals], (position, token[equals + 1 :]))
+        elif token.startswith("-"):
+            # '-vvv' also answers '-v' and '-vv', '-ofoo' answers '-o' with 'foo'
+            for end in range(2, len(token)):
+                index.setdefault(token[:end], (position, token[end:]))
+
+    def first(
+        self, values: Sequence[str], only_params: bool = False
+    ) -> tuple[int, str | None] | None:
+        """
+        The position and value of the first raw parameter of ``values``, ``None`` when
+        there is none.
+        """
+        index = self._params if only_params else self._all
+        found = [index[value] for value in values if value in index]
+        return min(found, key=lambda match: match[0]) if found else None
+
+    def arguments(self) -> list[int]:
+        """
+        The positions of the tokens that are not options nor the separator.
+        """
+        return [position for position, kind in enumerate(self.kinds) if kind is TokenKind.ARGUMENT]
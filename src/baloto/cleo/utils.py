@@ -7,50 +7,106 @@
 from __future__ import annotations
 
 import re
+import sys
 from typing import TYPE_CHECKING, Any
 
-from rich.console import WINDOWS
-
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
     from baloto.utils.types import PathStr
 
 
-__all__ = ("find_similar_names", "escape_trailing_backslash", "escape", "shell_quote", "safe_str", "markup_path", "markup_loation")
+__all__ = ("SuggestionIndex", "find_similar_names", "escape_trailing_backslash", "escape", "shell_quote", "safe_str", "markup_path", "markup_loation")
+
+
+# The minimum rapidfuzz ratio (0 to 100) of a suggestion
+SIMILARITY_CUTOFF = 40.0
+
+
+class SuggestionIndex:
+    """
+    Command names, aliases and namespaces prepared once for "did you mean" lookups.
+
+    Names are lowercased and grouped by namespace when the index is built, a lookup is
+    a single :func:`rapidfuzz.process.extract` call over the candidates.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._names: list[str] = []
+        # name -> position in _names, for constant time membership
+        self._positions: dict[str, int] = {}
+        self._keys: list[str] = []
+        self._spaced: list[int] = []
+        self._namespaces: dict[str, list[int]] = {}
+        self.add(names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    def add(self, names: Iterable[str]) -> None:
+        for name in names:
+            if name in self._positions:
+                continue
+            index = len(self._names)
+            self._positions[name] = index
+            self._names.append(name)
+            self._keys.append(name.lower())
+            if " " in name:
+                self._spaced.append(index)
+            parts = name.split(" ")[:-1]
+            for end in range(1, len(parts) + 1):
+                self._namespaces.setdefault(" ".join(parts[:end]), []).append(index)
+
+    def suggest(self, name: str, namespace: str | None = None, limit: int | None = None) -> list[str]:
+        """
+        The names similar to ``name``, most similar first.
+
+        Names containing ``name`` always match and rank first, ``namespace`` restricts
+        the candidates to the commands of that namespace.
+        """
+        from rapidfuzz import fuzz
+        from rapidfuzz import process
+
+        if namespace is not None:
+            candidates = self._namespaces.get(namespace, [])
+        elif " " in name:
+            # A namespaced name is only compared with the other namespaced names
+            candidates = self._spaced
+        else:
+            candidates = range(len(self._names))
+
+        query = name.lower()
+        choices = {index: self._keys[index] for index in candidates}
+        matches = process.extract(
+            query, choices, scorer=fuzz.ratio, score_cutoff=SIMILARITY_CUTOFF, limit=None
+        )
+        scores = {index: score for _, score, index in matches}
+        for index, key in choices.items():
+            if index not in scores and query in key:
+                scores[index] = 0.0
+
+        def rank(index: int) -> tuple[bool, float, int]:
+            position = self._keys[index].find(query)
+            return position == -1, -scores[index], position
+
+        ordered = sorted(scores, key=rank)
+        return [self._names[index] for index in ordered[:limit]]
 
 
 def find_similar_names(name: str, names: list[str]) -> list[str]:
     """
     Finds names matching to a given command name.
     """
-    from difflib import SequenceMatcher
-    threshold = 0.4
-    distance_by_name = {}
-    if " " in name:
-        names = [name for name in names if " " in name]
-    for actual_name in names:
-        distance = SequenceMatcher(None, actual_name, name).ratio()
-
-        is_similar = distance <= len(name) / 3
-        substring_index = actual_name.find(name)
-        is_substring = substring_index != -1
-
-        if is_similar or is_substring:
-            distance_by_name[actual_name] = (
-                distance,
-                substring_index if is_substring else float("inf"),
-            )
-
-    # Only keep results with a distance below the threshold
-    distance_by_name = {key: value for key, value in distance_by_name.items() if value[0] > threshold}
-    # Display results with shortest distance first
-    return sorted(distance_by_name, key=lambda key: distance_by_name[key])
+    return SuggestionIndex(names).suggest(name)
 
 
 def shell_quote(token: str) -> str:
     import shlex
     import subprocess
-    if WINDOWS:
+    if sys.platform.startswith("win"):
         return subprocess.list2cmdline([token])
 
     return shlex.quote(token)
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import shutil
 import sys
@@ -39,7 +40,7 @@ from rich.theme import Theme
 
 from baloto.cleo.io.outputs.output import Verbosity
 
-__all__ = ("BalotoSettings", "settings", "ConsoleConfig", "TracebackSettings")
+__all__ = ("BalotoSettings", "settings", "get_settings", "ConsoleConfig", "TracebackSettings")
 
 from baloto.core.rich.theme import BalotoHighlighter
 from baloto.core.rich.theme import BalotoSyntaxTheme
@@ -168,6 +169,16 @@ class BalotoSettings(BaseSettings, case_sensitive=True):
     console: ConsoleConfig = ConsoleConfig()
 
 
+@functools.cache
+def get_settings() -> BalotoSettings:
+    """
+    Builds the settings on first use, validating the environment only when needed.
+    """
+    return BalotoSettings()
 
 
-settings = BalotoSettings()
+def __getattr__(name: str) -> Any:
+    # ``settings`` is built lazily, importing this module does not read the environment
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import sys
 
-from baloto.miloto.application import Application
-
 
 def main() -> int:
+    # Imported here so running the module only loads what the command needs
+    from baloto.miloto.application import Application
+
     exit_code: int = Application().run()
     return exit_code
 
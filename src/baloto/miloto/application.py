@@ -1,36 +1,30 @@
 from __future__ import annotations
 
-import argparse
-from contextlib import suppress
-from importlib import import_module
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import cast
 
-from glom import glom
-
 from baloto.__version__ import __version__
 from baloto.cleo.cleo_application import Application as CleoApplication
 # from baloto.cleo.decorator import set_rich_console
 from baloto.cleo.events.console_events import COMMAND
 from baloto.cleo.events.event_dispatcher import EventDispatcher
 from baloto.cleo.exceptions.errors import CleoCommandNotFoundError
-from baloto.cleo.exceptions.errors import CleoError
-from baloto.cleo.io.inputs.argv_input import ArgvInput
-from baloto.cleo.io.outputs.console_output import ConsoleOutput
-from baloto.cleo.utils import find_similar_names
-from baloto.core.utils.helpers import ensure_path, directory
 from baloto.miloto.console.commands.command import Command
 from baloto.miloto.console.loaders.command_loader import CommandLoader
+from baloto.miloto.console.loaders.manifest import CommandManifest
 from baloto.miloto.exceptions.errors import BalotoRuntimeError
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from baloto.cleo.events.event import Event
+    from baloto.cleo.io.inputs.argv_input import ArgvInput
     from baloto.cleo.io.inputs.definition import Definition
     from baloto.cleo.io.inputs.input import Input
     from baloto.cleo.io.io import IO
     from baloto.cleo.io.outputs.output import Output
+    from baloto.cleo.utils import SuggestionIndex
+    from baloto.miloto.console.loaders.manifest import CommandEntry
     from baloto.miloto.miloto import Miloto
 
 
@@ -52,16 +46,35 @@ Since <info>Poetry (<b>2.0.0</>)</>, the <c1>shell</> command is not installed b
 
 
 def load_command(name: str) -> Callable[[], Command]:
-    def _load() -> Command:
-        words = name.split(" ")
-        module = import_module("baloto.miloto.console.commands." + ".".join(words))
-        command_class = getattr(module, "".join(c.title() for c in words) + "Command")
-        command: Command = command_class()
-        return command
-
-    return _load
-
-COMMANDS = ["about"]
+    from baloto.miloto.console.loaders.command_loader import entry_factory
+    from baloto.miloto.console.loaders.manifest import CommandEntry
+
+    return entry_factory(CommandEntry.for_name(name))
+
+
+COMMANDS = [
+    "about",
+    "odds",
+    "simulate",
+    "wheel",
+    # Database commands
+    "db export",
+    "db import",
+    "db init",
+    "db rebuild-stats",
+    # Statistics commands
+    "stats follow",
+    "stats frequency",
+    "stats gaps",
+    "stats jackpot",
+    "stats never-drawn",
+    "stats pairs",
+    "stats patterns",
+    "stats randomness",
+    # Ticket commands
+    "tickets add",
+    "tickets check",
+]
 
 
 class Application(CleoApplication):
@@ -74,12 +87,14 @@ class Application(CleoApplication):
         self._project_directory: Path | None = None
         self._no_ansi: bool | None = None
         self._force_ansi: bool | None = None
+        self._suggestions: SuggestionIndex | None = None
         dispatcher = EventDispatcher()
         dispatcher.add_listener(COMMAND, register_command_loggers)
         dispatcher.add_listener(COMMAND, self.flush_screen)
         self.event_dispatcher = dispatcher
 
-        self.set_command_loader(CommandLoader({name: load_command(name) for name in COMMANDS}))
+        # Names, aliases and descriptions come from the manifest, commands are imported on use
+        self.set_command_loader(CommandLoader.from_manifest(CommandManifest.load(COMMANDS)))
 
     @property
     def miloto(self) -> Miloto:
@@ -92,6 +107,52 @@ class Application(CleoApplication):
 
         return self._miloto
 
+    @property
+    def suggestions(self) -> SuggestionIndex:
+        """
+        The command names, aliases and namespaces indexed for "did you mean" lookups.
+        """
+        from baloto.cleo.utils import SuggestionIndex
+
+        if self._suggestions is None:
+            names = [name for name, command in self.all().items() if not command.hidden]
+            self._suggestions = SuggestionIndex([*names, *self.get_namespaces()])
+        return self._suggestions
+
+    @property
+    def description(self) -> str:
+        # Read from the pyproject only when the help or list output shows it
+        if not self._description:
+            from glom import glom
+
+            self._description = glom(self.miloto.poetry.pyproject.data, "project.description")
+        return self._description
+
+    @description.setter
+    def description(self, description: str) -> None:
+        self._description = description
+
+    def all(self, namespace: str | None = None) -> dict[str, Command | CommandEntry]:
+        """
+        The loaded commands and the manifest entries of the ones not loaded yet, listing
+        the commands does not import them.
+        """
+        self._init()
+
+        commands = {
+            name: command
+            for name, command in self._commands.items()
+            if namespace is None or namespace == self.extract_namespace(name, name.count(" ") + 1)
+        }
+        for entry in self.command_loader.manifest or ():
+            for name in (entry.name, *entry.aliases):
+                if namespace is None or namespace == self.extract_namespace(
+                    name, name.count(" ") + 1
+                ):
+                    commands.setdefault(name, entry)
+
+        return commands
+
     @property
     def project_directory(self) -> Path:
         return self._project_directory or self._working_directory
@@ -120,6 +181,8 @@ class Application(CleoApplication):
         error_output: Output | None = None,
     ) -> IO:
         from rich.style import Style
+
+        from baloto.cleo.io.outputs.console_output import ConsoleOutput
         from baloto.cleo.rich.console_factory import ConsoleFactory
 
         io = super().create_io(input, output, error_output)
@@ -198,8 +261,8 @@ light_colors = ["brightblack", "brightred", "brightgreen", "brightyellow", "brig
         # to ensure the users are not exposed to a stack trace for providing invalid values to
         # the options --directory or --project, configuring the options here allow cleo to trap and
         # display the error cleanly unless the user uses verbose or debug
+        from baloto.core.utils.helpers import directory
 
-        self._description = glom(self.miloto.poetry.pyproject.data, "project.description")
         self._configure_global_options(io)
 
 
@@ -225,21 +288,15 @@ light_colors = ["brightblack", "brightred", "brightgreen", "brightyellow", "brig
                     return 1
 
                 if command is not None and command in self.get_namespaces():
-                    sub_commands = []
-
-                    for key in self._commands:
-                        if key.startswith(f"{command} "):
-                            sub_commands.append(key)
-
                     io.error_output.write(
                         f"The requested command does not exist in the [command]{command}[/] namespace."
                     )
-                    suggested_names = find_similar_names(command, sub_commands)
+                    suggested_names = self.suggestions.suggest(command, namespace=command)
                     self._error_write_command_suggestions(io, suggested_names, f"#{command}")
                     return 1
 
                 if command is not None:
-                    suggested_names = find_similar_names(command, list(self._commands.keys()))
+                    suggested_names = self.suggestions.suggest(command)
                     io.error_output.write(
                         f"The requested command [command]{command}[/] does not exist."
                     )
@@ -254,11 +311,15 @@ light_colors = ["brightblack", "brightred", "brightgreen", "brightyellow", "brig
         self, io: IO, suggested_names: list[str], doc_tag: str | None = None
     ) -> None:
         if suggested_names:
+            commands = self.all()
+            # Suggestions keep the index order, the most similar first
             suggestion_lines = [
-                f"[c1]{name.replace(' ', '[/] [b]', 1)}[/]: {self._commands[name].description}"
+                f"[c1]{name.replace(' ', '[/] [b]', 1)}[/]: {commands[name].description}"
+                if name in commands
+                else f"[c1]{name}[/]: [dim]namespace[/]"
                 for name in suggested_names
             ]
-            suggestions = "\n    ".join(["", *sorted(suggestion_lines)])
+            suggestions = "\n    ".join(["", *suggestion_lines])
             io.error_output.write(f"\n[error]Did you mean one of these perhaps?[/]{suggestions}")
 
         io.error_output.write(
@@ -266,45 +327,22 @@ light_colors = ["brightblack", "brightred", "brightgreen", "brightyellow", "brig
         )
 
     def _configure_global_options(self, io: IO) -> None:
+        from baloto.core.utils.helpers import ensure_path
+
         self._working_directory = ensure_path(Path.cwd(), is_directory=True)
-        self._no_ansi = io.input.option("no-ansi")
-        self._force_ansi = io.input.option("ansi")
+        self._no_ansi = io.input.has_parameter_option("--no-ansi", only_params=True)
+        self._force_ansi = io.input.has_parameter_option("--ansi", only_params=True)
 
     def _sort_global_options(self, io: IO) -> None:
         original_input = cast("ArgvInput", io.input)
         # noinspection PyProtectedMember
         tokens: list[str] = original_input._tokens
 
-        parser = argparse.ArgumentParser(add_help=False)
-
-
-        for option in self.definition.options():
-            parser.add_argument(
-                f"--{option.name}",
-                *([f"-{option.shortcut}"] if option.shortcut else []),
-                action="store_true" if option.flag else "store",
-            )
-
-        args, remaining_args = parser.parse_known_args(tokens)
-
-        tokens = []
-        for option in self.definition.options():
-            key = option.name.replace("-", "_")
-            value = getattr(args, key, None)
-
-            if value is not None:
-                if value:  # is truthy
-                    tokens.append(f"--{option.name}")
-
-                if option.accepts_value:
-                    tokens.append(str(value))
-
-        sorted_input = ArgvInput([self.name or "", *tokens, *remaining_args])
-
-        with suppress(CleoError):
-            sorted_input.bind(self.definition)
-
-        io.input = sorted_input
+        # Global options go first so they are never taken for command arguments,
+        # the input is bound once the command is known
+        options, remaining = self.definition.extract_options(tokens)
+        # noinspection PyProtectedMember
+        original_input._set_tokens([*options, *remaining])
 
     def _configure_io(self, io: IO) -> None:
         self._sort_global_options(io)
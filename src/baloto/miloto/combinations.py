@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from math import comb
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.games import BALLS_PER_DRAW
+from baloto.miloto.games import MAX_BALL
+from baloto.miloto.games import mask_balls
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import ArrayLike
+    from numpy.typing import NDArray
+
+
+__all__ = (
+    "COMBINATIONS",
+    "rank",
+    "unrank",
+    "rank_mask",
+    "ranks",
+    "unranks",
+    "masks_to_ranks",
+    "ranks_to_masks",
+)
+
+# C(43, 5), every rank is below it
+COMBINATIONS = comb(MAX_BALL, BALLS_PER_DRAW)
+
+# BINOMIALS[n, k] is C(n, k), every column is nondecreasing in n
+BINOMIALS = np.array(
+    [[comb(n, k) for k in range(BALLS_PER_DRAW + 1)] for n in range(MAX_BALL + 1)],
+    dtype=np.int64,
+)
+
+
+def rank(balls: Sequence[int]) -> int:
+    """
+    The position of a combination in the combinatorial number system.
+
+    Sorted balls ``b1 < ... < b5`` rank as ``C(b1 - 1, 1) + ... + C(b5 - 1, 5)``, so the
+    combinations of a smaller range rank first: every miloto draw ranks below ``C(39, 5)``.
+    """
+    ordered = sorted(balls)
+    if len(set(ordered)) != BALLS_PER_DRAW or not 1 <= ordered[0] <= ordered[-1] <= MAX_BALL:
+        raise ValueError(f"A combination has {BALLS_PER_DRAW} distinct balls, got {balls}")
+    return sum(comb(ball - 1, k) for k, ball in enumerate(ordered, start=1))
+
+
+def unrank(value: int) -> tuple[int, ...]:
+    """
+    The sorted balls of the combination ranked ``value``.
+    """
+    return tuple(unranks(np.array([value]))[0].tolist())
+
+
+def rank_mask(mask: int) -> int:
+    """
+    The rank of a ball mask, used as the ``combination_rank`` SQL function.
+    """
+    return rank(mask_balls(mask))
+
+
+def ranks(balls: ArrayLike) -> NDArray[np.int64]:
+    """
+    The ranks of a ``(draws, 5)`` matrix of balls in any order.
+    """
+    values = np.sort(np.asarray(balls, dtype=np.intp), axis=1) - 1
+    return BINOMIALS[values, np.arange(1, BALLS_PER_DRAW + 1)].sum(axis=1)
+
+
+def unranks(values: ArrayLike) -> NDArray[np.uint8]:
+    """
+    The sorted ``(draws, 5)`` balls of the ranks ``values``.
+    """
+    remaining = np.asarray(values, dtype=np.int64).copy()
+    if remaining.size and (remaining.min() < 0 or remaining.max() >= COMBINATIONS):
+        raise ValueError(f"Ranks are between 0 and {COMBINATIONS - 1}")
+
+    balls = np.empty((len(remaining), BALLS_PER_DRAW), dtype=np.uint8)
+    # Greedy from the highest ball, the largest n with C(n, k) <= rank is the next ball - 1
+    for k in range(BALLS_PER_DRAW, 0, -1):
+        column = BINOMIALS[:, k]
+        n = np.searchsorted(column, remaining, side="right") - 1
+        balls[:, k - 1] = n + 1
+        remaining -= column[n]
+    return balls
+
+
+def masks_to_ranks(masks: ArrayLike) -> NDArray[np.int64]:
+    """
+    The ranks of ``uint64`` ball masks with exactly five bits set.
+    """
+    masks = np.asarray(masks, dtype=np.uint64)
+    bits = (masks[:, None] >> np.arange(MAX_BALL, dtype=np.uint64)) & np.uint64(1)
+    if not np.all(bits.sum(axis=1) == BALLS_PER_DRAW):
+        raise ValueError(f"Every mask must have {BALLS_PER_DRAW} balls")
+    _, columns = np.nonzero(bits)
+    return ranks(columns.reshape(-1, BALLS_PER_DRAW) + 1)
+
+
+def ranks_to_masks(values: ArrayLike) -> NDArray[np.uint64]:
+    """
+    The ``uint64`` ball masks of the ranks ``values``.
+    """
+    balls = unranks(values).astype(np.uint64)
+    return np.bitwise_or.reduce(np.uint64(1) << (balls - np.uint64(1)), axis=1)
@@ -11,10 +11,10 @@ from typing import TYPE_CHECKING, ClassVar, IO, Any
 
 from baloto.cleo.commands.cleo_command import Command as CleoCmmand
 from baloto.cleo.exceptions.errors import CleoValueError
-from baloto.miloto.miloto import Miloto
 
 if TYPE_CHECKING:
     from baloto.cleo.cleo_application import Application
+    from baloto.miloto.miloto import Miloto
 
 
 class Command(CleoCmmand, ABC):
@@ -26,7 +26,7 @@ class Command(CleoCmmand, ABC):
     @property
     def miloto(self) -> Miloto:
         if self._miloto is None:
-            return self.get_application().poetry
+            return self.get_application().miloto
 
         return self._miloto
 
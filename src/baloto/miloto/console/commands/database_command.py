@@ -1,55 +1,87 @@
 from __future__ import annotations
 
 from abc import ABC
-import sqlite3
 from typing import TYPE_CHECKING
 
-from baloto.core.commands.command import Command as BalotoCommand
-
+from baloto.cleo.exceptions.errors import CleoLogicError
+from baloto.miloto.console.commands.command import Command as BalotoCommand
+from baloto.miloto.database.connection import ConnectionManager
 
 if TYPE_CHECKING:
-
-    from baloto.core.cleo.io.inputs.option import Option
-    from baloto.core.cleo.io.inputs.argument import Argument
+    import sqlite3
     from pathlib import Path
     from rich.console import Console
-    from baloto.core.poetry.poetry import Poetry
+
+    from baloto.cleo.io.io import IO
+    from baloto.miloto.games import GameType
+    from baloto.miloto.stats.matrix import DrawMatrix
 
 
 class DatabaseCommand(BalotoCommand, ABC):
-    def __init__(self):
+    def __init__(self) -> None:
         super().__init__()
 
         self.console: Console | None = None
         self.error_console: Console | None = None
         self.database_file: Path | None = None
+        self._database: ConnectionManager | None = None
         self.db_file_name = "db.sqlite3"
 
     def setup(self) -> int:
-        self.console = self.io.console
-        self.error_console = self.io.error_console
-        self.database_file = self.poetry.pyproject_path.parent / self.db_file_name
-        connection: sqlite3.Connection | None = None
+        self.console = self.io.output.console
+        self.error_console = self.io.error_output.console
+        self.database_file = self.miloto.poetry.pyproject_path.parent / self.db_file_name
+        # Connections are opened on first use and shared by the whole command
+        self._database = ConnectionManager(self.database_file)
 
-        if self.database_file.exists():
-            if self.io.is_verbose():
-                posix = self.database_file.as_posix()
+        if self.io.is_verbose():
+            posix = self.database_file.as_posix()
+            if self.database_file.exists():
                 self.console.print(f"The database file {posix} already exists")
-            return 0
+            else:
+                self.console.print(f"The database file {posix} will be created")
+
+        return 0
+
+    @property
+    def database(self) -> ConnectionManager:
+        """
+        The connections shared by the command, available once :meth:`setup` has run.
+        """
+        if self._database is None:
+            raise CleoLogicError(
+                f'The "{self.name}" command database is used before setup()', code="db-not-setup"
+            )
+        return self._database
 
+    def execute(self, io: IO) -> int:
         try:
-            connection = sqlite3.connect(self.database_file)
-            if self.io.is_verbose():
-                self.console.print(
-                    f"  [info]-[/] Connection test; database {self.database_file} connected."
-                )
-        except sqlite3.Error as error:
-            self.error_console.print("[error]Failed to connect with sqlite3 database[/]", error)
-            return 1
+            return super().execute(io)
         finally:
-            if connection:
-                connection.close()
-                if self.io.is_verbose():
-                    self.console.print("  [info]-[/] The sqlite connection was closed")
+            # teardown() only runs when handle() succeeds, error exits close here
+            self._close_database()
 
+    def teardown(self) -> int:
+        self._close_database()
         return 0
+
+    def _close_database(self) -> None:
+        if self._database is not None and self._database.is_open:
+            self._database.close()
+            if self.io.is_verbose():
+                self.console.print("  [info]-[/] The sqlite connections were closed")
+
+    def cache_file(self, name: str) -> Path:
+        """
+        Returns the path of a cache file stored next to the database file.
+        """
+        path = self.database.path
+        return path.with_name(f"{path.stem}.{name}")
+
+    def draw_matrix(self, connection: sqlite3.Connection, game: GameType) -> DrawMatrix:
+        """
+        Loads the game draws through the memory mapped draw cache.
+        """
+        from baloto.miloto.database.cache import DrawCache
+
+        return DrawCache(self.cache_file(f"{game}.draws"), game).load(connection)
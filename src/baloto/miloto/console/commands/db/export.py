@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+from baloto.miloto.exceptions.errors import BalotoRuntimeError
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.option import Option
+
+
+class DbExportCommand(DatabaseCommand):
+    name = "db export"
+
+    description = "Exports the draws and statistics to [b]Parquet[/] or [b]NPZ[/] files."
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "output",
+            "o",
+            "The directory to write, defaults to db.export next to the database.",
+            flag=False,
+        ),
+        option(
+            "format",
+            "f",
+            "The file format, parquet needs pyarrow.",
+            flag=False,
+            default="auto",
+            choices=["auto", "parquet", "npz"],
+        ),
+        option(
+            "table",
+            "t",
+            "The tables to export (sessions, ball_counts, pair_counts, rolling_counts, gaps).",
+            flag=False,
+            multiple=True,
+        ),
+        option(
+            "chunk-size",
+            "r",
+            "Number of rows read and written per chunk.",
+            flag=False,
+            default="65536",
+        ),
+    ]
+
+    def handle(self) -> int:
+        import time
+
+        from baloto.miloto.database.export import EXPORT_TABLES
+        from baloto.miloto.database.export import export_table
+        from baloto.miloto.database.export import has_pyarrow
+
+        try:
+            row_group_size = int(self.option("chunk-size"))
+        except ValueError:
+            self.error_console.print("[error]The --chunk-size option must be an integer[/]")
+            return 1
+
+        names = self.option("table") or list(EXPORT_TABLES)
+        if unknown := [name for name in names if name not in EXPORT_TABLES]:
+            self.error_console.print(f"[error]Unknown table(s):[/] {', '.join(unknown)}")
+            return 1
+
+        columnar = {"auto": None, "parquet": True, "npz": False}[self.option("format")]
+        if columnar and not has_pyarrow():
+            self.error_console.print(
+                "[error]The parquet format needs [c1]pyarrow[/], install it or use --format npz[/]"
+            )
+            return 1
+        if columnar is None and not has_pyarrow() and self.io.is_verbose():
+            self.console.print("  [info]-[/] pyarrow is not installed, exporting to npz")
+
+        output = Path(self.option("output")) if self.option("output") else self.cache_file("export")
+        output.mkdir(parents=True, exist_ok=True)
+
+        start = time.perf_counter()
+        try:
+            with self.database.reader as conn:
+                for name in dict.fromkeys(names):
+                    path, rows = export_table(
+                        conn, EXPORT_TABLES[name], output, columnar, row_group_size
+                    )
+                    self.console.print(
+                        f"  [info]-[/] {name}: [repr.number]{rows}[/] rows written to "
+                        f"{path.as_posix()}"
+                    )
+        except BalotoRuntimeError as e:
+            self.error_console.line()
+            e.write(self.io)
+            return e.exit_code
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to export the database[/]", e)
+            return 1
+
+        if self.io.is_verbose():
+            elapsed = time.perf_counter() - start
+            self.console.print(f"  [info]-[/] Export finished in [repr.number]{elapsed:.3f}[/]s")
+
+        return 0
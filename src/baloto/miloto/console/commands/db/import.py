@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import argument
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+from baloto.miloto.exceptions.errors import BalotoRuntimeError
+from baloto.miloto.games import GameType
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.argument import Argument
+    from baloto.cleo.io.inputs.option import Option
+
+
+class DbImportCommand(DatabaseCommand):
+    name = "db import"
+
+    description = "Imports historical draws from [b]CSV[/] or [b]JSON[/] files into the database."
+
+    arguments: ClassVar[list[Argument]] = [
+        argument("files", "The draw history files to import.", multiple=True)
+    ]
+    options: ClassVar[list[Option]] = [
+        option(
+            "batch-size",
+            "b",
+            "Number of rows written per [c1]executemany[/] batch.",
+            flag=False,
+            default="500",
+        ),
+        option(
+            "game",
+            "g",
+            "The game of the draws that do not declare one.",
+            flag=False,
+            default="miloto",
+            choices=["miloto", "baloto", "revancha"],
+        ),
+        option(
+            "async",
+            "a",
+            "Read, validate and write the files concurrently through the ingestion pipeline.",
+        ),
+    ]
+
+    def handle(self) -> int:
+        from baloto.miloto.database.schema import SCHEMA_VERSION
+        from baloto.miloto.database.schema import current_version
+
+        try:
+            batch_size = int(self.option("batch-size"))
+        except ValueError:
+            self.error_console.print("[error]The --batch-size option must be an integer[/]")
+            return 1
+
+        game = GameType(self.option("game"))
+        files = [Path(file) for file in self.argument("files")]
+        if missing := [file.as_posix() for file in files if not file.is_file()]:
+            self.error_console.print(f"[error]File(s) not found:[/] {', '.join(missing)}")
+            return 1
+
+        start = time.perf_counter()
+        try:
+            with self.database.connection as conn:
+                if current_version(conn) != SCHEMA_VERSION:
+                    self.error_console.print(
+                        "[error]The database schema is not up to date, "
+                        "run [command]db init[/] first.[/]"
+                    )
+                    return 1
+
+                if self.option("async"):
+                    games = self.import_async(files, game, batch_size)
+                else:
+                    games = self.import_files(conn, files, game, batch_size)
+
+                self.refresh_indexes(conn, games)
+        except BalotoRuntimeError as e:
+            self.error_console.line()
+            e.write(self.io)
+            return e.exit_code
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to import draws[/]", e)
+            return 1
+
+        if self.io.is_verbose():
+            elapsed = time.perf_counter() - start
+            self.console.print(f"  [info]-[/] Import finished in [repr.number]{elapsed:.3f}[/]s")
+
+        return 0
+
+    def import_files(
+        self, conn: sqlite3.Connection, files: list[Path], game: GameType, batch_size: int
+    ) -> set[GameType]:
+        from baloto.miloto.database.importer import DrawImporter
+        from baloto.miloto.database.importer import read_draws
+
+        importer = DrawImporter(conn, batch_size=batch_size)
+        games: set[GameType] = set()
+        for file in files:
+            result = importer.import_draws(read_draws(file, game))
+            games.update(result.games)
+            self.console.print(
+                f"  [info]-[/] {file.name}: [repr.number]{result.inserted}[/] draws "
+                f"imported, [repr.number]{result.ignored}[/] already present "
+                f"([repr.number]{result.batches}[/] batches)"
+            )
+        return games
+
+    def import_async(self, files: list[Path], game: GameType, batch_size: int) -> set[GameType]:
+        """
+        Imports every file at once through the asyncio ingestion pipeline, in one transaction.
+        """
+        from baloto.miloto.database.pipeline import IngestionPipeline
+
+        pipeline = IngestionPipeline(self.database.open, batch_size=batch_size)
+        result = pipeline.run([(file, game) for file in files])
+        self.console.print(
+            f"  [info]-[/] {len(files)} files: [repr.number]{result.inserted}[/] draws "
+            f"imported, [repr.number]{result.ignored}[/] already present "
+            f"([repr.number]{result.batches}[/] batches)"
+        )
+        return result.games
+
+    def refresh_indexes(self, conn: sqlite3.Connection, games: set[GameType]) -> None:
+        """
+        Adds the imported draws to the statistics indexes persisted next to the database.
+        """
+        from baloto.miloto.stats.cooccurrence import CooccurrenceIndex
+
+        for game in sorted(games):
+            CooccurrenceIndex.refresh(conn, game, self.cache_file(f"{game}.pairs.npz"))
@@ -4,7 +4,7 @@ import sqlite3
 from typing import ClassVar
 from typing import TYPE_CHECKING
 
-from baloto.commands.database_command import DatabaseCommand
+from baloto.miloto.console.commands.database_command import DatabaseCommand
 
 if TYPE_CHECKING:
     from rich.console import Console
@@ -25,31 +25,21 @@ class DbInitCommand(DatabaseCommand):
         return super().setup()
 
     def handle(self) -> int:
+        from baloto.miloto.database.schema import migrate
+
         try:
-            with sqlite3.connect(self.database_file) as conn:
-                cursor = conn.cursor()
-                for statement in sql_statements:
-                    cursor.execute(statement)
-                conn.commit()
+            with self.database.connection as conn:
+                previous, current = migrate(conn)
 
         except sqlite3.OperationalError as e:
-            print("Failed to create tables:", e)
-
-        return 0
+            self.error_console.print("[error]Failed to create tables:[/]", e)
+            return 1
 
+        if previous == current:
+            self.console.print(f"  [info]-[/] The database schema is up to date (v{current}).")
+        else:
+            self.console.print(
+                f"  [info]-[/] The database schema was migrated from v{previous} to v{current}."
+            )
 
-sql_statements = [
-    """CREATE TABLE IF NOT EXISTS sessions (
-            lottery_id INTEGER PRIMARY KEY, 
-            lottery_date DATE NOT NULL UNIQUE,
-            accumulated INT NOT NULL
-        );""",
-    """CREATE UNIQUE INDEX IF NOT EXISTS l_id ON sessions(lottery_id);""",
-    """CREATE UNIQUE INDEX IF NOT EXISTS l_id_date ON sessions(lottery_id, lottery_date);""",
-]
-
-
-# this.cur.execute("""
-#     INSERT OR IGNORE INTO sessions (lottery_id, lottery_date, accumulated)
-#     VALUES (1, '2025-10-01', 120);
-#     """);
+        return 0
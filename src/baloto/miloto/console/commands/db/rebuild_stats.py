@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.option import Option
+
+
+class DbRebuildStatsCommand(DatabaseCommand):
+    name = "db rebuild-stats"
+
+    description = "Recomputes the statistics snapshot, gap index and draw features from the draws."
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "Only rebuild the statistics of GAME.",
+            flag=False,
+            choices=["miloto", "baloto", "revancha"],
+        ),
+    ]
+
+    def handle(self) -> int:
+        import time
+
+        from baloto.miloto.database.schema import SCHEMA_VERSION
+        from baloto.miloto.database.schema import current_version
+        from baloto.miloto.games import GameType
+        from baloto.miloto.stats.features import FeatureIndex
+        from baloto.miloto.stats.gaps import GapIndex
+        from baloto.miloto.stats.snapshot import StatsSnapshot
+
+        games = [GameType(self.option("game"))] if self.option("game") else list(GameType)
+        start = time.perf_counter()
+        try:
+            with self.database.connection as conn:
+                if current_version(conn) != SCHEMA_VERSION:
+                    self.error_console.print(
+                        "[error]The database schema is outdated, run [command]db init[/] first.[/]"
+                    )
+                    return 1
+
+                conn.execute("BEGIN;")
+                try:
+                    for game in games:
+                        GapIndex(conn, game).rebuild()
+                        FeatureIndex(conn, game).rebuild()
+                        snapshot = StatsSnapshot(conn, game)
+                        snapshot.rebuild()
+                        draws = (snapshot.state() or (0,))[0]
+                        self.console.print(
+                            f"  [info]-[/] Rebuilt [prog]{game}[/] statistics "
+                            f"from [repr.number]{draws}[/] draws."
+                        )
+                    conn.execute("COMMIT;")
+                except BaseException:
+                    conn.execute("ROLLBACK;")
+                    raise
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to rebuild the statistics[/]", e)
+            return 1
+
+        if self.io.is_verbose():
+            self.console.print(
+                f"Rebuilt in {time.perf_counter() - start:.2f}s", style="dim", new_line_start=True
+            )
+        return 0
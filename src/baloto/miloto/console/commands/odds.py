@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.option import Option
+    from baloto.miloto.stats.odds import Odds
+
+
+class OddsCommand(DatabaseCommand):
+    name = "odds"
+
+    description = "Shows the exact odds and expected value of every prize tier."
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "The game to analyze.",
+            flag=False,
+            default="miloto",
+            choices=["miloto", "baloto", "revancha"],
+        ),
+        option("price", "p", "The ticket price, defaults to the reference price.", flag=False),
+        option("jackpot", "j", "The jackpot, defaults to the last accumulated.", flag=False),
+        option("sweep", "s", "The number of jackpot sizes to evaluate.", flag=False, default="10"),
+    ]
+
+    def handle(self) -> int:
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        from baloto.miloto.database.queries import latest_accumulated
+        from baloto.miloto.games import GameType
+        from baloto.miloto.games import get_game
+        from baloto.miloto.stats.odds import Odds
+
+        game = get_game(GameType(self.option("game")))
+        try:
+            price = int(self.option("price")) if self.option("price") else None
+            jackpot = int(self.option("jackpot")) if self.option("jackpot") else None
+            sweep = int(self.option("sweep"))
+        except ValueError:
+            self.error_console.print(
+                "[error]The --price, --jackpot and --sweep options must be integers[/]"
+            )
+            return 1
+
+        if jackpot is None and self.database_file.exists():
+            try:
+                with self.database.reader as conn:
+                    jackpot = latest_accumulated(conn, game.type)
+            except sqlite3.Error as e:
+                self.error_console.print("[error]Failed to read the accumulated jackpot[/]", e)
+                return 1
+
+        odds = Odds(game, price=price)
+
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("Aciertos", style="prog", justify="right")
+        table.add_column("1 en", style="repr.number", justify="right")
+        table.add_column("Probabilidad", justify="right")
+        table.add_column("Premio", style="green", justify="right")
+        for tier in odds.tiers:
+            prize = "Acumulado" if tier.tier.is_jackpot else f"${tier.tier.prize:,}"
+            table.add_row(
+                tier.tier.label,
+                f"{float(tier.one_in):,.1f}",
+                f"{tier.probability.numerator}/{tier.probability.denominator}",
+                prize,
+            )
+
+        self.console.line()
+        self.console.print(f"PROBABILIDADES [prog]{game.type.upper()}[/]", style="bold")
+        self.console.print(Padding(table, (0, 0, 0, 2)))
+        self.console.print(
+            f"  Ganar algún premio: 1 en {float(1 / odds.win_probability):,.2f}", style="dim"
+        )
+
+        self.console.line()
+        self.console.print(f"  Precio del tiquete: [repr.number]${odds.price:,}[/]")
+        if jackpot is not None:
+            value = odds.expected_value(jackpot)
+            style = "green" if value > 0 else "red"
+            self.console.print(
+                f"  Valor esperado con acumulado ${jackpot:,}: [{style}]${float(value):,.2f}[/]"
+            )
+        else:
+            self.console.print(
+                f"  [warning]There are no {game.type} draws, use --jackpot to evaluate one.[/]"
+            )
+        self.console.print(
+            f"  Valor esperado positivo desde: [bold]${float(odds.break_even()):,.0f}[/]"
+        )
+
+        if sweep > 0:
+            self._print_sweep(odds, sweep)
+        return 0
+
+    def _print_sweep(self, odds: Odds, steps: int) -> None:
+        import numpy as np
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        jackpots = np.linspace(0, 2 * float(odds.break_even()), steps + 1)[1:]
+        values = odds.expected_values(jackpots)
+
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("Acumulado", style="repr.number", justify="right")
+        table.add_column("Valor esperado", justify="right")
+        for jackpot, value in zip(jackpots, values):
+            style = "green" if value > 0 else "red"
+            table.add_row(f"${jackpot:,.0f}", f"[{style}]${value:,.2f}[/]")
+
+        self.console.print("VALOR ESPERADO POR ACUMULADO", style="bold", new_line_start=True)
+        self.console.print(Padding(table, (0, 0, 0, 2)))
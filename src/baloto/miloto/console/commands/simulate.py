@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.option import Option
+    from baloto.miloto.games import Game
+    from baloto.miloto.stats.simulation import SimulationResult
+
+
+class SimulateCommand(DatabaseCommand):
+    name = "simulate"
+
+    description = "Plays ticket strategies against simulated draws."
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "The game to simulate.",
+            flag=False,
+            default="miloto",
+            choices=["miloto", "baloto", "revancha"],
+        ),
+        option(
+            "strategy",
+            "s",
+            "The strategies to play (hot, cold, random or pairs).",
+            flag=False,
+            multiple=True,
+            default=["hot", "cold", "random", "pairs"],
+        ),
+        option("draws", "d", "The number of draws to simulate.", flag=False, default="1000000"),
+        option("seed", None, "The seed of the random generator.", flag=False),
+        option("workers", "w", "The number of worker processes.", flag=False),
+    ]
+
+    def handle(self) -> int:
+        import time
+
+        from baloto.miloto.games import GameType
+        from baloto.miloto.games import get_game
+        from baloto.miloto.stats.simulation import Simulator
+        from baloto.miloto.stats.simulation import Strategy
+
+        game = get_game(GameType(self.option("game")))
+        try:
+            strategies = [Strategy(name) for name in dict.fromkeys(self.option("strategy"))]
+        except ValueError as e:
+            self.error_console.print(f"[error]{e}[/]")
+            return 1
+
+        try:
+            draws = int(self.option("draws"))
+            seed = int(self.option("seed")) if self.option("seed") else None
+            workers = int(self.option("workers")) if self.option("workers") is not None else None
+        except ValueError:
+            self.error_console.print(
+                "[error]The --draws, --seed and --workers options must be integers[/]"
+            )
+            return 1
+        if draws < 1:
+            self.error_console.print("[error]The --draws option must be positive[/]")
+            return 1
+        if workers is not None and workers < 1:
+            self.error_console.print("[error]The --workers option must be positive[/]")
+            return 1
+
+        try:
+            with self.database.reader as conn:
+                matrix = self.draw_matrix(conn, game.type)
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to read the draws[/]", e)
+            return 1
+
+        if not len(matrix):
+            self.console.print(
+                f"[warning]There are no {game.type} draws, the hot, cold and pairs "
+                "strategies will play fixed balls unrelated to the history.[/]"
+            )
+
+        simulator = Simulator(game, seed=seed, workers=workers)
+        start = time.perf_counter()
+        results = simulator.run(strategies, matrix, draws)
+        elapsed = time.perf_counter() - start
+
+        self.console.line()
+        self.console.print(
+            f"SIMULACIÓN [prog]{game.type.upper()}[/] ({draws:,} sorteos)", style="bold"
+        )
+        for result in results:
+            self._print_result(game, result)
+
+        if self.io.is_verbose():
+            self.console.print(
+                f"Simulated {draws:,} draws with {simulator.workers} workers in {elapsed:.2f}s",
+                style="dim",
+                new_line_start=True,
+            )
+        return 0
+
+    def _print_result(self, game: Game, result: SimulationResult) -> None:
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("Aciertos", style="prog", justify="right")
+        table.add_column("Veces", style="repr.number", justify="right")
+        table.add_column("%", justify="right")
+        if game.has_superbalota:
+            table.add_column("Con superbalota", style="repr.number", justify="right")
+
+        for hits in range(len(result.counts) - 1, -1, -1):
+            count = result.hits(hits)
+            row = [str(hits), f"{count:,}", f"{100 * count / result.draws:.4f}"]
+            if game.has_superbalota:
+                row.append(f"{result.hits(hits, superbalota=True):,}")
+            table.add_row(*row)
+
+        ticket = " ".join(f"{ball:02d}" for ball in result.ticket) or "aleatoria"
+        self.console.print(
+            f"[bold]{result.strategy.upper()}[/] [dim]{ticket}[/]", new_line_start=True
+        )
+        self.console.print(Padding(table, (0, 0, 0, 2)))
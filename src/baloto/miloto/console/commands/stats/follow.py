@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import argument
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from baloto.cleo.io.inputs.argument import Argument
+    from baloto.cleo.io.inputs.option import Option
+    from baloto.miloto.games import Game
+
+
+class StatsFollowCommand(DatabaseCommand):
+    name = "stats follow"
+
+    description = "Shows which balls follow a ball in the next draws."
+
+    arguments: ClassVar[list[Argument]] = [
+        argument("ball", "The ball that was drawn."),
+        argument("target", "Only show how often TARGET follows BALL.", optional=True),
+    ]
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "The game to analyze.",
+            flag=False,
+            default="miloto",
+            choices=["miloto", "baloto", "revancha"],
+        ),
+        option("lag", "k", "Look within the next LAG draws.", flag=False, default="1"),
+        option("exact", "e", "Only look exactly LAG draws later."),
+        option(
+            "limit", "l", "Show the LIMIT balls that follow the most.", flag=False, default="10"
+        ),
+    ]
+
+    def handle(self) -> int:
+        from baloto.miloto.games import GameType
+        from baloto.miloto.games import get_game
+        from baloto.miloto.stats.follow import MAX_LAG
+        from baloto.miloto.stats.follow import FollowCache
+
+        game = get_game(GameType(self.option("game")))
+        try:
+            ball = int(self.argument("ball"))
+            target = int(self.argument("target")) if self.argument("target") else None
+            lag = int(self.option("lag"))
+            limit = int(self.option("limit"))
+        except ValueError:
+            self.error_console.print("[error]The balls, --lag and --limit must be integers[/]")
+            return 1
+
+        for value in (ball, target):
+            if value is not None and not 1 <= value <= game.max_ball:
+                self.error_console.print(
+                    f"[error]{game.type} balls are between 1 and {game.max_ball}, got {value}[/]"
+                )
+                return 1
+        if not 1 <= lag <= MAX_LAG:
+            self.error_console.print(f"[error]The --lag option must be between 1 and {MAX_LAG}[/]")
+            return 1
+
+        try:
+            with self.database.reader as conn:
+                matrix = self.draw_matrix(conn, game.type)
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to read the draws[/]", e)
+            return 1
+
+        if len(matrix) <= lag:
+            self.console.print(
+                f"[warning]There are not enough {game.type} draws, run [command]db import[/] "
+                "first.[/]"
+            )
+            return 0
+
+        tensor = FollowCache(self.cache_file(f"{game.type}.follow.npz")).load(matrix)
+        exact = bool(self.option("exact"))
+        probabilities = tensor.probabilities(ball, lag, exact)
+        rates = tensor.base_rates(lag, exact)
+        seen = int(tensor.sources[lag - 1, ball - 1])
+        when = f"exactamente {lag} sorteos después" if exact else f"en los siguientes {lag} sorteos"
+
+        self.console.line()
+        self.console.print(
+            f"BALOTA [prog]{ball}[/] {when.upper()} [prog]{game.type.upper()}[/]", style="bold"
+        )
+        self.console.print(f"  Apariciones con {lag} sorteos después: [repr.number]{seen}[/]")
+        if not seen:
+            return 0
+
+        balls = [target] if target is not None else self._ranking(probabilities, rates, game)
+        self._print_table(balls[:limit], probabilities, rates)
+        return 0
+
+    @staticmethod
+    def _ranking(
+        probabilities: NDArray[np.float64], rates: NDArray[np.float64], game: Game
+    ) -> list[int]:
+        import numpy as np
+
+        lift = np.divide(probabilities, rates, out=np.zeros_like(probabilities), where=rates > 0)[
+            : game.max_ball
+        ]
+        return [int(index) + 1 for index in np.argsort(-lift, kind="stable")]
+
+    def _print_table(
+        self, balls: list[int], probabilities: NDArray[np.float64], rates: NDArray[np.float64]
+    ) -> None:
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("Sigue", style="prog", justify="right")
+        table.add_column("P(sigue | balota)", style="repr.number", justify="right")
+        table.add_column("P(sigue)", justify="right")
+        table.add_column("Razón", style="bold", justify="right")
+        for ball in balls:
+            probability, rate = probabilities[ball - 1], rates[ball - 1]
+            lift = f"{probability / rate:.2f}" if rate else ""
+            table.add_row(str(ball), f"{probability:.2%}", f"{rate:.2%}", lift)
+
+        self.console.print(Padding(table, (1, 0, 0, 2)))
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.option import Option
+    from baloto.miloto.stats.matrix import DrawMatrix
+
+
+class StatsFrequencyCommand(DatabaseCommand):
+    name = "stats frequency"
+
+    description = "Shows how many times every ball was drawn."
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "The game to analyze.",
+            flag=False,
+            default="miloto",
+            choices=["miloto", "baloto", "revancha"],
+        ),
+        option(
+            "window",
+            "w",
+            "Also count the balls drawn in the last WINDOW draws.",
+            flag=False,
+            default="20",
+            choices=["10", "20", "50", "100"],
+        ),
+        option("positions", "p", "Show the most drawn ball for every position."),
+        option("since", None, "Only count draws from this date (YYYY-MM-DD).", flag=False),
+        option("until", None, "Only count draws up to this date (YYYY-MM-DD).", flag=False),
+    ]
+
+    def handle(self) -> int:
+        from datetime import date
+
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        from baloto.miloto.database.queries import ball_frequencies
+        from baloto.miloto.games import BALLS_PER_DRAW
+        from baloto.miloto.games import get_game
+        from baloto.miloto.stats.snapshot import StatsSnapshot
+
+        game = get_game(self.option("game"))
+        window = int(self.option("window"))
+        try:
+            since = date.fromisoformat(self.option("since")) if self.option("since") else None
+            until = date.fromisoformat(self.option("until")) if self.option("until") else None
+        except ValueError as e:
+            self.error_console.print(f"[error]Invalid option: {e}[/]")
+            return 1
+
+        ranged = since is not None or until is not None
+        if ranged and self.option("positions"):
+            self.error_console.print(
+                "[error]The --positions option counts the whole history, "
+                "it does not take --since or --until[/]"
+            )
+            return 1
+
+        matrix = None
+        recent: dict[int, int] = {}
+        try:
+            with self.database.reader as conn:
+                if ranged:
+                    # The snapshot only keeps whole history counts, a range is counted from
+                    # the draw_numbers covering index
+                    counts = ball_frequencies(conn, game.type, since, until)
+                    total = sum(counts.values()) // BALLS_PER_DRAW
+                else:
+                    snapshot = StatsSnapshot(conn, game.type)
+                    total = (snapshot.state() or (0,))[0]
+                    counts = {ball: count for ball, (count, _) in snapshot.ball_counts().items()}
+                    recent = snapshot.rolling_counts(window)
+                if self.option("positions") and total:
+                    matrix = self.draw_matrix(conn, game.type)
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to read the ball frequencies[/]", e)
+            return 1
+
+        if ranged and not total:
+            self.console.print(f"[warning]There are no {game.type} draws in that date range.[/]")
+            return 0
+
+        if not total:
+            self.console.print(
+                f"[warning]There are no {game.type} statistics, run [command]db import[/] or "
+                "[command]db rebuild-stats[/] first.[/]"
+            )
+            return 0
+
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("Balota", style="prog", justify="right")
+        table.add_column("Veces", style="repr.number", justify="right")
+        table.add_column("%", justify="right")
+        if not ranged:
+            table.add_column(f"Últimos {min(window, total)}", style="repr.number", justify="right")
+
+        balls = range(1, game.max_ball + 1)
+        for ball in sorted(balls, key=lambda b: (counts.get(b, 0), -b), reverse=True):
+            count = counts.get(ball, 0)
+            row = [str(ball), str(count), f"{100 * count / total:.2f}"]
+            if not ranged:
+                row.append(str(recent.get(ball, 0)))
+            table.add_row(*row)
+
+        self.console.line()
+        self.console.print(
+            f"FRECUENCIAS [prog]{game.type.upper()}[/] ([repr.number]{total}[/] sorteos)",
+            style="bold",
+        )
+        self.console.print(Padding(table, (0, 0, 0, 2)))
+
+        if matrix is not None:
+            self._print_positions(matrix, game.max_ball)
+
+        return 0
+
+    def _print_positions(self, matrix: DrawMatrix, max_ball: int) -> None:
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        from baloto.miloto.stats.frequency import position_distribution
+
+        distribution = position_distribution(matrix)[:, :max_ball]
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("Posición", style="bold", justify="right")
+        table.add_column("Balota", style="prog", justify="right")
+        table.add_column("Veces", style="repr.number", justify="right")
+
+        for position, counts in enumerate(distribution, start=1):
+            ball = int(counts.argmax())
+            table.add_row(str(position), str(ball + 1), str(counts[ball]))
+
+        self.console.print("POR POSICIÓN:", style="bold", new_line_start=True)
+        self.console.print(Padding(table, (0, 0, 0, 2)))
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.option import Option
+
+
+class StatsGapsCommand(DatabaseCommand):
+    name = "stats gaps"
+
+    description = "Shows how many draws every ball has been missing."
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "The game to analyze.",
+            flag=False,
+            default="miloto",
+            choices=["miloto", "baloto", "revancha"],
+        ),
+        option("ball", "b", "Show the gap distribution of BALL.", flag=False),
+    ]
+
+    def handle(self) -> int:
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        from baloto.miloto.games import GameType
+        from baloto.miloto.stats.gaps import GapIndex
+
+        game = GameType(self.option("game"))
+        try:
+            ball = int(self.option("ball")) if self.option("ball") else None
+        except ValueError:
+            self.error_console.print("[error]The --ball option must be an integer[/]")
+            return 1
+
+        try:
+            with self.database.reader as conn:
+                index = GapIndex(conn, game)
+                report = index.report() if index.state() is not None else []
+                distribution = index.distribution(ball) if ball is not None else {}
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to read the gap index[/]", e)
+            return 1
+
+        if not report:
+            self.console.print(
+                f"[warning]There are no {game} statistics, run [command]db import[/] or "
+                "[command]db rebuild-stats[/] first.[/]"
+            )
+            return 0
+
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("Balota", style="prog", justify="right")
+        table.add_column("Veces", style="repr.number", justify="right")
+        table.add_column("Ausente", style="bold", justify="right")
+        table.add_column("Media", justify="right")
+        table.add_column("Máxima", justify="right")
+        table.add_column("Última vez", style="green")
+
+        for gaps in sorted(report, key=lambda g: g.current, reverse=True):
+            current = str(gaps.current)
+            if gaps.current > gaps.maximum:
+                current = f"[warning]{current}[/]"
+            table.add_row(
+                str(gaps.ball),
+                str(gaps.hits),
+                current,
+                f"{gaps.mean:.2f}",
+                str(gaps.maximum),
+                gaps.last_date or "",
+            )
+
+        self.console.line()
+        self.console.print(f"AUSENCIAS [prog]{game.upper()}[/]", style="bold")
+        self.console.print(Padding(table, (0, 0, 0, 2)))
+
+        if ball is not None:
+            self._print_distribution(ball, distribution)
+
+        return 0
+
+    def _print_distribution(self, ball: int, distribution: dict[int, int]) -> None:
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("Ausencia", style="bold", justify="right")
+        table.add_column("Veces", style="repr.number", justify="right")
+        for gap, count in distribution.items():
+            table.add_row(str(gap), str(count))
+
+        self.console.print(f"DISTRIBUCIÓN BALOTA {ball}:", style="bold", new_line_start=True)
+        self.console.print(Padding(table, (0, 0, 0, 2)))
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.option import Option
+    from baloto.miloto.stats.jackpot import JackpotSeries
+
+
+class StatsJackpotCommand(DatabaseCommand):
+    name = "stats jackpot"
+
+    description = "Shows how the accumulated jackpot grows and rolls over."
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "The game to analyze.",
+            flag=False,
+            default="miloto",
+            choices=["miloto", "baloto", "revancha"],
+        ),
+        option(
+            "window",
+            "w",
+            "The rolling windows, in draws.",
+            flag=False,
+            multiple=True,
+            default=["10", "50", "100"],
+        ),
+    ]
+
+    def handle(self) -> int:
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        from baloto.miloto.games import GameType
+        from baloto.miloto.stats.jackpot import JackpotSeries
+
+        game = GameType(self.option("game"))
+        try:
+            windows = sorted({int(window) for window in self.option("window")})
+        except ValueError:
+            self.error_console.print("[error]The --window option must be an integer[/]")
+            return 1
+        if any(window < 1 for window in windows):
+            self.error_console.print("[error]The --window option must be positive[/]")
+            return 1
+
+        try:
+            with self.database.reader as conn:
+                series = JackpotSeries.load(conn, game)
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to read the jackpots[/]", e)
+            return 1
+
+        if len(series) < 2:
+            self.console.print(
+                f"[warning]There are not enough {game} draws, run [command]db import[/] first.[/]"
+            )
+            return 0
+
+        streaks = series.streaks()
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("Métrica", style="bold", width=30)
+        table.add_column("Valor", style="repr.number", justify="right", width=20)
+        table.add_row("Sorteos", f"{len(series):,}")
+        table.add_row("Acumulado actual", f"${series.accumulated[-1]:,}")
+        table.add_row("Acumulado máximo", f"${series.accumulated.max():,}")
+        table.add_row("Crecimiento medio", f"${series.mean_growth():,.0f}")
+        table.add_row("Crecimiento mediano", f"{100 * series.median_growth_rate():.2f}%")
+        table.add_row("Acumulados ganados", f"{int((series.changes < 0).sum()):,}")
+        table.add_row("Racha actual", str(series.current_streak()))
+        table.add_row("Racha máxima", str(int(streaks.max(initial=0))))
+        table.add_row("Racha media", f"{float(streaks.mean()) if streaks.size else 0:.1f}")
+
+        self.console.line()
+        self.console.print(f"ACUMULADO [prog]{game.upper()}[/]", style="bold")
+        self.console.print(Padding(table, (0, 0, 0, 2)))
+        self._print_windows(series, windows)
+        return 0
+
+    def _print_windows(self, series: JackpotSeries, windows: list[int]) -> None:
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("Ventana", style="prog", justify="right", width=10)
+        table.add_column("Media actual", style="repr.number", justify="right", width=20)
+        table.add_column("Máximo actual", style="repr.number", justify="right", width=20)
+        table.add_column("Media histórica máx.", justify="right", width=20)
+        for window in windows:
+            if window > len(series):
+                table.add_row(str(window), "-", "-", "-")
+                continue
+            means = series.rolling_mean(window)
+            table.add_row(
+                str(window),
+                f"${means[-1]:,.0f}",
+                f"${series.rolling_max(window)[-1]:,}",
+                f"${means.max():,.0f}",
+            )
+
+        self.console.print("VENTANAS MÓVILES:", style="bold", new_line_start=True)
+        self.console.print(Padding(table, (0, 0, 0, 2)))
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.option import Option
+
+
+class StatsNeverDrawnCommand(DatabaseCommand):
+    name = "stats never-drawn"
+
+    description = "Lists the combinations that were never drawn."
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "The games whose draws count as drawn.",
+            flag=False,
+            multiple=True,
+            default=["miloto"],
+        ),
+        option("since", None, "Only count draws from this date (YYYY-MM-DD).", flag=False),
+        option("until", None, "Only count draws up to this date (YYYY-MM-DD).", flag=False),
+        option("include", "i", "Only list combinations with this ball.", flag=False, multiple=True),
+        option("odd", "o", "Only list combinations with ODD odd balls.", flag=False),
+        option("high", None, "Only list combinations with HIGH balls above half.", flag=False),
+        option("min-sum", None, "Only list combinations adding up to at least this.", flag=False),
+        option("max-sum", None, "Only list combinations adding up to at most this.", flag=False),
+        option("limit", "l", "The number of combinations to list.", flag=False, default="20"),
+    ]
+
+    def handle(self) -> int:
+        import time
+        from datetime import date
+
+        from baloto.miloto.games import GameType
+        from baloto.miloto.games import get_game
+        from baloto.miloto.stats.features import PatternFilter
+        from baloto.miloto.stats.occupancy import Occupancy
+        from baloto.miloto.stats.occupancy import OccupancyCache
+        from baloto.miloto.stats.occupancy import never_drawn
+
+        try:
+            games = [get_game(game) for game in self.option("game")]
+            since = date.fromisoformat(self.option("since")) if self.option("since") else None
+            until = date.fromisoformat(self.option("until")) if self.option("until") else None
+            include = [int(ball) for ball in self.option("include")]
+            pattern = PatternFilter(
+                odd=int(self.option("odd")) if self.option("odd") else None,
+                high=int(self.option("high")) if self.option("high") else None,
+                min_total=int(self.option("min-sum")) if self.option("min-sum") else None,
+                max_total=int(self.option("max-sum")) if self.option("max-sum") else None,
+            )
+            limit = int(self.option("limit"))
+        except ValueError as e:
+            self.error_console.print(f"[error]Invalid option: {e}[/]")
+            return 1
+
+        if limit < 0:
+            self.error_console.print("[error]The --limit option must not be negative[/]")
+            return 1
+
+        # The combinations of the widest game, milotos are a prefix of the rank space
+        max_ball = max(game.max_ball for game in games)
+        if not all(1 <= ball <= max_ball for ball in include):
+            self.error_console.print(f"[error]The included balls are between 1 and {max_ball}[/]")
+            return 1
+
+        start = time.perf_counter()
+        occupancy = Occupancy()
+        try:
+            with self.database.reader as conn:
+                for game in games:
+                    if since is None and until is None:
+                        cache = OccupancyCache(self.cache_file(f"{game.type}.occupancy.npz"))
+                        occupancy |= cache.load(conn, game.type)
+                    else:
+                        occupancy |= Occupancy.query(conn, game.type, since, until)
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to read the draws[/]", e)
+            return 1
+
+        listed: list[list[int]] = []
+        matched = 0
+        for balls in never_drawn(occupancy, max_ball, pattern, include):
+            if len(listed) < limit:
+                listed.extend(balls[: limit - len(listed)].tolist())
+            matched += len(balls)
+        elapsed = time.perf_counter() - start
+
+        names = ", ".join(str(game.type) for game in games)
+        self.console.line()
+        self.console.print(f"COMBINACIONES NUNCA SORTEADAS [prog]{names.upper()}[/]", style="bold")
+        self.console.print(
+            f"  Sorteadas: [repr.number]{len(occupancy):,}[/], sin sortear con el filtro: "
+            f"[repr.number]{matched:,}[/]"
+        )
+        for combination in listed:
+            self.console.print(
+                "  " + " ".join(f"{ball:02d}" for ball in combination), style="prog"
+            )
+
+        if self.io.is_verbose():
+            self.console.print(f"Searched in {elapsed:.2f}s", style="dim", new_line_start=True)
+        return 0
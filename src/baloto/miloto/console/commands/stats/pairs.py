@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.option import Option
+
+
+class StatsPairsCommand(DatabaseCommand):
+    name = "stats pairs"
+
+    description = "Shows the pairs and triples of balls most often drawn together."
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "The game to analyze.",
+            flag=False,
+            default="miloto",
+            choices=["miloto", "baloto", "revancha"],
+        ),
+        option("top", "t", "How many pairs and triples to show.", flag=False, default="10"),
+    ]
+
+    def handle(self) -> int:
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        from baloto.miloto.games import GameType
+        from baloto.miloto.stats.cooccurrence import CooccurrenceIndex
+        from baloto.miloto.stats.snapshot import StatsSnapshot
+
+        game = GameType(self.option("game"))
+        try:
+            top = int(self.option("top"))
+        except ValueError:
+            self.error_console.print("[error]The --top option must be an integer[/]")
+            return 1
+
+        try:
+            with self.database.reader as conn:
+                snapshot = StatsSnapshot(conn, game)
+                state = snapshot.state()
+                top_pairs = snapshot.top_pairs(top)
+                # Triples are not part of the snapshot, they come from the on-disk index
+                index = CooccurrenceIndex.refresh(conn, game, self.cache_file(f"{game}.pairs.npz"))
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to read the draws[/]", e)
+            return 1
+
+        if state is None:
+            self.console.print(
+                f"[warning]There are no {game} statistics, run [command]db import[/] or "
+                "[command]db rebuild-stats[/] first.[/]"
+            )
+            return 0
+
+        self.console.line()
+        self.console.print(
+            f"PAREJAS Y TERNAS [prog]{game.upper()}[/] ([repr.number]{index.draws}[/] sorteos)",
+            style="bold",
+        )
+
+        pairs = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        pairs.add_column("Pareja", style="prog")
+        pairs.add_column("Veces", style="repr.number", justify="right")
+        for a, b, hits in top_pairs:
+            pairs.add_row(f"{a:>2} - {b:>2}", str(hits))
+
+        triples = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        triples.add_column("Terna", style="prog")
+        triples.add_column("Veces", style="repr.number", justify="right")
+        for a, b, c, hits in index.top_triples(top):
+            triples.add_row(f"{a:>2} - {b:>2} - {c:>2}", str(hits))
+
+        grid = Table.grid(padding=(0, 6))
+        grid.add_row(pairs, triples)
+        self.console.print(Padding(grid, (0, 0, 0, 2)))
+
+        return 0
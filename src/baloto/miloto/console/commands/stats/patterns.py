@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.option import Option
+    from baloto.miloto.games import GameType
+    from baloto.miloto.stats.features import PatternFilter
+
+# The draw sums are shown in bins of this width
+SUM_BIN_WIDTH = 20
+
+
+class StatsPatternsCommand(DatabaseCommand):
+    name = "stats patterns"
+
+    description = "Shows how the draws split by odd/even, high/low, sum and consecutive balls."
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "The game to analyze.",
+            flag=False,
+            default="miloto",
+            choices=["miloto", "baloto", "revancha"],
+        ),
+        option("odd", "o", "Only count the draws with ODD odd balls.", flag=False),
+        option("high", None, "Only count the draws with HIGH balls above half.", flag=False),
+        option("consecutive", "c", "Only count the draws with this many runs.", flag=False),
+        option("decades", "d", "Only count the draws with this decade split.", flag=False),
+        option("min-sum", None, "Only count the draws adding up to at least this.", flag=False),
+        option("max-sum", None, "Only count the draws adding up to at most this.", flag=False),
+    ]
+
+    def handle(self) -> int:
+        from baloto.miloto.games import GameType
+        from baloto.miloto.stats.features import PatternFilter
+
+        game = GameType(self.option("game"))
+        try:
+            pattern = PatternFilter(
+                odd=self._int_option("odd"),
+                high=self._int_option("high"),
+                consecutive=self._int_option("consecutive"),
+                decades=self.option("decades") or None,
+                min_total=self._int_option("min-sum"),
+                max_total=self._int_option("max-sum"),
+            )
+        except ValueError as e:
+            self.error_console.print(f"[error]{e}[/]")
+            return 1
+
+        try:
+            with self.database.reader as conn:
+                histograms, matched, total = self._query(conn, game, pattern)
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to read the draw features[/]", e)
+            return 1
+
+        if not total:
+            self.console.print(
+                f"[warning]There are no {game} statistics, run [command]db import[/] or "
+                "[command]db rebuild-stats[/] first.[/]"
+            )
+            return 0
+
+        self.console.line()
+        self.console.print(f"PATRONES [prog]{game.upper()}[/]", style="bold")
+        for title, histogram in histograms.items():
+            self._print_histogram(title, histogram, matched)
+
+        if pattern != PatternFilter():
+            self.console.print(
+                f"Sorteos que cumplen el filtro: [repr.number]{matched}[/] de "
+                f"[repr.number]{total}[/] ({matched / total:.2%})",
+                new_line_start=True,
+            )
+        return 0
+
+    def _int_option(self, name: str) -> int | None:
+        value = self.option(name)
+        if not value:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError(f"The --{name} option must be an integer") from None
+
+    @staticmethod
+    def _query(
+        conn: sqlite3.Connection, game: GameType, pattern: PatternFilter
+    ) -> tuple[dict[str, dict[int | str, int]], int, int]:
+        from baloto.miloto.stats.features import FeatureIndex
+        from baloto.miloto.stats.features import PatternFilter
+
+        index = FeatureIndex(conn, game)
+        histograms: dict[str, dict[int | str, int]] = {
+            "Impares": index.histogram("odd", pattern),
+            "Altas": index.histogram("high", pattern),
+            "Consecutivas": index.histogram("consecutive", pattern),
+            "Suma": {
+                f"{low}-{int(low) + SUM_BIN_WIDTH - 1}": count
+                for low, count in index.histogram("total", pattern, SUM_BIN_WIDTH).items()
+            },
+        }
+        return histograms, index.count(pattern), index.count(PatternFilter())
+
+    def _print_histogram(self, title: str, histogram: dict[int | str, int], draws: int) -> None:
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column(title, style="bold", justify="right")
+        table.add_column("Sorteos", style="repr.number", justify="right")
+        table.add_column("%", justify="right")
+        for value, count in histogram.items():
+            table.add_row(str(value), str(count), f"{count / draws:.2%}" if draws else "")
+
+        self.console.print(Padding(table, (1, 0, 0, 2)))
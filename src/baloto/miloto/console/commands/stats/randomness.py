@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.option import Option
+
+# Fewer draws make the chi-square approximations meaningless
+MIN_DRAWS = 30
+
+
+class StatsRandomnessCommand(DatabaseCommand):
+    name = "stats randomness"
+
+    description = "Tests whether the draws deviate from a uniform random process."
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "The game to analyze.",
+            flag=False,
+            default="miloto",
+            choices=["miloto", "baloto", "revancha"],
+        ),
+        option("alpha", "a", "The significance level of the tests.", flag=False, default="0.01"),
+        option("refresh", "r", "Run the tests again even if the draws did not change."),
+    ]
+
+    def handle(self) -> int:
+        import time
+
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        from baloto.miloto.database.cache import fingerprint
+        from baloto.miloto.games import GameType
+        from baloto.miloto.games import get_game
+        from baloto.miloto.stats.randomness import RandomnessCache
+        from baloto.miloto.stats.randomness import run_battery
+
+        game = get_game(GameType(self.option("game")))
+        try:
+            alpha = float(self.option("alpha"))
+        except ValueError:
+            self.error_console.print("[error]The --alpha option must be a number[/]")
+            return 1
+
+        cache = RandomnessCache(self.cache_file(f"{game.type}.randomness.json"))
+        start = time.perf_counter()
+        try:
+            with self.database.reader as conn:
+                key = fingerprint(conn, game.type)
+                results = None if self.option("refresh") else cache.get(key)
+                cached = results is not None
+                if results is None and key[0] >= MIN_DRAWS:
+                    results = run_battery(self.draw_matrix(conn, game.type), game.max_ball)
+                    cache.put(key, results)
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to read the draws[/]", e)
+            return 1
+
+        if results is None:
+            self.console.print(
+                f"[warning]The tests need at least {MIN_DRAWS} {game.type} draws, "
+                "run [command]db import[/] first.[/]"
+            )
+            return 0
+
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("Prueba", style="bold")
+        table.add_column("Estadístico", style="repr.number", justify="right")
+        table.add_column("GL", justify="right")
+        table.add_column("Valor p", justify="right")
+        table.add_column("Resultado")
+        table.add_column("Detalle", style="dim")
+        for result in results:
+            verdict = "[green]aleatorio[/]" if result.passed(alpha) else "[red]desviación[/]"
+            table.add_row(
+                result.name,
+                f"{result.statistic:.4f}",
+                "" if result.dof is None else str(result.dof),
+                f"{result.p_value:.4f}",
+                verdict,
+                result.detail,
+            )
+
+        self.console.line()
+        self.console.print(
+            f"PRUEBAS DE ALEATORIEDAD [prog]{game.type.upper()}[/] "
+            f"([repr.number]{key[0]}[/] sorteos, α = {alpha})",
+            style="bold",
+        )
+        self.console.print(Padding(table, (0, 0, 0, 2)))
+
+        if self.io.is_verbose():
+            source = "cache" if cached else "tests"
+            self.console.print(
+                f"Results from {source} in {time.perf_counter() - start:.3f}s", style="dim"
+            )
+        return 0
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import argument
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.argument import Argument
+    from baloto.cleo.io.inputs.option import Option
+
+
+class TicketsAddCommand(DatabaseCommand):
+    name = "tickets add"
+
+    description = "Stores a ticket to check against the draws."
+
+    arguments: ClassVar[list[Argument]] = [
+        argument("balls", "The balls of the ticket.", multiple=True)
+    ]
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "The game of the ticket.",
+            flag=False,
+            default="miloto",
+            choices=["miloto", "baloto", "revancha"],
+        ),
+        option("superbalota", "s", "The superbalota of the ticket.", flag=False),
+        option("label", "l", "A label to identify the ticket.", flag=False),
+    ]
+
+    def handle(self) -> int:
+        from baloto.miloto.database.schema import SCHEMA_VERSION
+        from baloto.miloto.database.schema import current_version
+        from baloto.miloto.database.tickets import add_tickets
+        from baloto.miloto.database.tickets import drawn_on
+        from baloto.miloto.games import GameType
+
+        game = GameType(self.option("game"))
+        try:
+            balls = tuple(sorted(int(ball) for ball in self.argument("balls")))
+            superbalota = int(self.option("superbalota")) if self.option("superbalota") else None
+        except ValueError:
+            self.error_console.print("[error]The balls and superbalota must be integers[/]")
+            return 1
+
+        try:
+            with self.database.connection as conn:
+                if current_version(conn) != SCHEMA_VERSION:
+                    self.error_console.print(
+                        "[error]The database schema is outdated, run [command]db init[/] first.[/]"
+                    )
+                    return 1
+                add_tickets(conn, game, [(balls, superbalota)], label=self.option("label"))
+                draws = drawn_on(conn, game, balls)
+        except ValueError as e:
+            self.error_console.print(f"[error]{e}[/]")
+            return 1
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to store the ticket[/]", e)
+            return 1
+
+        ticket = " ".join(f"{ball:02d}" for ball in balls)
+        if superbalota is not None:
+            ticket += f" + {superbalota:02d}"
+        self.console.print(f"Stored {game} ticket [repr.number]{ticket}[/]")
+        for lottery_id, lottery_date in draws:
+            self.console.print(
+                f"  [warning]These balls were drawn on {lottery_date} (draw {lottery_id})[/]"
+            )
+        return 0
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+
+if TYPE_CHECKING:
+    from baloto.cleo.io.inputs.option import Option
+    from baloto.miloto.database.tickets import MaskTable
+    from baloto.miloto.stats.scoring import TicketScores
+
+
+class TicketsCheckCommand(DatabaseCommand):
+    name = "tickets check"
+
+    description = "Scores the stored tickets against the draws."
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "The game of the tickets.",
+            flag=False,
+            default="miloto",
+            choices=["miloto", "baloto", "revancha"],
+        ),
+        option("since", None, "Only check draws from this date (YYYY-MM-DD).", flag=False),
+        option("until", None, "Only check draws up to this date (YYYY-MM-DD).", flag=False),
+        option("min-hits", "m", "The hits to list a winning ticket.", flag=False, default="3"),
+        option("limit", "l", "The number of winning tickets to list.", flag=False, default="20"),
+    ]
+
+    def handle(self) -> int:
+        import time
+        from datetime import date
+
+        from baloto.miloto.database.tickets import load_draws
+        from baloto.miloto.database.tickets import load_tickets
+        from baloto.miloto.games import BALLS_PER_DRAW
+        from baloto.miloto.games import GameType
+        from baloto.miloto.stats.scoring import score_tickets
+
+        game = GameType(self.option("game"))
+        try:
+            since = date.fromisoformat(self.option("since")) if self.option("since") else None
+            until = date.fromisoformat(self.option("until")) if self.option("until") else None
+            min_hits = int(self.option("min-hits"))
+            limit = int(self.option("limit"))
+        except ValueError as e:
+            self.error_console.print(f"[error]Invalid option: {e}[/]")
+            return 1
+        if not 1 <= min_hits <= BALLS_PER_DRAW:
+            self.error_console.print(
+                f"[error]The --min-hits option must be between 1 and {BALLS_PER_DRAW}[/]"
+            )
+            return 1
+
+        try:
+            with self.database.reader as conn:
+                tickets = load_tickets(conn, game)
+                draws = load_draws(conn, game, since, until)
+        except sqlite3.Error as e:
+            self.error_console.print("[error]Failed to read the tickets[/]", e)
+            return 1
+
+        if not len(tickets):
+            self.console.print(
+                f"[warning]There are no {game} tickets, run [command]tickets add[/] first.[/]"
+            )
+            return 0
+
+        start = time.perf_counter()
+        scores = score_tickets(tickets, draws, min_hits=min_hits)
+        elapsed = time.perf_counter() - start
+
+        self._print_summary(game, scores, len(tickets), len(draws))
+        if len(scores) and limit > 0:
+            self._print_winners(scores, tickets, draws, limit)
+
+        if self.io.is_verbose():
+            self.console.print(
+                f"Scored {len(tickets):,} tickets against {len(draws):,} draws "
+                f"in {elapsed * 1000:.1f}ms",
+                style="dim",
+                new_line_start=True,
+            )
+        return 0
+
+    def _print_summary(self, game: str, scores: TicketScores, tickets: int, draws: int) -> None:
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("Aciertos", style="prog", justify="right")
+        table.add_column("Veces", style="repr.number", justify="right")
+        table.add_column("Con superbalota", style="repr.number", justify="right")
+        for hits in range(len(scores.histogram) - 1, -1, -1):
+            table.add_row(
+                str(hits), f"{scores.histogram[hits].sum():,}", f"{scores.histogram[hits, 1]:,}"
+            )
+
+        self.console.line()
+        self.console.print(
+            f"TIQUETES [prog]{game.upper()}[/] ({tickets:,} tiquetes, {draws:,} sorteos)",
+            style="bold",
+        )
+        self.console.print(Padding(table, (0, 0, 0, 2)))
+
+    def _print_winners(
+        self, scores: TicketScores, tickets: MaskTable, draws: MaskTable, limit: int
+    ) -> None:
+        import numpy as np
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        from baloto.miloto.games import mask_balls
+
+        order = np.lexsort((-scores.draw, -scores.superbalota, -scores.hits.astype(np.intp)))
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("Tiquete", style="dim", justify="right")
+        table.add_column("Balotas", style="repr.number")
+        table.add_column("Fecha", style="green")
+        table.add_column("Aciertos", style="bold", justify="right")
+        for index in order[:limit]:
+            ticket = scores.ticket[index]
+            balls = " ".join(f"{ball:02d}" for ball in mask_balls(int(tickets.masks[ticket])))
+            hits = str(scores.hits[index]) + (" + SB" if scores.superbalota[index] else "")
+            table.add_row(
+                str(tickets.ids[ticket]), balls, str(draws.dates[scores.draw[index]]), hits
+            )
+
+        self.console.print(
+            f"PREMIADOS ({len(scores):,}, mostrando {min(limit, len(scores))})",
+            style="bold",
+            new_line_start=True,
+        )
+        self.console.print(Padding(table, (0, 0, 0, 2)))
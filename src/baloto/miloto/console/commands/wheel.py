@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import ClassVar
+from typing import TYPE_CHECKING
+
+from baloto.cleo.helpers import argument
+from baloto.cleo.helpers import option
+from baloto.miloto.console.commands.command import Command as BalotoCommand
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from baloto.cleo.io.inputs.argument import Argument
+    from baloto.cleo.io.inputs.option import Option
+
+
+class WheelCommand(BalotoCommand):
+    name = "wheel"
+
+    description = "Generates a ticket wheel that covers the chosen numbers."
+
+    arguments: ClassVar[list[Argument]] = [
+        argument("numbers", "The numbers to wheel.", multiple=True)
+    ]
+    options: ClassVar[list[Option]] = [
+        option(
+            "game",
+            "g",
+            "The game to play.",
+            flag=False,
+            default="miloto",
+            choices=["miloto", "baloto", "revancha"],
+        ),
+        option("guarantee", "t", "The balls guaranteed on some ticket.", flag=False, default="3"),
+        option(
+            "condition",
+            "m",
+            "The chosen numbers that must be drawn, defaults to the guarantee.",
+            flag=False,
+        ),
+        option("iterations", "i", "The local search iterations.", flag=False, default="100"),
+        option("seed", None, "The seed of the local search.", flag=False),
+    ]
+
+    def __init__(self):
+        super().__init__()
+
+        self.console: Console | None = None
+        self.error_console: Console | None = None
+
+    def setup(self) -> int:
+        self.console = self.io.output.console
+        self.error_console = self.io.error_output.console
+        return 0
+
+    def handle(self) -> int:
+        import time
+
+        from rich import box
+        from rich.padding import Padding
+        from rich.table import Table
+
+        from baloto.miloto.games import GameType
+        from baloto.miloto.games import get_game
+        from baloto.miloto.wheel import Wheel
+
+        game = get_game(GameType(self.option("game")))
+        try:
+            numbers = [int(number) for number in self.argument("numbers")]
+            guarantee = int(self.option("guarantee"))
+            condition = int(self.option("condition")) if self.option("condition") else None
+            iterations = int(self.option("iterations"))
+            seed = int(self.option("seed")) if self.option("seed") else None
+        except ValueError:
+            self.error_console.print("[error]The numbers and options must be integers[/]")
+            return 1
+
+        if not all(1 <= number <= game.max_ball for number in numbers):
+            self.error_console.print(
+                f"[error]{game.type} numbers are between 1 and {game.max_ball}[/]"
+            )
+            return 1
+
+        start = time.perf_counter()
+        try:
+            wheel = Wheel(numbers, guarantee, condition)
+        except ValueError as e:
+            self.error_console.print(f"[error]{e}[/]")
+            return 1
+        tickets = wheel.design(iterations, seed=seed)
+        elapsed = time.perf_counter() - start
+
+        table = Table(box=box.SIMPLE_HEAD, show_header=True, show_edge=False, show_lines=False)
+        table.add_column("#", style="dim", justify="right")
+        table.add_column("Tiquete", style="repr.number")
+        for index, ticket in enumerate(tickets, 1):
+            table.add_row(str(index), " ".join(f"{ball:02d}" for ball in ticket))
+
+        self.console.line()
+        self.console.print(
+            f"RUEDA [prog]{len(wheel.numbers)}[/] números, "
+            f"{wheel.guarantee} si salen {wheel.condition}",
+            style="bold",
+        )
+        self.console.print(Padding(table, (0, 0, 0, 2)))
+        self.console.print(
+            f"  {len(tickets)} tiquetes de {len(wheel.tickets):,} posibles", style="dim"
+        )
+
+        if self.io.is_verbose():
+            self.console.print(f"Designed the wheel in {elapsed:.2f}s", style="dim")
+        return 0
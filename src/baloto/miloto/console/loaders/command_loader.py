@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from importlib import import_module
 from typing import TYPE_CHECKING
 
 from baloto.cleo.exceptions.errors import CleoLogicError
@@ -8,10 +9,53 @@ from baloto.cleo.loaders.factory_command_loader import FactoryCommandLoader
 if TYPE_CHECKING:
     from collections.abc import Callable
     from baloto.cleo.commands.cleo_command import Command
+    from baloto.miloto.console.loaders.manifest import CommandEntry
+    from baloto.miloto.console.loaders.manifest import CommandManifest
+
+
+def entry_factory(entry: CommandEntry) -> Callable[[], Command]:
+    def _load() -> Command:
+        command_class: type[Command] = getattr(import_module(entry.module), entry.class_name)
+        return command_class()
+
+    return _load
+
 
 class CommandLoader(FactoryCommandLoader):
+    def __init__(
+        self,
+        factories: dict[str, Callable[[], Command]],
+        manifest: CommandManifest | None = None,
+    ) -> None:
+        super().__init__(factories)
+        self.manifest = manifest
+
+    @classmethod
+    def from_manifest(cls, manifest: CommandManifest) -> CommandLoader:
+        return cls({entry.name: entry_factory(entry) for entry in manifest}, manifest)
+
     def register_factory(self, command_name: str, factory: Callable[[], Command]) -> None:
         if command_name in self._factories:
-            raise CleoLogicError(f'The command "{command_name}" already exists.')
+            raise CleoLogicError(
+                f'The command "{command_name}" already exists.', code="cmd-already-exists"
+            )
 
         self._factories[command_name] = factory
+
+    def has(self, name: str) -> bool:
+        # Aliases are known from the manifest before the command is loaded
+        return super().has(name) or (self.manifest is not None and name in self.manifest)
+
+    def get(self, name: str) -> Command:
+        if not super().has(name) and self.manifest is not None and name in self.manifest:
+            name = self.manifest.get(name).name
+
+        return super().get(name)
+
+    def entry(self, name: str) -> CommandEntry | None:
+        """
+        The manifest entry of a command name or alias, ``None`` without a manifest.
+        """
+        if self.manifest is None or name not in self.manifest:
+            return None
+        return self.manifest.get(name)
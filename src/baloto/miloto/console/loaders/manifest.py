@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+
+__all__ = ("CommandEntry", "CommandManifest", "default_manifest_path")
+
+# Bumped whenever the entry fields change, older manifests are rebuilt
+MANIFEST_VERSION = 1
+
+COMMANDS_PACKAGE = "baloto.miloto.console.commands"
+
+
+def default_manifest_path() -> Path:
+    cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache) / "miloto" / "commands.json"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CommandEntry:
+    """
+    What the list and help output need to know about a command, read without importing it.
+
+    Entries quack like commands for the descriptors: ``name``, ``aliases``, ``hidden``
+    and ``description``.
+    """
+
+    name: str
+    module: str
+    class_name: str
+    description: str = ""
+    aliases: tuple[str, ...] = ()
+    hidden: bool = False
+
+    @property
+    def namespace(self) -> str:
+        return " ".join(self.name.split(" ")[:-1])
+
+    @classmethod
+    def for_name(cls, name: str) -> CommandEntry:
+        """
+        The module and class a command name maps to, ``stats never-drawn`` is
+        ``stats.never_drawn.StatsNeverDrawnCommand``.
+        """
+        words = name.split(" ")
+        return cls(
+            name=name,
+            module=f"{COMMANDS_PACKAGE}." + ".".join(words).replace("-", "_"),
+            class_name="".join(word.title() for word in words).replace("-", "") + "Command",
+        )
+
+    def parse(self, source: str) -> CommandEntry:
+        """
+        Reads the literal class attributes of the command class from its module source.
+        """
+        import ast
+
+        for node in ast.parse(source).body:
+            if isinstance(node, ast.ClassDef) and node.name == self.class_name:
+                break
+        else:
+            raise ValueError(f"The module {self.module} has no class {self.class_name}")
+
+        values = {}
+        for statement in node.body:
+            if isinstance(statement, ast.Assign) and len(statement.targets) == 1:
+                target, value = statement.targets[0], statement.value
+            elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+                target, value = statement.target, statement.value
+            else:
+                continue
+            if isinstance(target, ast.Name) and target.id in ("description", "aliases", "hidden"):
+                try:
+                    values[target.id] = ast.literal_eval(value)
+                except ValueError:
+                    continue
+
+        return dataclasses.replace(
+            self,
+            description=str(values.get("description", "")),
+            aliases=tuple(values.get("aliases", ())),
+            hidden=bool(values.get("hidden", False)),
+        )
+
+
+class ModuleStamp(NamedTuple):
+    """
+    Where a command module was read from and its modification time and size then.
+    """
+
+    path: str
+    mtime_ns: int
+    size: int
+
+    @classmethod
+    def of(cls, path: Path) -> ModuleStamp:
+        stat = path.stat()
+        return cls(path.as_posix(), stat.st_mtime_ns, stat.st_size)
+
+    def is_current(self) -> bool:
+        return ModuleStamp.of(Path(self.path)) == self
+
+
+class CommandManifest:
+    """
+    The entries of the application commands, cached in a JSON file.
+
+    Entries are parsed from the command modules with :mod:`ast`, so listing the commands
+    never imports them. The cache stores the modification time and size of every module
+    and is rebuilt when any of them changes or the command list is different.
+    """
+
+    def __init__(self, entries: Iterable[CommandEntry]) -> None:
+        self._entries = {entry.name: entry for entry in entries}
+        self._aliases = {
+            alias: entry for entry in self._entries.values() for alias in entry.aliases
+        }
+
+    def __iter__(self) -> Iterator[CommandEntry]:
+        return iter(self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries or name in self._aliases
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._entries)
+
+    def get(self, name: str) -> CommandEntry:
+        """
+        The entry of a command name or alias.
+        """
+        try:
+            return self._entries.get(name) or self._aliases[name]
+        except KeyError:
+            raise KeyError(f"There is no command named {name!r}") from None
+
+    @classmethod
+    def build(cls, names: Iterable[str]) -> tuple[CommandManifest, dict[str, ModuleStamp]]:
+        """
+        Parses the command modules, returns the manifest and the stamps of the modules.
+        """
+        entries: list[CommandEntry] = []
+        stamps: dict[str, ModuleStamp] = {}
+        for name in names:
+            entry = CommandEntry.for_name(name)
+            spec = find_spec(entry.module)
+            if spec is None or spec.origin is None:
+                raise ValueError(f"The command module {entry.module} does not exist")
+            path = Path(spec.origin)
+            entries.append(entry.parse(path.read_text(encoding="utf-8")))
+            stamps[entry.module] = ModuleStamp.of(path)
+        return cls(entries), stamps
+
+    @classmethod
+    def load(cls, names: Iterable[str], path: Path | None = None) -> CommandManifest:
+        """
+        Returns the cached manifest of ``names`` when every module is unchanged,
+        rebuilding and storing it otherwise.
+        """
+        names = list(names)
+        path = path or default_manifest_path()
+        manifest = cls._read(path, names)
+        if manifest is not None:
+            return manifest
+
+        manifest, stamps = cls.build(names)
+        manifest._write(path, stamps)
+        return manifest
+
+    @classmethod
+    def _read(cls, path: Path, names: list[str]) -> CommandManifest | None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data["version"] != MANIFEST_VERSION or data["names"] != names:
+                return None
+            for values in data["modules"].values():
+                if not ModuleStamp(*values).is_current():
+                    return None
+            return cls(
+                CommandEntry(**{**entry, "aliases": tuple(entry["aliases"])})
+                for entry in data["entries"]
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write(self, path: Path, stamps: dict[str, ModuleStamp]) -> None:
+        data = {
+            "version": MANIFEST_VERSION,
+            "names": self.names,
+            "modules": stamps,
+            "entries": [dataclasses.asdict(entry) for entry in self],
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            # A read-only cache directory only costs parsing the modules every run
+            pass
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.games import BALLS_PER_DRAW
+from baloto.miloto.stats.matrix import DrawMatrix
+
+if TYPE_CHECKING:
+    import sqlite3
+    from pathlib import Path
+
+    from baloto.miloto.games import GameType
+
+
+__all__ = ("DrawCache", "fingerprint")
+
+MAGIC = b"MILOTODC"
+VERSION = 1
+
+HEADER = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("count", "<u4"),
+        ("rows", "<i8"),
+        ("max_id", "<i8"),
+        ("game", "S16"),
+        ("reserved", "V16"),
+    ]
+)
+
+SELECT_FINGERPRINT = "SELECT COUNT(*), COALESCE(MAX(draw_id), 0) FROM sessions WHERE game = ?;"
+
+
+def fingerprint(connection: sqlite3.Connection, game: GameType) -> tuple[int, int]:
+    """
+    The ``(row count, max draw_id)`` of the game sessions, it changes whenever draws are
+    inserted or deleted.
+    """
+    rows, max_id = connection.execute(SELECT_FINGERPRINT, (str(game),)).fetchone()
+    return int(rows), int(max_id)
+
+
+def _layout(count: int) -> tuple[int, int, int]:
+    """
+    Offsets of the ball columns, the day ordinals and the draw ids.
+    """
+    balls = HEADER.itemsize
+    ordinals = balls + BALLS_PER_DRAW * count
+    ordinals += -ordinals % 4
+    draw_ids = ordinals + 4 * count
+    return balls, ordinals, draw_ids
+
+
+class DrawCache:
+    """
+    A columnar copy of a game draws stored next to the database.
+
+    The file holds a fixed header, five ``uint8`` ball columns, the ``int32`` day
+    ordinals (days since 1970-01-01) and the ``int32`` draw ids. Columns are opened
+    with :class:`numpy.memmap`, so a fresh cache is read without copying, a stale one
+    (different sessions fingerprint) is rewritten from SQLite.
+    """
+
+    def __init__(self, path: Path, game: GameType) -> None:
+        self.path = path
+        self.game = game
+
+    def __repr__(self) -> str:
+        return f"<DrawCache {str(self.game)!r} {self.path.as_posix()!r}>"
+
+    def header(self) -> np.void | None:
+        try:
+            header = np.fromfile(self.path, dtype=HEADER, count=1)
+        except (OSError, ValueError):
+            return None
+
+        if header.size != 1:
+            return None
+
+        header = header[0]
+        if header["magic"] != MAGIC or header["version"] != VERSION:
+            return None
+        if header["game"].decode() != str(self.game):
+            return None
+        return header
+
+    def is_fresh(self, expected: tuple[int, int]) -> bool:
+        header = self.header()
+        return header is not None and (int(header["rows"]), int(header["max_id"])) == expected
+
+    def open(self) -> DrawMatrix:
+        """
+        Maps the cached columns, the caller must check the cache is fresh.
+        """
+        header = self.header()
+        if header is None:
+            raise ValueError(f"The file {self.path} is not a valid draw cache")
+
+        count = int(header["count"])
+        if not count:
+            return DrawMatrix(self.game, np.empty((0, BALLS_PER_DRAW), dtype=np.uint8))
+
+        balls, ordinals, draw_ids = _layout(count)
+        columns = np.memmap(
+            self.path, dtype=np.uint8, mode="r", offset=balls, shape=(BALLS_PER_DRAW, count)
+        )
+        days = np.memmap(self.path, dtype="<i4", mode="r", offset=ordinals, shape=(count,))
+        ids = np.memmap(self.path, dtype="<i4", mode="r", offset=draw_ids, shape=(count,))
+        return DrawMatrix(self.game, columns.T, draw_ids=ids, dates=days.astype("datetime64[D]"))
+
+    def write(self, matrix: DrawMatrix, expected: tuple[int, int]) -> None:
+        count = len(matrix)
+        header = np.zeros(1, dtype=HEADER)
+        header["magic"] = MAGIC
+        header["version"] = VERSION
+        header["count"] = count
+        header["rows"], header["max_id"] = expected
+        header["game"] = str(self.game).encode()
+
+        _, ordinals, _ = _layout(count)
+        padding = ordinals - HEADER.itemsize - BALLS_PER_DRAW * count
+
+        temporary = self.path.with_name(f"{self.path.name}.tmp")
+        with temporary.open("wb") as fp:
+            header.tofile(fp)
+            np.ascontiguousarray(matrix.balls.T, dtype=np.uint8).tofile(fp)
+            fp.write(b"\0" * padding)
+            matrix.dates.astype("datetime64[D]").astype("<i4").tofile(fp)
+            matrix.draw_ids.astype("<i4").tofile(fp)
+        os.replace(temporary, self.path)
+
+    def load(self, connection: sqlite3.Connection) -> DrawMatrix:
+        """
+        Returns the game draws, from the cache when it is fresh or from SQLite
+        refreshing the cache otherwise.
+        """
+        expected = fingerprint(connection, self.game)
+        if self.is_fresh(expected):
+            return self.open()
+
+        matrix = DrawMatrix.load(connection, self.game)
+        self.write(matrix, expected)
+        return self.open()
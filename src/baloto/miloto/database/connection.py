@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+__all__ = ("ConnectionManager", "PRAGMAS", "READ_PRAGMAS")
+
+# Prepared statements kept by every connection, the sqlite3 default is 128
+STATEMENT_CACHE_SIZE = 256
+
+# Applied once to every connection
+READ_PRAGMAS: dict[str, str | int] = {
+    "mmap_size": 256 * 1024 * 1024,
+    # Negative sizes are in KiB, 64 MiB of page cache
+    "cache_size": -64 * 1024,
+    "temp_store": "MEMORY",
+}
+
+# Applied to the read-write connection on top of the read pragmas
+PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    **READ_PRAGMAS,
+}
+
+
+class ConnectionManager:
+    """
+    Lazily opens and shares the connections to a database file.
+
+    The read-write :attr:`connection` and the read-only :attr:`reader` are opened on first
+    use, get the pragma profile once and keep a prepared-statement cache, so a command
+    running many queries pays the connection setup only once. Both connections can be used
+    as context managers to commit or roll back a transaction.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._reader: sqlite3.Connection | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = self.open()
+        return self._connection
+
+    @property
+    def reader(self) -> sqlite3.Connection:
+        """
+        A read-only connection for report commands, falls back to the read-write connection
+        when the database file does not exist yet.
+        """
+        if self._reader is None:
+            if not self.path.exists():
+                return self.connection
+            self._reader = self.open(read_only=True)
+        return self._reader
+
+    def open(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Opens a new connection with the pragma profile, the caller owns and closes it.
+
+        Connections are bound to the thread that opens them, so work running on another
+        thread opens its own connection through this method.
+        """
+        pragmas = READ_PRAGMAS if read_only else PRAGMAS
+        if read_only:
+            connection = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+        else:
+            connection = sqlite3.connect(self.path, cached_statements=STATEMENT_CACHE_SIZE)
+
+        for name, value in pragmas.items():
+            connection.execute(f"PRAGMA {name}={value};")
+        return connection
+
+    @property
+    def is_open(self) -> bool:
+        return self._connection is not None or self._reader is not None
+
+    def close(self) -> None:
+        for connection in (self._reader, self._connection):
+            if connection is not None:
+                connection.close()
+        self._connection = self._reader = None
+
+    def __enter__(self) -> ConnectionManager:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
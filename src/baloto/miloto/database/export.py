@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import dataclasses
+import zipfile
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.exceptions.errors import BalotoRuntimeError
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterator
+    from pathlib import Path
+    from typing import Any
+
+    import pyarrow as pa
+    from numpy.typing import NDArray
+
+
+__all__ = (
+    "ExportTable",
+    "EXPORT_TABLES",
+    "DEFAULT_ROW_GROUP_SIZE",
+    "has_pyarrow",
+    "iter_chunks",
+    "export_table",
+    "load_npz",
+)
+
+DEFAULT_ROW_GROUP_SIZE = 65_536
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ExportTable:
+    """
+    A query exported as columns, ``columns`` maps every selected column to a NumPy dtype.
+
+    Missing integers are exported as ``0`` and missing dates as ``NaT``.
+    """
+
+    name: str
+    query: str
+    columns: tuple[tuple[str, str], ...]
+
+
+_SELECT_SESSIONS = """
+    SELECT s.draw_id, s.game, s.lottery_id, s.lottery_date, s.accumulated, s.superbalota, s.mask,
+        s.rank,
+        MAX(CASE WHEN n.position = 1 THEN n.ball END),
+        MAX(CASE WHEN n.position = 2 THEN n.ball END),
+        MAX(CASE WHEN n.position = 3 THEN n.ball END),
+        MAX(CASE WHEN n.position = 4 THEN n.ball END),
+        MAX(CASE WHEN n.position = 5 THEN n.ball END)
+    FROM sessions s LEFT JOIN draw_numbers n ON n.draw_id = s.draw_id
+    GROUP BY s.draw_id ORDER BY s.draw_id;
+"""
+
+EXPORT_TABLES: dict[str, ExportTable] = {
+    table.name: table
+    for table in (
+        ExportTable(
+            "sessions",
+            _SELECT_SESSIONS,
+            (
+                ("draw_id", "int64"),
+                ("game", "U8"),
+                ("lottery_id", "int64"),
+                ("lottery_date", "datetime64[D]"),
+                ("accumulated", "int64"),
+                ("superbalota", "int16"),
+                ("mask", "uint64"),
+                ("rank", "int32"),
+                *((f"n{position}", "uint8") for position in range(1, 6)),
+            ),
+        ),
+        ExportTable(
+            "ball_counts",
+            "SELECT game, ball, count, last_date FROM stats_ball_counts ORDER BY game, ball;",
+            (("game", "U8"), ("ball", "uint8"), ("count", "int64"), ("last_date", "datetime64[D]")),
+        ),
+        ExportTable(
+            "pair_counts",
+            """SELECT game, ball_a, ball_b, count FROM stats_pair_counts
+            ORDER BY game, ball_a, ball_b;""",
+            (("game", "U8"), ("ball_a", "uint8"), ("ball_b", "uint8"), ("count", "int64")),
+        ),
+        ExportTable(
+            "rolling_counts",
+            """SELECT game, window_size, ball, count FROM stats_rolling_counts
+            ORDER BY game, window_size, ball;""",
+            (("game", "U8"), ("window_size", "int32"), ("ball", "uint8"), ("count", "int64")),
+        ),
+        ExportTable(
+            "gaps",
+            """SELECT game, ball, hits, last_seq, last_date, gap_sum, gap_max FROM ball_last_seen
+            ORDER BY game, ball;""",
+            (
+                ("game", "U8"),
+                ("ball", "uint8"),
+                ("hits", "int64"),
+                ("last_seq", "int64"),
+                ("last_date", "datetime64[D]"),
+                ("gap_sum", "int64"),
+                ("gap_max", "int64"),
+            ),
+        ),
+    )
+}
+
+
+def has_pyarrow() -> bool:
+    return find_spec("pyarrow") is not None
+
+
+def _column(values: tuple[Any, ...], dtype: str) -> NDArray[Any]:
+    if dtype.startswith(("int", "uint")):
+        return np.fromiter((value or 0 for value in values), dtype=dtype, count=len(values))
+    return np.array(values, dtype=dtype)
+
+
+def iter_chunks(
+    connection: sqlite3.Connection, table: ExportTable, size: int = DEFAULT_ROW_GROUP_SIZE
+) -> Iterator[dict[str, NDArray[Any]]]:
+    """
+    Streams the table in chunks of at most ``size`` rows, one array per column.
+    """
+    if size < 1:
+        raise BalotoRuntimeError(f"The chunk size must be a positive number, got {size}")
+
+    cursor = connection.execute(table.query)
+    while rows := cursor.fetchmany(size):
+        columns = zip(*rows)
+        yield {
+            name: _column(values, dtype) for (name, dtype), values in zip(table.columns, columns)
+        }
+
+
+class _ParquetWriter:
+    """
+    Writes every chunk as a Parquet row group.
+    """
+
+    suffix = ".parquet"
+
+    def __init__(self, path: Path, table: ExportTable) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema([(name, self._type(dtype)) for name, dtype in table.columns])
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def _type(self, dtype: str) -> pa.DataType:
+        if dtype.startswith("datetime64"):
+            return self._pa.date32()
+        if dtype.startswith("U"):
+            return self._pa.string()
+        return self._pa.from_numpy_dtype(np.dtype(dtype))
+
+    def write(self, chunk: dict[str, NDArray[Any]]) -> None:
+        arrays = [self._pa.array(chunk[field.name], type=field.type) for field in self._schema]
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class _NpzWriter:
+    """
+    Writes every chunk as ``<column>/<chunk>.npy`` members of a zip archive, readable with
+    :func:`numpy.load`; :func:`load_npz` concatenates the chunks back into columns.
+    """
+
+    suffix = ".npz"
+
+    def __init__(self, path: Path, table: ExportTable) -> None:
+        self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED, allowZip64=True)
+        self._columns = table.columns
+        self._chunks = 0
+
+    def write(self, chunk: dict[str, NDArray[Any]]) -> None:
+        for name, values in chunk.items():
+            with self._zip.open(f"{name}/{self._chunks:06d}.npy", "w", force_zip64=True) as fp:
+                np.lib.format.write_array(fp, values, allow_pickle=False)
+        self._chunks += 1
+
+    def close(self) -> None:
+        if not self._chunks:
+            # An empty table still has its columns, with their dtypes
+            self.write({name: np.empty(0, dtype=dtype) for name, dtype in self._columns})
+        self._zip.close()
+
+
+def export_table(
+    connection: sqlite3.Connection,
+    table: ExportTable,
+    directory: Path,
+    columnar: bool | None = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> tuple[Path, int]:
+    """
+    Streams ``table`` into ``directory``, as Parquet when pyarrow is installed and
+    ``columnar`` is not ``False``, and as a chunked ``.npz`` otherwise.
+
+    :return: the written file and the number of exported rows
+    """
+    if columnar is None:
+        columnar = has_pyarrow()
+    writer_class = _ParquetWriter if columnar else _NpzWriter
+
+    path = directory / f"{table.name}{writer_class.suffix}"
+    tmp = path.with_name(f"{path.name}.tmp")
+    rows = 0
+    writer = writer_class(tmp, table)
+    try:
+        for chunk in iter_chunks(connection, table, row_group_size):
+            writer.write(chunk)
+            rows += len(next(iter(chunk.values())))
+    except BaseException:
+        writer.close()
+        tmp.unlink(missing_ok=True)
+        raise
+
+    writer.close()
+    tmp.replace(path)
+    return path, rows
+
+
+def load_npz(path: Path) -> dict[str, NDArray[Any]]:
+    """
+    Loads a chunked ``.npz`` export back into one array per column.
+    """
+    with np.load(path) as archive:
+        names = sorted(archive.files)
+        columns: dict[str, list[NDArray[Any]]] = {}
+        for name in names:
+            columns.setdefault(name.split("/")[0], []).append(archive[name])
+    return {name: np.concatenate(chunks) for name, chunks in columns.items()}
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import csv
+import dataclasses
+import json
+import re
+import sqlite3
+from datetime import date
+from itertools import islice
+from typing import TYPE_CHECKING
+from typing import Any
+
+from baloto.miloto.combinations import rank
+from baloto.miloto.exceptions.errors import BalotoRuntimeError
+from baloto.miloto.games import GameType
+from baloto.miloto.games import ball_mask
+from baloto.miloto.games import get_game
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+    from pathlib import Path
+
+
+__all__ = (
+    "DrawRecord",
+    "ImportResult",
+    "DrawImporter",
+    "read_draws",
+    "read_rows",
+    "DEFAULT_BATCH_SIZE",
+)
+
+DEFAULT_BATCH_SIZE = 500
+
+INSERT_SESSION = """
+    INSERT OR IGNORE INTO sessions
+        (game, lottery_id, lottery_date, accumulated, superbalota, mask, rank)
+    VALUES (?, ?, ?, ?, ?, ?, ?);
+"""
+
+INSERT_NUMBERS = """
+    INSERT OR IGNORE INTO draw_numbers (draw_id, position, ball, game, lottery_date)
+    SELECT draw_id, ?, ?, game, lottery_date FROM sessions WHERE game = ? AND lottery_id = ?;
+"""
+
+_BALL_COLUMNS = ("n1", "n2", "n3", "n4", "n5")
+
+
+def _parse_balls(row: Mapping[str, Any]) -> tuple[int, ...]:
+    balls = row.get("balls")
+    if balls is None:
+        balls = [row[column] for column in _BALL_COLUMNS if row.get(column) not in (None, "")]
+    elif isinstance(balls, str):
+        balls = re.split(r"[\s,;\-]+", balls.strip()) if balls.strip() else []
+    return tuple(int(ball) for ball in balls)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class DrawRecord:
+    """
+    A single draw as read from a history dump.
+
+    Dumps without balls are accepted, those draws are stored with an empty mask.
+    """
+
+    lottery_id: int
+    lottery_date: date
+    accumulated: int
+    game: GameType = GameType.MILOTO
+    balls: tuple[int, ...] = ()
+    superbalota: int | None = None
+
+    @classmethod
+    def from_mapping(cls, row: Mapping[str, Any], game: GameType = GameType.MILOTO) -> DrawRecord:
+        try:
+            spec = get_game(row.get("game") or game)
+            balls = _parse_balls(row)
+            if balls:
+                spec.validate_balls(balls)
+            superbalota = row.get("superbalota")
+            superbalota = int(superbalota) if superbalota not in (None, "") else None
+            spec.validate_superbalota(superbalota)
+
+            return cls(
+                lottery_id=int(row["lottery_id"]),
+                lottery_date=date.fromisoformat(str(row["lottery_date"]).strip()),
+                accumulated=int(row["accumulated"]),
+                game=spec.type,
+                balls=balls,
+                superbalota=superbalota,
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise BalotoRuntimeError(f"Invalid draw record {dict(row)!r}: {e}") from e
+
+    @property
+    def mask(self) -> int:
+        return ball_mask(self.balls)
+
+    @property
+    def rank(self) -> int | None:
+        return rank(self.balls) if self.balls else None
+
+    def as_session_row(self) -> tuple[str, int, str, int, int | None, int, int | None]:
+        return (
+            str(self.game),
+            self.lottery_id,
+            self.lottery_date.isoformat(),
+            self.accumulated,
+            self.superbalota,
+            self.mask,
+            self.rank,
+        )
+
+    def as_number_rows(self) -> list[tuple[int, int, str, int]]:
+        game = str(self.game)
+        return [
+            (position, ball, game, self.lottery_id)
+            for position, ball in enumerate(self.balls, start=1)
+        ]
+
+
+@dataclasses.dataclass(slots=True)
+class ImportResult:
+    read: int = 0
+    inserted: int = 0
+    batches: int = 0
+    games: set[GameType] = dataclasses.field(default_factory=set)
+
+    @property
+    def ignored(self) -> int:
+        return self.read - self.inserted
+
+
+def read_rows(path: Path) -> Iterator[Mapping[str, Any]]:
+    """
+    Streams the raw rows stored in a ``.csv``, ``.json`` or ``.jsonl`` file.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with path.open(newline="", encoding="utf-8") as fp:
+            yield from csv.DictReader(fp)
+    elif suffix == ".jsonl":
+        with path.open(encoding="utf-8") as fp:
+            for line in fp:
+                if line.strip():
+                    yield json.loads(line)
+    elif suffix == ".json":
+        with path.open(encoding="utf-8") as fp:
+            data = json.load(fp)
+        yield from data.get("draws", []) if isinstance(data, dict) else data
+    else:
+        raise BalotoRuntimeError(
+            f"Unsupported draw file format '{path.suffix}', expected .csv, .json or .jsonl"
+        )
+
+
+def read_draws(path: Path, game: GameType = GameType.MILOTO) -> Iterator[DrawRecord]:
+    """
+    Streams the draws stored in a ``.csv``, ``.json`` or ``.jsonl`` file.
+
+    Rows are yielded one at a time so large dumps are never fully materialized, rows
+    without a ``game`` column are assigned to ``game``.
+    """
+    for row in read_rows(path):
+        yield DrawRecord.from_mapping(row, game)
+
+
+def _batched(iterable: Iterable[DrawRecord], size: int) -> Iterator[list[DrawRecord]]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class DrawImporter:
+    """
+    Loads draws into the ``sessions`` and ``draw_numbers`` tables using ``executemany``
+    batches.
+
+    All batches are written inside a single transaction, the database is switched to
+    WAL journaling with ``synchronous=NORMAL`` so the commit costs a single fsync.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, batch_size: int = DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise BalotoRuntimeError(f"The batch size must be a positive number, got {batch_size}")
+
+        self.connection = connection
+        self.batch_size = batch_size
+
+    def configure(self) -> None:
+        self.connection.execute("PRAGMA journal_mode=WAL;")
+        self.connection.execute("PRAGMA synchronous=NORMAL;")
+
+    def import_draws(self, records: Iterable[DrawRecord]) -> ImportResult:
+        self.configure()
+        result = ImportResult()
+
+        try:
+            self.connection.execute("BEGIN;")
+            for batch in _batched(records, self.batch_size):
+                result.inserted += self.write_batch(batch)
+                result.read += len(batch)
+                result.batches += 1
+                result.games.update(record.game for record in batch)
+            self.maintain(result.games)
+            self.connection.execute("COMMIT;")
+        except BaseException:
+            self.connection.execute("ROLLBACK;")
+            raise
+
+        return result
+
+    def maintain(self, games: set[GameType]) -> None:
+        """
+        Brings the indexes stored in the database up to date with the imported draws,
+        inside the import transaction.
+        """
+        from baloto.miloto.stats.features import FeatureIndex
+        from baloto.miloto.stats.gaps import GapIndex
+        from baloto.miloto.stats.snapshot import StatsSnapshot
+
+        for game in sorted(games):
+            GapIndex(self.connection, game).extend()
+            FeatureIndex(self.connection, game).extend()
+            StatsSnapshot(self.connection, game).refresh()
+
+    def write_batch(self, batch: list[DrawRecord]) -> int:
+        """
+        Writes a batch of draws, returns the number of new ``sessions`` rows.
+        """
+        cursor = self.connection.executemany(
+            INSERT_SESSION, [record.as_session_row() for record in batch]
+        )
+        inserted = cursor.rowcount
+        self.connection.executemany(
+            INSERT_NUMBERS, [row for record in batch for row in record.as_number_rows()]
+        )
+        return inserted
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from itertools import islice
+from typing import TYPE_CHECKING
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+from pydantic import ValidationError
+from pydantic import ValidationInfo
+from pydantic import field_validator
+from pydantic import model_validator
+
+from baloto.miloto.database.importer import DEFAULT_BATCH_SIZE
+from baloto.miloto.database.importer import DrawImporter
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.database.importer import ImportResult
+from baloto.miloto.database.importer import read_rows
+from baloto.miloto.exceptions.errors import BalotoRuntimeError
+from baloto.miloto.games import BALLS_PER_DRAW
+from baloto.miloto.games import GameType
+from baloto.miloto.games import get_game
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Callable
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+    from pathlib import Path
+
+
+__all__ = ("DrawModel", "IngestionPipeline")
+
+# Chunks waiting between two stages, bounds the memory to a few batches per queue
+DEFAULT_QUEUE_SIZE = 8
+
+# Raw row chunks with the game of their file, None once a reader is done
+RowQueue = asyncio.Queue[tuple[list[Mapping[str, Any]], GameType] | None]
+# Validated batches, None once every parser is done
+RecordQueue = asyncio.Queue[list[DrawRecord] | None]
+
+
+class DrawModel(BaseModel):
+    """
+    Validates a raw draw row, the game of its file comes in the ``game`` context.
+
+    Balls are read from a ``balls`` column or from the ``n1`` to ``n5`` columns; their
+    count, range and uniqueness and the superbalota are checked against the game.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    game: GameType = Field(default=GameType.MILOTO, validate_default=True)
+    lottery_id: int
+    lottery_date: date
+    accumulated: int
+    balls: tuple[int, ...] = ()
+    superbalota: int | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def collect_balls(cls, data: Any) -> Any:
+        # Wide dumps store a ball per column, only those rows need a new mapping
+        if isinstance(data, Mapping) and "balls" not in data and "n1" in data:
+            columns = (data.get(f"n{position}") for position in range(1, BALLS_PER_DRAW + 1))
+            return {**data, "balls": [ball for ball in columns if ball not in (None, "")]}
+        return data
+
+    @field_validator("game", mode="before")
+    @classmethod
+    def default_game(cls, value: Any, info: ValidationInfo) -> Any:
+        if value in (None, "") and info.context is not None:
+            return info.context.get("game", GameType.MILOTO)
+        return value
+
+    @field_validator("lottery_date", mode="before")
+    @classmethod
+    def strip_date(cls, value: Any) -> Any:
+        return value.strip() if isinstance(value, str) else value
+
+    @field_validator("balls", mode="before")
+    @classmethod
+    def split_balls(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return re.split(r"[\s,;\-]+", value.strip()) if value.strip() else ()
+        return value
+
+    @field_validator("balls")
+    @classmethod
+    def check_balls(cls, balls: tuple[int, ...], info: ValidationInfo) -> tuple[int, ...]:
+        game = info.data.get("game")
+        if balls and game is not None:
+            spec = get_game(game)
+            if len(balls) != spec.balls:
+                raise ValueError(f"{game} draws have {spec.balls} balls, got {balls}")
+            if len(set(balls)) != len(balls):
+                raise ValueError(f"{game} draws have distinct balls, got {balls}")
+            if not all(1 <= ball <= spec.max_ball for ball in balls):
+                raise ValueError(f"{game} balls are between 1 and {spec.max_ball}, got {balls}")
+        return balls
+
+    @field_validator("superbalota", mode="before")
+    @classmethod
+    def empty_superbalota(cls, value: Any) -> Any:
+        return None if value == "" else value
+
+    @field_validator("superbalota")
+    @classmethod
+    def check_superbalota(cls, superbalota: int | None, info: ValidationInfo) -> int | None:
+        game = info.data.get("game")
+        if game is not None:
+            get_game(game).validate_superbalota(superbalota)
+        return superbalota
+
+    @classmethod
+    def parse(cls, row: Mapping[str, Any], game: GameType) -> DrawRecord:
+        try:
+            model = cls.model_validate(row, context={"game": game})
+        except ValidationError as e:
+            raise BalotoRuntimeError(f"Invalid draw record {dict(row)!r}: {e}") from e
+        return DrawRecord(
+            lottery_id=model.lottery_id,
+            lottery_date=model.lottery_date,
+            accumulated=model.accumulated,
+            game=model.game,
+            balls=model.balls,
+            superbalota=model.superbalota,
+        )
+
+
+class IngestionPipeline:
+    """
+    Imports draw files with three asyncio stages joined by bounded queues.
+
+    A reader task per file pulls raw rows in chunks on a worker thread, ``parsers`` tasks
+    validate them with :class:`DrawModel` on worker threads too, and a single writer task
+    stores the batches on its own thread and connection. A full queue suspends the stage
+    feeding it, so at most ``queue_size`` chunks wait between two stages whatever the size
+    of the input.
+    The whole import runs in one transaction, as :meth:`DrawImporter.import_draws` does.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        parsers: int = 2,
+    ) -> None:
+        if batch_size < 1:
+            raise BalotoRuntimeError(f"The batch size must be a positive number, got {batch_size}")
+
+        self.connect = connect
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.parsers = parsers
+
+    def run(self, sources: Sequence[tuple[Path, GameType]]) -> ImportResult:
+        return asyncio.run(self.ingest(sources))
+
+    async def ingest(self, sources: Sequence[tuple[Path, GameType]]) -> ImportResult:
+        rows: RowQueue = asyncio.Queue(maxsize=self.queue_size)
+        records: RecordQueue = asyncio.Queue(maxsize=self.queue_size)
+        result = ImportResult()
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(self._read_all(sources, rows))
+                parsers = [
+                    group.create_task(self._parse(rows, records)) for _ in range(self.parsers)
+                ]
+                writer = group.create_task(self._write(records, result))
+                await asyncio.gather(*parsers)
+                await records.put(None)
+                await writer
+        except BaseExceptionGroup as group_error:
+            # The first failing stage cancels the others, report its error alone
+            raise group_error.exceptions[0] from None
+
+        return result
+
+    async def _read_all(self, sources: Sequence[tuple[Path, GameType]], rows: RowQueue) -> None:
+        await asyncio.gather(*(self._read(path, game, rows) for path, game in sources))
+        for _ in range(self.parsers):
+            await rows.put(None)
+
+    async def _read(self, path: Path, game: GameType, rows: RowQueue) -> None:
+        iterator: Iterator[Mapping[str, Any]] = read_rows(path)
+        while chunk := await asyncio.to_thread(lambda: list(islice(iterator, self.batch_size))):
+            await rows.put((chunk, game))
+
+    async def _parse(self, rows: RowQueue, records: RecordQueue) -> None:
+        while (item := await rows.get()) is not None:
+            chunk, game = item
+            # Validation is CPU bound, keep it off the loop so reading and writing go on
+            batch = await asyncio.to_thread(lambda: [DrawModel.parse(row, game) for row in chunk])
+            await records.put(batch)
+
+    async def _write(self, records: RecordQueue, result: ImportResult) -> None:
+        loop = asyncio.get_running_loop()
+        # sqlite3 connections are bound to their thread, the writer owns one for the import
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-writer") as executor:
+
+            def begin() -> DrawImporter:
+                importer = DrawImporter(self.connect(), batch_size=self.batch_size)
+                importer.configure()
+                importer.connection.execute("BEGIN;")
+                return importer
+
+            importer = await loop.run_in_executor(executor, begin)
+            try:
+                while (batch := await records.get()) is not None:
+                    result.inserted += await loop.run_in_executor(
+                        executor, importer.write_batch, batch
+                    )
+                    result.read += len(batch)
+                    result.batches += 1
+                    result.games.update(record.game for record in batch)
+
+                await loop.run_in_executor(executor, importer.maintain, result.games)
+                await loop.run_in_executor(executor, importer.connection.execute, "COMMIT;")
+            except BaseException:
+                executor.submit(importer.connection.execute, "ROLLBACK;").result()
+                raise
+            finally:
+                executor.submit(importer.connection.close).result()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sqlite3
+    from datetime import date
+
+    from baloto.miloto.games import GameType
+
+
+__all__ = ("ball_frequencies", "date_range", "latest_accumulated")
+
+
+def date_range(since: date | None, until: date | None) -> tuple[str, list[str]]:
+    """
+    The ``AND lottery_date ...`` clauses and parameters bounding a query to a date range.
+    """
+    clauses = ""
+    params: list[str] = []
+    if since is not None:
+        clauses += " AND lottery_date >= ?"
+        params.append(since.isoformat())
+    if until is not None:
+        clauses += " AND lottery_date <= ?"
+        params.append(until.isoformat())
+    return clauses, params
+
+
+def ball_frequencies(
+    connection: sqlite3.Connection,
+    game: GameType,
+    since: date | None = None,
+    until: date | None = None,
+) -> dict[int, int]:
+    """
+    Counts how many times every ball was drawn, answered from the
+    ``dn_game_ball_date`` covering index.
+    """
+    clauses, params = date_range(since, until)
+    cursor = connection.execute(
+        f"SELECT ball, COUNT(*) FROM draw_numbers WHERE game = ?{clauses} GROUP BY ball;",
+        (str(game), *params),
+    )
+    return dict(cursor.fetchall())
+
+
+def latest_accumulated(connection: sqlite3.Connection, game: GameType) -> int | None:
+    """
+    Returns the accumulated jackpot of the most recent draw of ``game``.
+    """
+    cursor = connection.execute(
+        "SELECT accumulated FROM sessions WHERE game = ?"
+        " ORDER BY lottery_date DESC, draw_id DESC LIMIT 1;",
+        (str(game),),
+    )
+    row = cursor.fetchone()
+    return row[0] if row else None
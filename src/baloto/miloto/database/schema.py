@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+__all__ = ("SCHEMA_VERSION", "MIGRATIONS", "current_version", "migrate")
+
+
+MIGRATIONS: dict[int, Sequence[str]] = {
+    # Version 1, the original sessions table
+    1: (
+        """CREATE TABLE IF NOT EXISTS sessions (
+            lottery_id INTEGER PRIMARY KEY,
+            lottery_date DATE NOT NULL UNIQUE,
+            accumulated INT NOT NULL
+        );""",
+        """CREATE UNIQUE INDEX IF NOT EXISTS l_id ON sessions(lottery_id);""",
+        """CREATE UNIQUE INDEX IF NOT EXISTS l_id_date ON sessions(lottery_id, lottery_date);""",
+    ),
+    # Version 2, draws are keyed by game and the balls are stored in draw_numbers
+    2: (
+        """CREATE TABLE sessions_v2 (
+            draw_id INTEGER PRIMARY KEY,
+            game TEXT NOT NULL DEFAULT 'miloto',
+            lottery_id INTEGER NOT NULL,
+            lottery_date DATE NOT NULL,
+            accumulated INT NOT NULL,
+            superbalota INTEGER,
+            mask INTEGER NOT NULL DEFAULT 0,
+            UNIQUE (game, lottery_id),
+            UNIQUE (game, lottery_date)
+        );""",
+        """INSERT INTO sessions_v2 (draw_id, lottery_id, lottery_date, accumulated)
+            SELECT lottery_id, lottery_id, lottery_date, accumulated FROM sessions;""",
+        """DROP TABLE sessions;""",
+        """ALTER TABLE sessions_v2 RENAME TO sessions;""",
+        """CREATE TABLE IF NOT EXISTS draw_numbers (
+            draw_id INTEGER NOT NULL REFERENCES sessions(draw_id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            ball INTEGER NOT NULL,
+            game TEXT NOT NULL,
+            lottery_date DATE NOT NULL,
+            PRIMARY KEY (draw_id, position)
+        ) WITHOUT ROWID;""",
+        # draw_numbers is WITHOUT ROWID, so this index also carries (draw_id, position)
+        """CREATE INDEX IF NOT EXISTS dn_game_ball_date
+            ON draw_numbers(game, ball, lottery_date);""",
+    ),
+    # Version 3, last seen and gap index maintained by the importer
+    3: (
+        """CREATE TABLE IF NOT EXISTS game_state (
+            game TEXT PRIMARY KEY,
+            draws INTEGER NOT NULL DEFAULT 0,
+            last_draw_id INTEGER NOT NULL DEFAULT 0,
+            last_date DATE
+        ) WITHOUT ROWID;""",
+        """CREATE TABLE IF NOT EXISTS ball_last_seen (
+            game TEXT NOT NULL,
+            ball INTEGER NOT NULL,
+            hits INTEGER NOT NULL DEFAULT 0,
+            last_seq INTEGER NOT NULL DEFAULT -1,
+            last_date DATE,
+            gap_sum INTEGER NOT NULL DEFAULT 0,
+            gap_max INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (game, ball)
+        ) WITHOUT ROWID;""",
+        """CREATE TABLE IF NOT EXISTS ball_gap_histogram (
+            game TEXT NOT NULL,
+            ball INTEGER NOT NULL,
+            gap INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (game, ball, gap)
+        ) WITHOUT ROWID;""",
+    ),
+    # Version 4, stored tickets scored against the draw masks
+    4: (
+        """CREATE TABLE IF NOT EXISTS tickets (
+            ticket_id INTEGER PRIMARY KEY,
+            game TEXT NOT NULL,
+            mask INTEGER NOT NULL,
+            superbalota INTEGER,
+            label TEXT,
+            created_on TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );""",
+        # Covering indexes, loading the masks never touches the table rows
+        """CREATE INDEX IF NOT EXISTS tickets_game_mask
+            ON tickets(game, ticket_id, mask, superbalota);""",
+        """CREATE INDEX IF NOT EXISTS sessions_game_date_mask
+            ON sessions(game, lottery_date, draw_id, mask, superbalota);""",
+    ),
+    # Version 5, statistics snapshot maintained by the importer
+    5: (
+        """CREATE TABLE IF NOT EXISTS stats_snapshot (
+            game TEXT PRIMARY KEY,
+            draws INTEGER NOT NULL DEFAULT 0,
+            last_draw_id INTEGER NOT NULL DEFAULT 0,
+            last_date DATE,
+            updated_on TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        ) WITHOUT ROWID;""",
+        """CREATE TABLE IF NOT EXISTS stats_ball_counts (
+            game TEXT NOT NULL,
+            ball INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            last_date DATE NOT NULL,
+            PRIMARY KEY (game, ball)
+        ) WITHOUT ROWID;""",
+        """CREATE TABLE IF NOT EXISTS stats_pair_counts (
+            game TEXT NOT NULL,
+            ball_a INTEGER NOT NULL,
+            ball_b INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (game, ball_a, ball_b)
+        ) WITHOUT ROWID;""",
+        """CREATE TABLE IF NOT EXISTS stats_rolling_counts (
+            game TEXT NOT NULL,
+            window_size INTEGER NOT NULL,
+            ball INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (game, window_size, ball)
+        ) WITHOUT ROWID;""",
+    ),
+    # Version 6, per draw pattern features
+    6: (
+        """CREATE TABLE IF NOT EXISTS draw_features (
+            draw_id INTEGER PRIMARY KEY REFERENCES sessions(draw_id) ON DELETE CASCADE,
+            game TEXT NOT NULL,
+            lottery_date DATE NOT NULL,
+            odd INTEGER NOT NULL,
+            high INTEGER NOT NULL,
+            total INTEGER NOT NULL,
+            spread INTEGER NOT NULL,
+            consecutive INTEGER NOT NULL,
+            decades TEXT NOT NULL
+        );""",
+        # Pattern queries filter on a class and a sum range, the indexes cover both
+        """CREATE INDEX IF NOT EXISTS df_game_odd_total ON draw_features(game, odd, total);""",
+        """CREATE INDEX IF NOT EXISTS df_game_high_total ON draw_features(game, high, total);""",
+        """CREATE INDEX IF NOT EXISTS df_game_total ON draw_features(game, total);""",
+        """CREATE INDEX IF NOT EXISTS df_game_decades ON draw_features(game, decades);""",
+    ),
+    # Version 7, combinations stored by their rank, tickets drop the wider mask column
+    7: (
+        """ALTER TABLE sessions ADD COLUMN rank INTEGER;""",
+        """UPDATE sessions SET rank = combination_rank(mask) WHERE mask != 0;""",
+        # "Was this combination ever drawn" is a single index lookup
+        """CREATE INDEX IF NOT EXISTS sessions_game_rank
+            ON sessions(game, rank, lottery_date, lottery_id);""",
+        """CREATE TABLE tickets_v7 (
+            ticket_id INTEGER PRIMARY KEY,
+            game TEXT NOT NULL,
+            rank INTEGER NOT NULL,
+            superbalota INTEGER,
+            label TEXT,
+            created_on TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );""",
+        """INSERT INTO tickets_v7 (ticket_id, game, rank, superbalota, label, created_on)
+            SELECT ticket_id, game, combination_rank(mask), superbalota, label, created_on
+            FROM tickets;""",
+        """DROP TABLE tickets;""",
+        """ALTER TABLE tickets_v7 RENAME TO tickets;""",
+        """CREATE INDEX IF NOT EXISTS tickets_game_rank
+            ON tickets(game, ticket_id, rank, superbalota);""",
+    ),
+}
+
+SCHEMA_VERSION = max(MIGRATIONS)
+
+CREATE_SCHEMA_VERSION = """CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER PRIMARY KEY,
+    applied_on TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);"""
+
+
+def _has_table(connection: sqlite3.Connection, name: str) -> bool:
+    cursor = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?;", (name,)
+    )
+    return cursor.fetchone() is not None
+
+
+def current_version(connection: sqlite3.Connection) -> int:
+    """
+    Returns the schema version of the database, ``0`` for an empty database.
+
+    Databases created before the ``schema_version`` table existed are version 1.
+    """
+    if _has_table(connection, "schema_version"):
+        row = connection.execute("SELECT MAX(version) FROM schema_version;").fetchone()
+        return row[0] or 0
+
+    return 1 if _has_table(connection, "sessions") else 0
+
+
+def migrate(connection: sqlite3.Connection, target: int = SCHEMA_VERSION) -> tuple[int, int]:
+    """
+    Migrates the database in place up to the ``target`` version.
+
+    Every pending migration runs inside a single transaction.
+
+    :return: a tuple with the versions before and after the migration
+    """
+    from baloto.miloto.combinations import rank_mask
+
+    version = current_version(connection)
+    if version >= target:
+        return version, version
+
+    # Migrations rank the stored masks in SQL
+    connection.create_function("combination_rank", 1, rank_mask, deterministic=True)
+    connection.execute("BEGIN;")
+    try:
+        connection.execute(CREATE_SCHEMA_VERSION)
+        for step in range(version + 1, target + 1):
+            for statement in MIGRATIONS[step]:
+                connection.execute(statement)
+            connection.execute("INSERT INTO schema_version (version) VALUES (?);", (step,))
+        connection.execute("COMMIT;")
+    except BaseException:
+        connection.execute("ROLLBACK;")
+        raise
+
+    return version, target
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.combinations import rank
+from baloto.miloto.combinations import ranks_to_masks
+from baloto.miloto.database.queries import date_range
+from baloto.miloto.games import get_game
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterable
+    from datetime import date
+
+    from numpy.typing import NDArray
+
+    from baloto.miloto.games import GameType
+
+
+__all__ = ("MaskTable", "add_tickets", "load_tickets", "load_draws", "drawn_on")
+
+INSERT_TICKET = """INSERT INTO tickets (game, rank, superbalota, label)
+    VALUES (?, ?, ?, ?);"""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class MaskTable:
+    """
+    Row ids, ``uint64`` ball masks and superbalotas (``0`` when missing) of tickets or draws.
+    """
+
+    ids: NDArray[np.int64]
+    masks: NDArray[np.uint64]
+    superbalota: NDArray[np.int16]
+    dates: NDArray[np.str_] | None = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple], dated: bool = False) -> MaskTable:
+        columns = list(zip(*rows)) or [()] * (4 if dated else 3)
+        return cls(
+            ids=np.array(columns[0], dtype=np.int64),
+            masks=np.array(columns[1], dtype=np.uint64),
+            superbalota=np.array([sb or 0 for sb in columns[2]], dtype=np.int16),
+            dates=np.array(columns[3], dtype=np.str_) if dated else None,
+        )
+
+
+def add_tickets(
+    connection: sqlite3.Connection,
+    game: GameType,
+    tickets: Iterable[tuple[tuple[int, ...], int | None]],
+    label: str | None = None,
+) -> int:
+    """
+    Validates and stores ``(balls, superbalota)`` tickets, returns how many were added.
+    """
+    rules = get_game(game)
+    rows = []
+    for balls, superbalota in tickets:
+        rules.validate_balls(balls)
+        rules.validate_superbalota(superbalota)
+        rows.append((str(game), rank(balls), superbalota, label))
+
+    with connection:
+        connection.executemany(INSERT_TICKET, rows)
+    return len(rows)
+
+
+def load_tickets(connection: sqlite3.Connection, game: GameType) -> MaskTable:
+    """
+    Loads the tickets from the ``tickets_game_rank`` index, unranking them into masks.
+    """
+    cursor = connection.execute(
+        "SELECT ticket_id, rank, superbalota FROM tickets WHERE game = ? ORDER BY ticket_id;",
+        (str(game),),
+    )
+    table = MaskTable.from_rows(cursor.fetchall())
+    return dataclasses.replace(table, masks=ranks_to_masks(table.masks.astype(np.int64)))
+
+
+def load_draws(
+    connection: sqlite3.Connection,
+    game: GameType,
+    since: date | None = None,
+    until: date | None = None,
+) -> MaskTable:
+    """
+    Loads the draw masks in date order, answered from the ``sessions_game_date_mask`` index.
+    """
+    clauses, params = date_range(since, until)
+    cursor = connection.execute(
+        "SELECT draw_id, mask, superbalota, lottery_date FROM sessions"
+        f" WHERE game = ?{clauses} ORDER BY lottery_date, draw_id;",
+        (str(game), *params),
+    )
+    return MaskTable.from_rows(cursor.fetchall(), dated=True)
+
+
+def drawn_on(
+    connection: sqlite3.Connection, game: GameType, balls: tuple[int, ...]
+) -> list[tuple[int, str]]:
+    """
+    The ``(lottery_id, lottery_date)`` of every draw of exactly ``balls``, answered from
+    the ``sessions_game_rank`` index.
+    """
+    cursor = connection.execute(
+        "SELECT lottery_id, lottery_date FROM sessions WHERE game = ? AND rank = ?"
+        " ORDER BY lottery_date;",
+        (str(game), rank(balls)),
+    )
+    return cursor.fetchall()
@@ -15,6 +15,13 @@ import dataclasses
 @dataclasses.dataclass
 class ConsoleMessage:
     text: str
+    debug: bool = False
+
+    @property
+    def stripped(self) -> str:
+        from rich.text import Text
+
+        return Text.from_markup(self.text).plain
 
     def wrap(self, tag: str) -> ConsoleMessage:
         if self.text:
@@ -31,11 +38,12 @@ class ConsoleMessage:
         self,
         title: str,
         indent: str = "",
-    ) -> None:
+    ) -> ConsoleMessage:
         if not self.text:
-            return
+            return self
 
         if self.text:
             section = [f"[b]{title}:[/]"] if title else []
             section.extend(self.text.splitlines())
             self.text = f"\n{indent}".join(section).strip()
+        return self
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import dataclasses
+from enum import StrEnum
+
+__all__ = (
+    "GameType",
+    "Game",
+    "GAMES",
+    "MAX_BALL",
+    "BALLS_PER_DRAW",
+    "get_game",
+    "ball_mask",
+    "mask_balls",
+)
+
+MAX_BALL = 43
+BALLS_PER_DRAW = 5
+
+
+class GameType(StrEnum):
+    MILOTO = "miloto"
+    BALOTO = "baloto"
+    REVANCHA = "revancha"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Game:
+    """
+    The rules of a game, how many balls are drawn and from which range.
+    """
+
+    type: GameType
+    max_ball: int
+    balls: int = BALLS_PER_DRAW
+    max_superbalota: int | None = None
+
+    @property
+    def has_superbalota(self) -> bool:
+        return self.max_superbalota is not None
+
+    def validate_balls(self, balls: tuple[int, ...]) -> None:
+        if len(balls) != self.balls or len(set(balls)) != self.balls:
+            raise ValueError(f"{self.type} draws have {self.balls} distinct balls, got {balls}")
+
+        if not all(1 <= ball <= self.max_ball for ball in balls):
+            raise ValueError(f"{self.type} balls are between 1 and {self.max_ball}, got {balls}")
+
+    def validate_superbalota(self, superbalota: int | None) -> None:
+        if superbalota is None:
+            return
+
+        if self.max_superbalota is None:
+            raise ValueError(f"{self.type} draws do not have a superbalota")
+
+        if not 1 <= superbalota <= self.max_superbalota:
+            raise ValueError(
+                f"The superbalota is between 1 and {self.max_superbalota}, got {superbalota}"
+            )
+
+
+GAMES: dict[GameType, Game] = {
+    GameType.MILOTO: Game(GameType.MILOTO, max_ball=39),
+    GameType.BALOTO: Game(GameType.BALOTO, max_ball=43, max_superbalota=16),
+    GameType.REVANCHA: Game(GameType.REVANCHA, max_ball=43, max_superbalota=16),
+}
+
+
+def get_game(game: str | GameType) -> Game:
+    try:
+        return GAMES[GameType(game)]
+    except ValueError:
+        choices = ", ".join(GameType)
+        raise ValueError(f"Unknown game '{game}', expected one of {choices}") from None
+
+
+def ball_mask(balls: tuple[int, ...] | list[int]) -> int:
+    """
+    Packs the balls into an integer where bit ``ball - 1`` is set for every drawn ball.
+    """
+    mask = 0
+    for ball in balls:
+        mask |= 1 << (ball - 1)
+    return mask
+
+
+def mask_balls(mask: int) -> tuple[int, ...]:
+    return tuple(bit + 1 for bit in range(MAX_BALL) if mask >> bit & 1)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from itertools import combinations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.games import BALLS_PER_DRAW
+from baloto.miloto.games import MAX_BALL
+from baloto.miloto.stats.matrix import DrawMatrix
+
+if TYPE_CHECKING:
+    import sqlite3
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+    from baloto.miloto.games import GameType
+
+
+__all__ = ("CooccurrenceIndex",)
+
+SELECT_APPENDED = "SELECT COUNT(*) FROM sessions WHERE game = ? AND draw_id > ?;"
+
+# The 10 (a, b, c) position triples of a sorted 5 balls draw
+_TRIPLE_POSITIONS = np.array(list(combinations(range(BALLS_PER_DRAW), 3)), dtype=np.intp)
+
+
+def _triple_keys(matrix: DrawMatrix) -> NDArray[np.int32]:
+    balls = np.sort(matrix.balls.astype(np.int32) - 1, axis=1)
+    triples = balls[:, _TRIPLE_POSITIONS]
+    keys = (triples[..., 0] * MAX_BALL + triples[..., 1]) * MAX_BALL + triples[..., 2]
+    return keys.ravel()
+
+
+def _merge_counts(
+    keys: NDArray[np.int32], counts: NDArray[np.int32]
+) -> tuple[NDArray[np.int32], NDArray[np.int32]]:
+    unique, inverse = np.unique(keys, return_inverse=True)
+    merged = np.bincount(inverse, weights=counts, minlength=unique.size)
+    return unique.astype(np.int32), merged.astype(np.int32)
+
+
+class CooccurrenceIndex:
+    """
+    Counts how many times pairs and triples of balls were drawn together.
+
+    ``pairs`` is the dense ``(43, 43)`` matrix ``X.T @ X`` of the one-hot draw matrix,
+    its diagonal holds the ball frequencies. Triples are sparse, only the triples that
+    were ever drawn are kept as sorted ``keys`` with their ``counts``.
+
+    The index remembers the last ``draw_id`` it has seen and the sessions ``fingerprint``
+    it was built from, so refreshing it only reads and adds the draws inserted since. Any
+    other change to the sessions rebuilds it.
+    """
+
+    def __init__(self, game: GameType) -> None:
+        self.game = game
+        self.draws = 0
+        self.last_draw_id = 0
+        self.fingerprint: tuple[int, int] = (0, 0)
+        self.pairs: NDArray[np.int32] = np.zeros((MAX_BALL, MAX_BALL), dtype=np.int32)
+        self.triple_keys: NDArray[np.int32] = np.empty(0, dtype=np.int32)
+        self.triple_counts: NDArray[np.int32] = np.empty(0, dtype=np.int32)
+
+    def __repr__(self) -> str:
+        return f"<CooccurrenceIndex {str(self.game)!r} draws={self.draws}>"
+
+    @classmethod
+    def from_matrix(cls, matrix: DrawMatrix) -> CooccurrenceIndex:
+        index = cls(matrix.game)
+        index.update(matrix)
+        return index
+
+    def update(self, matrix: DrawMatrix) -> None:
+        """
+        Adds the draws of ``matrix`` to the counts.
+        """
+        if not len(matrix):
+            return
+
+        onehot = matrix.onehot.astype(np.int32)
+        self.pairs += onehot.T @ onehot
+
+        keys = np.concatenate((self.triple_keys, _triple_keys(matrix)))
+        counts = np.concatenate(
+            (self.triple_counts, np.ones(keys.size - self.triple_keys.size, dtype=np.int32))
+        )
+        self.triple_keys, self.triple_counts = _merge_counts(keys, counts)
+
+        self.draws += len(matrix)
+        self.last_draw_id = max(self.last_draw_id, matrix.last_draw_id)
+
+    def pair_count(self, a: int, b: int) -> int:
+        return int(self.pairs[a - 1, b - 1])
+
+    def triple_count(self, a: int, b: int, c: int) -> int:
+        x, y, z = sorted((a - 1, b - 1, c - 1))
+        key = (x * MAX_BALL + y) * MAX_BALL + z
+        position = np.searchsorted(self.triple_keys, key)
+        if position < self.triple_keys.size and self.triple_keys[position] == key:
+            return int(self.triple_counts[position])
+        return 0
+
+    def top_pairs(self, count: int) -> list[tuple[int, int, int]]:
+        upper = np.triu(self.pairs, k=1)
+        flat = np.argsort(upper, axis=None, kind="stable")[::-1][:count]
+        rows, columns = np.unravel_index(flat, upper.shape)
+        return [
+            (int(a) + 1, int(b) + 1, int(upper[a, b])) for a, b in zip(rows, columns) if upper[a, b]
+        ]
+
+    def top_triples(self, count: int) -> list[tuple[int, int, int, int]]:
+        order = np.argsort(self.triple_counts, kind="stable")[::-1][:count]
+        result = []
+        for key, hits in zip(self.triple_keys[order], self.triple_counts[order]):
+            rest, c = divmod(int(key), MAX_BALL)
+            a, b = divmod(rest, MAX_BALL)
+            result.append((a + 1, b + 1, c + 1, int(hits)))
+        return result
+
+    def save(self, path: Path) -> None:
+        with path.open("wb") as fp:
+            np.savez(
+                fp,
+                game=np.array(str(self.game)),
+                header=np.array([self.draws, self.last_draw_id], dtype=np.int64),
+                fingerprint=np.array(self.fingerprint, dtype=np.int64),
+                pairs=self.pairs,
+                triple_keys=self.triple_keys,
+                triple_counts=self.triple_counts,
+            )
+
+    @classmethod
+    def load(cls, path: Path, game: GameType) -> CooccurrenceIndex:
+        index = cls(game)
+        with np.load(path) as data:
+            if str(data["game"]) != str(game):
+                raise ValueError(f"The file {path} is not a {game} co-occurrence index")
+            index.draws, index.last_draw_id = (int(value) for value in data["header"])
+            rows, max_id = (int(value) for value in data["fingerprint"])
+            index.fingerprint = (rows, max_id)
+            index.pairs = data["pairs"]
+            index.triple_keys = data["triple_keys"]
+            index.triple_counts = data["triple_counts"]
+        return index
+
+    @classmethod
+    def refresh(
+        cls, connection: sqlite3.Connection, game: GameType, path: Path
+    ) -> CooccurrenceIndex:
+        """
+        Loads the index persisted at ``path`` and adds the draws inserted since it was
+        saved. The full history is read when the file does not exist yet, or when draws
+        were deleted or replaced since, the sessions ``fingerprint`` tells them apart.
+        """
+        from baloto.miloto.database.cache import fingerprint
+
+        key = fingerprint(connection, game)
+        try:
+            index = cls.load(path, game)
+        except (OSError, ValueError, KeyError):
+            index = cls(game)
+        else:
+            if index.fingerprint == key:
+                return index
+
+        rows, max_id = index.fingerprint
+        (appended,) = connection.execute(SELECT_APPENDED, (str(game), max_id)).fetchone()
+        if key[0] - rows != appended:
+            # Not only appends, the saved counts no longer match the sessions
+            index, max_id = cls(game), 0
+
+        index.update(DrawMatrix.load(connection, game, after=max_id))
+        index.fingerprint = key
+        index.save(path)
+        return index
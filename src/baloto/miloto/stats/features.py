@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING
+from typing import Any
+
+import numpy as np
+
+from baloto.miloto.games import MAX_BALL
+from baloto.miloto.games import get_game
+from baloto.miloto.stats.matrix import DrawMatrix
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from numpy.typing import NDArray
+
+    from baloto.miloto.games import GameType
+
+
+__all__ = ("FEATURES", "PatternFilter", "FeatureIndex", "draw_features")
+
+FEATURES = ("odd", "high", "total", "spread", "consecutive", "decades")
+
+DECADES = MAX_BALL // 10 + 1
+
+INSERT_FEATURES = """
+    INSERT OR REPLACE INTO draw_features
+        (draw_id, game, lottery_date, odd, high, total, spread, consecutive, decades)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
+"""
+
+
+def draw_features(balls: NDArray[np.uint8], max_ball: int) -> dict[str, NDArray[Any]]:
+    """
+    The pattern features of every draw: odd balls, balls above half the range, sum,
+    spread, runs of consecutive balls and how many balls fall in every decade.
+
+    ``decades`` is a string of one digit per decade (1-9, 10-19, ...), ``"21110"`` has two
+    balls below 10 and none in the forties.
+    """
+    values = np.sort(balls.astype(np.int64), axis=1)
+    adjacent = np.diff(values, axis=1) == 1
+    # A run of consecutive balls starts on every adjacent pair not preceded by another one
+    starts = adjacent.copy()
+    starts[:, 1:] &= ~adjacent[:, :-1]
+
+    counts = np.zeros((len(values), DECADES), dtype=np.int64)
+    np.add.at(counts, (np.arange(len(values))[:, None], values // 10), 1)
+    digits = (counts + ord("0")).astype(np.uint8)
+
+    return {
+        "odd": (values % 2).sum(axis=1),
+        "high": (values > max_ball // 2).sum(axis=1),
+        "total": values.sum(axis=1),
+        "spread": values[:, -1] - values[:, 0] if values.size else np.zeros(0, np.int64),
+        "consecutive": starts.sum(axis=1),
+        "decades": np.array([row.tobytes().decode() for row in digits], dtype=np.str_),
+    }
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PatternFilter:
+    """
+    Equality filters on the pattern classes and a range on the sum, ``None`` matches all.
+    """
+
+    odd: int | None = None
+    high: int | None = None
+    consecutive: int | None = None
+    decades: str | None = None
+    min_total: int | None = None
+    max_total: int | None = None
+
+    def matches(self, features: dict[str, NDArray[Any]]) -> NDArray[np.bool_]:
+        """
+        Which rows of :func:`draw_features` output match, the in-memory twin of :meth:`where`.
+        """
+        matched = np.ones(len(features["total"]), dtype=np.bool_)
+        for column in ("odd", "high", "consecutive", "decades"):
+            value = getattr(self, column)
+            if value is not None:
+                matched &= features[column] == value
+        if self.min_total is not None:
+            matched &= features["total"] >= self.min_total
+        if self.max_total is not None:
+            matched &= features["total"] <= self.max_total
+        return matched
+
+    def where(self) -> tuple[str, list[int | str]]:
+        clauses, params = [], []
+        for column in ("odd", "high", "consecutive", "decades"):
+            value = getattr(self, column)
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if self.min_total is not None:
+            clauses.append("total >= ?")
+            params.append(self.min_total)
+        if self.max_total is not None:
+            clauses.append("total <= ?")
+            params.append(self.max_total)
+        return "".join(f" AND {clause}" for clause in clauses), params
+
+
+class FeatureIndex:
+    """
+    Maintains the ``draw_features`` side table of a game.
+
+    Features only depend on the draw itself, so the draws inserted since the last
+    refresh are added whatever their date.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, game: GameType) -> None:
+        self.connection = connection
+        self.game = game
+
+    def last_draw_id(self) -> int:
+        row = self.connection.execute(
+            "SELECT MAX(draw_id) FROM draw_features WHERE game = ?;", (str(self.game),)
+        ).fetchone()
+        return row[0] or 0
+
+    def extend(self) -> None:
+        self._index(DrawMatrix.load(self.connection, self.game, after=self.last_draw_id()))
+
+    def rebuild(self) -> None:
+        self.connection.execute("DELETE FROM draw_features WHERE game = ?;", (str(self.game),))
+        self._index(DrawMatrix.load(self.connection, self.game))
+
+    def _index(self, matrix: DrawMatrix) -> None:
+        if not len(matrix):
+            return
+
+        features = draw_features(matrix.balls, get_game(self.game).max_ball)
+        game = str(self.game)
+        dates = matrix.dates.astype(str)
+        self.connection.executemany(
+            INSERT_FEATURES,
+            zip(
+                matrix.draw_ids.tolist(),
+                [game] * len(matrix),
+                dates.tolist(),
+                *(features[name].tolist() for name in FEATURES),
+            ),
+        )
+
+    def count(self, pattern: PatternFilter) -> int:
+        """
+        How many draws match ``pattern``, answered from the feature indexes.
+        """
+        where, params = pattern.where()
+        row = self.connection.execute(
+            f"SELECT COUNT(*) FROM draw_features WHERE game = ?{where};",
+            (str(self.game), *params),
+        ).fetchone()
+        return int(row[0])
+
+    def histogram(
+        self, feature: str, pattern: PatternFilter | None = None, width: int = 1
+    ) -> dict[int | str, int]:
+        """
+        How many draws matching ``pattern`` have every value of ``feature``, numeric
+        features are grouped in bins of ``width`` keyed by their lower bound.
+        """
+        if feature not in FEATURES:
+            raise ValueError(f"Unknown feature '{feature}', expected one of {', '.join(FEATURES)}")
+        if width < 1 or (width > 1 and feature == "decades"):
+            raise ValueError(f"Invalid bin width {width} for the '{feature}' feature")
+        key = feature if width == 1 else f"({feature} / {width}) * {width}"
+        where, params = (pattern or PatternFilter()).where()
+        rows = self.connection.execute(
+            f"""SELECT {key} AS value, COUNT(*) FROM draw_features WHERE game = ?{where}
+            GROUP BY value ORDER BY value;""",
+            (str(self.game), *params),
+        )
+        return dict(rows.fetchall())
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import cast
+
+import numpy as np
+
+from baloto.miloto.games import MAX_BALL
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+    from baloto.miloto.stats.matrix import DrawMatrix
+
+
+__all__ = ("MAX_LAG", "FollowCache", "FollowTensor")
+
+MAX_LAG = 10
+
+ARRAYS = ("draw_ids", "tail", "starts", "sources", "at", "at_targets", "within", "within_targets")
+
+
+class FollowTensor:
+    """
+    Counts of which balls follow which over the next draws.
+
+    For every lag ``k`` (1 to :data:`MAX_LAG`) and every pair of balls ``x``, ``y``:
+
+    - ``at[k - 1, x - 1, y - 1]`` counts the draws with ``x`` followed by ``y`` exactly
+      ``k`` draws later
+    - ``within[k - 1, x - 1, y - 1]`` counts the draws with ``x`` followed by ``y`` in any
+      of the next ``k`` draws
+
+    Only the draws with ``k`` draws after them are counted, ``starts`` holds how many
+    there are, ``sources`` how many of them had ``x`` and ``at_targets`` and
+    ``within_targets`` how many were followed by ``y`` whatever they had, which gives
+    the unconditional rate a conditional probability is compared to.
+
+    The counts are sums of shifted one-hot products, so new draws are added replaying
+    only the last :data:`MAX_LAG` draws kept in ``tail``.
+    """
+
+    def __init__(self, arrays: dict[str, NDArray[Any]] | None = None) -> None:
+        if arrays is None:
+            arrays = {
+                "draw_ids": np.empty(0, dtype=np.int64),
+                "tail": np.empty((0, MAX_BALL), dtype=np.bool_),
+                "starts": np.zeros(MAX_LAG, dtype=np.int64),
+                "sources": np.zeros((MAX_LAG, MAX_BALL), dtype=np.int64),
+                "at": np.zeros((MAX_LAG, MAX_BALL, MAX_BALL), dtype=np.int64),
+                "at_targets": np.zeros((MAX_LAG, MAX_BALL), dtype=np.int64),
+                "within": np.zeros((MAX_LAG, MAX_BALL, MAX_BALL), dtype=np.int64),
+                "within_targets": np.zeros((MAX_LAG, MAX_BALL), dtype=np.int64),
+            }
+        self.draw_ids: NDArray[np.int64] = arrays["draw_ids"]
+        self.tail: NDArray[np.bool_] = arrays["tail"]
+        self.starts: NDArray[np.int64] = arrays["starts"]
+        self.sources: NDArray[np.int64] = arrays["sources"]
+        self.at: NDArray[np.int64] = arrays["at"]
+        self.at_targets: NDArray[np.int64] = arrays["at_targets"]
+        self.within: NDArray[np.int64] = arrays["within"]
+        self.within_targets: NDArray[np.int64] = arrays["within_targets"]
+
+    def __len__(self) -> int:
+        return len(self.draw_ids)
+
+    def arrays(self) -> dict[str, NDArray[Any]]:
+        return {name: getattr(self, name) for name in ARRAYS}
+
+    @classmethod
+    def build(cls, matrix: DrawMatrix) -> FollowTensor:
+        tensor = cls()
+        tensor.extend(matrix)
+        return tensor
+
+    def extends(self, matrix: DrawMatrix) -> bool:
+        """
+        Whether ``matrix`` is the counted draws followed by new ones.
+        """
+        count = len(self)
+        return len(matrix) >= count and np.array_equal(matrix.draw_ids[:count], self.draw_ids)
+
+    def extend(self, matrix: DrawMatrix) -> None:
+        """
+        Counts the draws of ``matrix`` after the ones already counted.
+        """
+        if not self.extends(matrix):
+            raise ValueError("The draws do not extend the counted ones, rebuild the tensor")
+
+        count = len(self)
+        if len(matrix) == count:
+            return
+
+        offset = len(self.tail)
+        rows = np.concatenate([self.tail, matrix.onehot[count:]])
+        values = rows.astype(np.int64)
+        # Prefix sums answer "any of the next k draws" for every draw at once
+        cumulative = np.zeros((len(rows) + 1, MAX_BALL), dtype=np.int64)
+        np.cumsum(values, axis=0, out=cumulative[1:])
+
+        for lag in range(1, MAX_LAG + 1):
+            # Only the pairs whose later draw is new were not counted before
+            low, high = max(offset - lag, 0), len(rows) - lag
+            if high <= low:
+                continue
+            source = values[low:high]
+            target = values[low + lag : high + lag]
+            window = (
+                cumulative[low + lag + 1 : high + lag + 1] - cumulative[low + 1 : high + 1]
+            ) > 0
+            window = window.astype(np.int64)
+
+            index = lag - 1
+            self.starts[index] += high - low
+            self.sources[index] += source.sum(axis=0)
+            self.at[index] += source.T @ target
+            self.at_targets[index] += target.sum(axis=0)
+            self.within[index] += source.T @ window
+            self.within_targets[index] += window.sum(axis=0)
+
+        self.draw_ids = np.asarray(matrix.draw_ids, dtype=np.int64).copy()
+        self.tail = rows[-MAX_LAG:].copy()
+
+    def probabilities(self, ball: int, lag: int = 1, exact: bool = False) -> NDArray[np.float64]:
+        """
+        The probability of every ball following ``ball`` within ``lag`` draws, or exactly
+        ``lag`` draws later, indexed by ``ball - 1``.
+        """
+        counts, _ = self._counts(lag, exact)
+        seen = self.sources[lag - 1, ball - 1]
+        if not seen:
+            return np.zeros(MAX_BALL)
+        return cast("NDArray[np.float64]", counts[ball - 1] / seen)
+
+    def base_rates(self, lag: int = 1, exact: bool = False) -> NDArray[np.float64]:
+        """
+        The probability of every ball following any draw within ``lag`` draws, or exactly
+        ``lag`` draws later.
+        """
+        _, targets = self._counts(lag, exact)
+        starts = self.starts[lag - 1]
+        return targets / starts if starts else np.zeros(MAX_BALL)
+
+    def _counts(self, lag: int, exact: bool) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        if not 1 <= lag <= MAX_LAG:
+            raise ValueError(f"The lag must be between 1 and {MAX_LAG}, got {lag}")
+        if exact:
+            return self.at[lag - 1], self.at_targets[lag - 1]
+        return self.within[lag - 1], self.within_targets[lag - 1]
+
+
+class FollowCache:
+    """
+    Stores a :class:`FollowTensor` in a ``.npz`` file next to the database.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def get(self) -> FollowTensor | None:
+        try:
+            with np.load(self.path) as data:
+                arrays = {name: data[name] for name in ARRAYS}
+        except (OSError, ValueError, KeyError):
+            return None
+        return FollowTensor(arrays)
+
+    def put(self, tensor: FollowTensor) -> None:
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        with tmp.open("wb") as fp:
+            np.savez(fp, allow_pickle=False, **tensor.arrays())
+        os.replace(tmp, self.path)
+
+    def load(self, matrix: DrawMatrix) -> FollowTensor:
+        """
+        Returns the tensor of ``matrix``, extending the cached one with the new draws or
+        rebuilding it when older draws changed.
+        """
+        tensor = self.get()
+        if tensor is not None and tensor.extends(matrix):
+            if len(tensor) == len(matrix):
+                return tensor
+            tensor.extend(matrix)
+        else:
+            tensor = FollowTensor.build(matrix)
+        self.put(tensor)
+        return tensor
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.games import BALLS_PER_DRAW
+from baloto.miloto.games import MAX_BALL
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from baloto.miloto.stats.matrix import DrawMatrix
+
+
+__all__ = ("frequencies", "rolling_frequencies", "position_distribution")
+
+
+def frequencies(matrix: DrawMatrix) -> NDArray[np.int64]:
+    """
+    How many times every ball was drawn, index ``ball - 1``.
+    """
+    return matrix.onehot.sum(axis=0, dtype=np.int64)
+
+
+def rolling_frequencies(matrix: DrawMatrix, window: int) -> NDArray[np.int64]:
+    """
+    Ball frequencies over every window of ``window`` consecutive draws.
+
+    Row ``i`` holds the counts of draws ``i`` to ``i + window - 1``; computed from a
+    single cumulative sum so the cost does not depend on the window size.
+    """
+    if window < 1:
+        raise ValueError(f"The window must be a positive number, got {window}")
+
+    if len(matrix) < window:
+        return np.zeros((0, MAX_BALL), dtype=np.int64)
+
+    cumulative = np.zeros((len(matrix) + 1, MAX_BALL), dtype=np.int64)
+    np.cumsum(matrix.onehot, axis=0, out=cumulative[1:])
+    return cumulative[window:] - cumulative[:-window]
+
+
+def position_distribution(matrix: DrawMatrix) -> NDArray[np.int64]:
+    """
+    A ``(5, 43)`` matrix counting how many times every ball was drawn in every position.
+    """
+    offsets = np.arange(BALLS_PER_DRAW, dtype=np.intp) * MAX_BALL
+    indexes = offsets + matrix.balls.astype(np.intp) - 1
+    counts = np.bincount(indexes.ravel(), minlength=BALLS_PER_DRAW * MAX_BALL)
+    return counts.reshape(BALLS_PER_DRAW, MAX_BALL).astype(np.int64)
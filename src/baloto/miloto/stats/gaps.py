@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.games import MAX_BALL
+from baloto.miloto.stats.matrix import DrawMatrix
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from baloto.miloto.games import GameType
+
+
+__all__ = ("GapIndex", "BallGaps")
+
+UPSERT_LAST_SEEN = """
+    INSERT INTO ball_last_seen (game, ball, hits, last_seq, last_date, gap_sum, gap_max)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (game, ball) DO UPDATE SET
+        hits = hits + excluded.hits,
+        last_seq = excluded.last_seq,
+        last_date = excluded.last_date,
+        gap_sum = gap_sum + excluded.gap_sum,
+        gap_max = MAX(gap_max, excluded.gap_max);
+"""
+
+UPSERT_HISTOGRAM = """
+    INSERT INTO ball_gap_histogram (game, ball, gap, count) VALUES (?, ?, ?, ?)
+    ON CONFLICT (game, ball, gap) DO UPDATE SET count = count + excluded.count;
+"""
+
+UPSERT_STATE = """
+    INSERT INTO game_state (game, draws, last_draw_id, last_date) VALUES (?, ?, ?, ?)
+    ON CONFLICT (game) DO UPDATE SET
+        draws = excluded.draws,
+        last_draw_id = excluded.last_draw_id,
+        last_date = excluded.last_date;
+"""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BallGaps:
+    """
+    The gap report of a ball, gaps are the number of draws skipped between two hits.
+    """
+
+    ball: int
+    hits: int
+    current: int
+    mean: float
+    maximum: int
+    last_date: str | None
+
+
+class GapIndex:
+    """
+    Maintains the per ball last seen index of a game.
+
+    Draws are numbered by a per game sequence in chronological order, for every ball the
+    index keeps the sequence of its last hit, the sum and maximum of its gaps and a gap
+    histogram. Draws appended after the last indexed date are added incrementally, a
+    draw inserted in the middle of the history triggers a rebuild.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, game: GameType) -> None:
+        self.connection = connection
+        self.game = game
+
+    def state(self) -> tuple[int, int, str | None] | None:
+        return self.connection.execute(
+            "SELECT draws, last_draw_id, last_date FROM game_state WHERE game = ?;",
+            (str(self.game),),
+        ).fetchone()
+
+    def extend(self) -> None:
+        """
+        Adds the draws inserted since the index was last maintained.
+        """
+        state = self.state()
+        if state is None:
+            self.rebuild()
+            return
+
+        draws, last_draw_id, last_date = state
+        matrix = DrawMatrix.load(self.connection, self.game, after=last_draw_id)
+        if not len(matrix):
+            return
+
+        if last_date is not None and str(matrix.dates[0]) <= last_date:
+            self.rebuild()
+            return
+
+        self._index(matrix, base=draws)
+
+    def rebuild(self) -> None:
+        game = str(self.game)
+        self.connection.execute("DELETE FROM ball_last_seen WHERE game = ?;", (game,))
+        self.connection.execute("DELETE FROM ball_gap_histogram WHERE game = ?;", (game,))
+        self.connection.execute("DELETE FROM game_state WHERE game = ?;", (game,))
+        self._index(DrawMatrix.load(self.connection, self.game), base=0)
+
+    def _index(self, matrix: DrawMatrix, base: int) -> None:
+        game = str(self.game)
+        last_seq = np.full(MAX_BALL, -1, dtype=np.int64)
+        rows = self.connection.execute(
+            "SELECT ball, last_seq FROM ball_last_seen WHERE game = ?;", (game,)
+        )
+        for ball, seq in rows:
+            last_seq[ball - 1] = seq
+
+        # Hits sorted by ball and then by draw sequence
+        balls, draws = np.nonzero(matrix.onehot.T)
+        sequences = draws.astype(np.int64) + base
+        previous = np.empty_like(sequences)
+        previous[1:] = sequences[:-1]
+        first = np.ones(balls.size, dtype=np.bool_)
+        first[1:] = balls[1:] != balls[:-1]
+        previous[first] = last_seq[balls[first]]
+
+        has_gap = previous >= 0
+        gaps = sequences - previous - 1
+        gap_balls, gaps = balls[has_gap], gaps[has_gap]
+
+        hits = np.bincount(balls, minlength=MAX_BALL)
+        gap_sum = np.bincount(gap_balls, weights=gaps, minlength=MAX_BALL).astype(np.int64)
+        gap_max = np.zeros(MAX_BALL, dtype=np.int64)
+        np.maximum.at(gap_max, gap_balls, gaps)
+        last = np.full(MAX_BALL, -1, dtype=np.int64)
+        np.maximum.at(last, balls, sequences)
+
+        dates = matrix.dates.astype(str)
+        self.connection.executemany(
+            UPSERT_LAST_SEEN,
+            [
+                (
+                    game,
+                    int(ball) + 1,
+                    int(hits[ball]),
+                    int(last[ball]),
+                    str(dates[last[ball] - base]),
+                    int(gap_sum[ball]),
+                    int(gap_max[ball]),
+                )
+                for ball in np.flatnonzero(hits)
+            ],
+        )
+
+        span = len(matrix) + base
+        keys, counts = np.unique(gap_balls * span + gaps, return_counts=True)
+        self.connection.executemany(
+            UPSERT_HISTOGRAM,
+            [
+                (game, int(key // span) + 1, int(key % span), int(count))
+                for key, count in zip(keys, counts)
+            ],
+        )
+        self.connection.execute(
+            UPSERT_STATE,
+            (
+                game,
+                base + len(matrix),
+                matrix.last_draw_id,
+                str(dates[-1]) if len(matrix) else None,
+            ),
+        )
+
+    def report(self) -> list[BallGaps]:
+        """
+        Reads the gap report of every ball from the index.
+        """
+        state = self.state()
+        if state is None:
+            self.rebuild()
+            state = self.state()
+        draws = state[0] if state else 0
+
+        rows = self.connection.execute(
+            """SELECT ball, hits, last_seq, last_date, gap_sum, gap_max
+            FROM ball_last_seen WHERE game = ? ORDER BY ball;""",
+            (str(self.game),),
+        )
+        return [
+            BallGaps(
+                ball=ball,
+                hits=hits,
+                current=draws - 1 - last_seq,
+                mean=gap_sum / (hits - 1) if hits > 1 else 0.0,
+                maximum=gap_max,
+                last_date=last_date,
+            )
+            for ball, hits, last_seq, last_date, gap_sum, gap_max in rows
+        ]
+
+    def distribution(self, ball: int) -> dict[int, int]:
+        rows = self.connection.execute(
+            "SELECT gap, count FROM ball_gap_histogram WHERE game = ? AND ball = ? ORDER BY gap;",
+            (str(self.game), ball),
+        )
+        return dict(rows.fetchall())
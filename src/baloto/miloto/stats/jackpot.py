@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from numpy.typing import NDArray
+
+    from baloto.miloto.games import GameType
+
+
+__all__ = ("JackpotSeries", "rolling_mean", "rolling_max", "run_lengths")
+
+
+def rolling_mean(values: NDArray, window: int) -> NDArray[np.float64]:
+    """
+    The mean of every ``window`` consecutive values, ``len(values) - window + 1`` of them,
+    from a single cumulative sum.
+    """
+    if window < 1:
+        raise ValueError(f"The window must be a positive number, got {window}")
+    if len(values) < window:
+        return np.zeros(0, dtype=np.float64)
+
+    cumulative = np.zeros(len(values) + 1, dtype=np.float64)
+    np.cumsum(values, out=cumulative[1:])
+    return (cumulative[window:] - cumulative[:-window]) / window
+
+
+def rolling_max(values: NDArray, window: int) -> NDArray:
+    """
+    The maximum of every ``window`` consecutive values in O(n).
+
+    The values are cut in blocks of ``window``, a window spans at most two blocks so its
+    maximum is the suffix maximum of the first block and the prefix maximum of the second
+    (van Herk/Gil-Werman), both computed with :func:`numpy.maximum.accumulate`.
+    """
+    if window < 1:
+        raise ValueError(f"The window must be a positive number, got {window}")
+    size = len(values)
+    if size < window:
+        return np.zeros(0, dtype=values.dtype)
+
+    padding = -size % window
+    lowest = np.iinfo(values.dtype).min if values.dtype.kind in "iu" else -np.inf
+    blocks = np.concatenate([values, np.full(padding, lowest, dtype=values.dtype)])
+    blocks = blocks.reshape(-1, window)
+    prefix = np.maximum.accumulate(blocks, axis=1).ravel()
+    suffix = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    return np.maximum(suffix[: size - window + 1], prefix[window - 1 : size])
+
+
+def run_lengths(flags: NDArray[np.bool_]) -> NDArray[np.int64]:
+    """
+    The lengths of the runs of consecutive ``True`` values, in order.
+    """
+    padded = np.concatenate([[False], flags, [False]]).astype(np.int8)
+    edges = np.flatnonzero(np.diff(padded))
+    return (edges[1::2] - edges[::2]).astype(np.int64)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class JackpotSeries:
+    """
+    The accumulated jackpot of every draw of a game in date order.
+
+    A draw whose jackpot grew is a rollover, a jackpot that went down was won and the
+    next draw restarts from the base amount.
+    """
+
+    dates: NDArray[np.datetime64]
+    accumulated: NDArray[np.int64]
+
+    def __len__(self) -> int:
+        return len(self.accumulated)
+
+    @classmethod
+    def load(cls, connection: sqlite3.Connection, game: GameType) -> JackpotSeries:
+        rows = connection.execute(
+            """SELECT lottery_date, accumulated FROM sessions WHERE game = ?
+            ORDER BY lottery_date, draw_id;""",
+            (str(game),),
+        ).fetchall()
+        dates, accumulated = zip(*rows) if rows else ((), ())
+        return cls(
+            dates=np.array(dates, dtype="datetime64[D]"),
+            accumulated=np.array(accumulated, dtype=np.int64),
+        )
+
+    @property
+    def changes(self) -> NDArray[np.int64]:
+        return np.diff(self.accumulated)
+
+    @property
+    def rollovers(self) -> NDArray[np.bool_]:
+        """
+        Whether the jackpot of every draw after the first grew.
+        """
+        return self.changes > 0
+
+    @property
+    def growth_rates(self) -> NDArray[np.float64]:
+        """
+        The relative growth of every rollover.
+        """
+        previous = self.accumulated[:-1].astype(np.float64)
+        valid = self.rollovers & (previous > 0)
+        return self.changes[valid] / previous[valid]
+
+    def mean_growth(self) -> float:
+        """
+        The mean amount the jackpot grows on a rollover.
+        """
+        growth = self.changes[self.rollovers]
+        return float(growth.mean()) if growth.size else 0.0
+
+    def median_growth_rate(self) -> float:
+        rates = self.growth_rates
+        return float(np.median(rates)) if rates.size else 0.0
+
+    def streaks(self) -> NDArray[np.int64]:
+        """
+        The lengths of the rollover streaks, the last one may still be running.
+        """
+        return run_lengths(self.rollovers)
+
+    def current_streak(self) -> int:
+        rollovers = self.rollovers
+        if not rollovers.size or not rollovers[-1]:
+            return 0
+        misses = np.flatnonzero(~rollovers)
+        return int(rollovers.size - (misses[-1] + 1 if misses.size else 0))
+
+    def rolling_mean(self, window: int) -> NDArray[np.float64]:
+        return rolling_mean(self.accumulated, window)
+
+    def rolling_max(self, window: int) -> NDArray[np.int64]:
+        return rolling_max(self.accumulated, window)
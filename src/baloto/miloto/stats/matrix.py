@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.games import BALLS_PER_DRAW
+from baloto.miloto.games import MAX_BALL
+from baloto.miloto.games import GameType
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from numpy.typing import NDArray
+
+
+__all__ = ("DrawMatrix",)
+
+SELECT_DRAWS = """
+    SELECT s.draw_id, s.lottery_date, d.ball
+    FROM sessions s JOIN draw_numbers d ON d.draw_id = s.draw_id
+    WHERE s.game = ? AND s.draw_id > ?
+    ORDER BY s.lottery_date, s.draw_id, d.position;
+"""
+
+
+class DrawMatrix:
+    """
+    The draw history of a game as dense NumPy arrays.
+
+    ``balls`` is a ``(draws, 5)`` ``uint8`` matrix in drawn order, ``onehot`` is the
+    ``(draws, 43)`` boolean matrix where column ``ball - 1`` is set for every drawn ball.
+    Rows are sorted chronologically.
+    """
+
+    __slots__ = ("game", "draw_ids", "dates", "balls", "_onehot")
+
+    def __init__(
+        self,
+        game: GameType,
+        balls: NDArray[np.uint8],
+        draw_ids: NDArray[np.int64] | None = None,
+        dates: NDArray[np.datetime64] | None = None,
+    ) -> None:
+        balls = np.asarray(balls, dtype=np.uint8).reshape(-1, BALLS_PER_DRAW)
+        count = balls.shape[0]
+
+        self.game = game
+        self.balls = balls
+        self.draw_ids = np.arange(1, count + 1, dtype=np.int64) if draw_ids is None else draw_ids
+        self.dates = np.zeros(count, dtype="datetime64[D]") if dates is None else dates
+        self._onehot: NDArray[np.bool_] | None = None
+
+    def __len__(self) -> int:
+        return self.balls.shape[0]
+
+    def __repr__(self) -> str:
+        return f"<DrawMatrix {str(self.game)!r} draws={len(self)}>"
+
+    @property
+    def onehot(self) -> NDArray[np.bool_]:
+        if self._onehot is None:
+            onehot = np.zeros((len(self), MAX_BALL), dtype=np.bool_)
+            rows = np.repeat(np.arange(len(self)), BALLS_PER_DRAW)
+            onehot[rows, self.balls.ravel().astype(np.intp) - 1] = True
+            self._onehot = onehot
+        return self._onehot
+
+    def tail(self, draws: int) -> DrawMatrix:
+        """
+        Returns a view over the last ``draws`` draws.
+        """
+        start = max(len(self) - draws, 0)
+        matrix = DrawMatrix(
+            self.game, self.balls[start:], self.draw_ids[start:], self.dates[start:]
+        )
+        if self._onehot is not None:
+            matrix._onehot = self._onehot[start:]
+        return matrix
+
+    @property
+    def last_draw_id(self) -> int:
+        return int(self.draw_ids.max()) if len(self) else 0
+
+    @classmethod
+    def load(cls, connection: sqlite3.Connection, game: GameType, after: int = 0) -> DrawMatrix:
+        """
+        Loads every draw of ``game`` that has its balls stored.
+
+        :param after: only load the draws with a ``draw_id`` greater than this one
+        """
+        rows = connection.execute(SELECT_DRAWS, (str(game), after)).fetchall()
+        if not rows:
+            return cls(game, np.empty((0, BALLS_PER_DRAW), dtype=np.uint8))
+
+        draw_ids, dates, balls = zip(*rows)
+        keys = slice(0, None, BALLS_PER_DRAW)
+        return cls(
+            game,
+            np.fromiter(balls, dtype=np.uint8, count=len(balls)),
+            draw_ids=np.array(draw_ids[keys], dtype=np.int64),
+            dates=np.array(dates[keys], dtype="datetime64[D]"),
+        )
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import os
+from math import comb
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.combinations import COMBINATIONS
+from baloto.miloto.combinations import rank
+from baloto.miloto.combinations import unranks
+from baloto.miloto.database.queries import date_range
+from baloto.miloto.games import BALLS_PER_DRAW
+from baloto.miloto.games import ball_mask
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from datetime import date
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+    from baloto.miloto.games import GameType
+    from baloto.miloto.stats.features import PatternFilter
+
+
+__all__ = ("CHUNK_SIZE", "Occupancy", "OccupancyCache", "never_drawn")
+
+# Ranks unpacked at a time while streaming, 8 KiB of bitmap
+CHUNK_SIZE = 1 << 16
+
+NBYTES = (COMBINATIONS + 7) // 8
+
+
+class Occupancy:
+    """
+    One bit per 5-ball combination, set when the combination was drawn.
+
+    Bit ``r`` (little endian within every byte) belongs to the combination ranked ``r``
+    by :mod:`baloto.miloto.combinations`, the whole space fits in about 120 KB. Bitmaps
+    combine with ``|``, ``&``, ``-`` and ``~`` to merge games or date ranges.
+    """
+
+    __slots__ = ("bits",)
+
+    def __init__(self, bits: NDArray[np.uint8] | None = None) -> None:
+        self.bits = np.zeros(NBYTES, dtype=np.uint8) if bits is None else bits
+        if self.bits.shape != (NBYTES,):
+            raise ValueError(f"An occupancy bitmap has {NBYTES} bytes, got {self.bits.shape}")
+
+    def __repr__(self) -> str:
+        return f"<Occupancy {len(self)} of {COMBINATIONS}>"
+
+    @classmethod
+    def from_ranks(cls, ranks: Iterable[int]) -> Occupancy:
+        flags = np.zeros(NBYTES * 8, dtype=np.bool_)
+        flags[np.fromiter(ranks, dtype=np.int64)] = True
+        return cls(np.packbits(flags, bitorder="little"))
+
+    @classmethod
+    def query(
+        cls,
+        connection: sqlite3.Connection,
+        game: GameType,
+        since: date | None = None,
+        until: date | None = None,
+    ) -> Occupancy:
+        """
+        The combinations drawn in ``game`` between ``since`` and ``until``, read from the
+        ``sessions_game_rank`` index.
+        """
+        clauses, params = date_range(since, until)
+        cursor = connection.execute(
+            f"SELECT rank FROM sessions WHERE game = ? AND rank IS NOT NULL{clauses};",
+            (str(game), *params),
+        )
+        ranks = np.array([row[0] for row in cursor.fetchall()], dtype=np.int64)
+        return cls.from_ranks(ranks)
+
+    def __len__(self) -> int:
+        return int(np.bitwise_count(self.bits).sum(dtype=np.int64))
+
+    def __contains__(self, balls: tuple[int, ...]) -> bool:
+        value = rank(balls)
+        return bool(self.bits[value >> 3] >> (value & 7) & 1)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Occupancy):
+            return NotImplemented
+        return np.array_equal(self.bits, other.bits)
+
+    def __or__(self, other: Occupancy) -> Occupancy:
+        return Occupancy(self.bits | other.bits)
+
+    def __and__(self, other: Occupancy) -> Occupancy:
+        return Occupancy(self.bits & other.bits)
+
+    def __sub__(self, other: Occupancy) -> Occupancy:
+        return Occupancy(self.bits & ~other.bits)
+
+    def __invert__(self) -> Occupancy:
+        bits = ~self.bits
+        # The padding bits past the last rank stay clear
+        bits[-1] &= np.uint8((1 << (COMBINATIONS - (NBYTES - 1) * 8)) - 1)
+        return Occupancy(bits)
+
+    def ranks(
+        self, drawn: bool = True, stop: int = COMBINATIONS, chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[NDArray[np.int64]]:
+        """
+        Streams the ranks below ``stop`` that are set, or clear with ``drawn=False``,
+        unpacking ``chunk_size`` bits at a time.
+        """
+        chunk_size -= chunk_size % 8
+        for start in range(0, stop, chunk_size):
+            end = min(start + chunk_size, stop)
+            flags = np.unpackbits(self.bits[start // 8 : (end + 7) // 8], bitorder="little")
+            flags = flags[: end - start].astype(np.bool_)
+            yield np.flatnonzero(flags if drawn else ~flags) + start
+
+
+class OccupancyCache:
+    """
+    Stores the occupancy bitmap of a game in a ``.npz`` file keyed by the draw table
+    fingerprint.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def get(self, fingerprint: tuple[int, int]) -> Occupancy | None:
+        try:
+            with np.load(self.path) as data:
+                if tuple(data["fingerprint"].tolist()) != tuple(fingerprint):
+                    return None
+                return Occupancy(data["bits"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, fingerprint: tuple[int, int], occupancy: Occupancy) -> None:
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        with tmp.open("wb") as fp:
+            np.savez(fp, fingerprint=np.array(fingerprint, dtype=np.int64), bits=occupancy.bits)
+        os.replace(tmp, self.path)
+
+    def load(self, connection: sqlite3.Connection, game: GameType) -> Occupancy:
+        from baloto.miloto.database.cache import fingerprint
+
+        key = fingerprint(connection, game)
+        occupancy = self.get(key)
+        if occupancy is None:
+            occupancy = Occupancy.query(connection, game)
+            self.put(key, occupancy)
+        return occupancy
+
+
+def never_drawn(
+    occupancy: Occupancy,
+    max_ball: int,
+    pattern: PatternFilter | None = None,
+    include: Iterable[int] = (),
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[NDArray[np.uint8]]:
+    """
+    Streams, in rank order, the ``(combinations, 5)`` sorted balls up to ``max_ball``
+    missing from ``occupancy`` that contain every ball of ``include`` and match ``pattern``.
+    """
+    from baloto.miloto.stats.features import draw_features
+
+    required = np.uint64(ball_mask(tuple(include)))
+    bits = np.uint64(1) << np.arange(max_ball, dtype=np.uint64)
+    # Ranks are colex, the combinations of balls up to max_ball are the first C(max_ball, 5)
+    for ranks in occupancy.ranks(False, comb(max_ball, BALLS_PER_DRAW), chunk_size):
+        balls = unranks(ranks)
+        if required:
+            masks = np.bitwise_or.reduce(bits[balls.astype(np.intp) - 1], axis=1)
+            balls = balls[(masks & required) == required]
+        if pattern is not None and len(balls):
+            balls = balls[pattern.matches(draw_features(balls, max_ball))]
+        if len(balls):
+            yield balls
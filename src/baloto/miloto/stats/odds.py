@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import dataclasses
+from fractions import Fraction
+from functools import cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.games import GameType
+from baloto.miloto.games import MAX_BALL
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+    from numpy.typing import NDArray
+
+    from baloto.miloto.games import Game
+
+
+__all__ = (
+    "PrizeTier",
+    "TierOdds",
+    "Odds",
+    "PRIZE_TIERS",
+    "TICKET_PRICES",
+    "binomial",
+    "pascal_triangle",
+)
+
+
+@cache
+def pascal_triangle(rows: int = MAX_BALL) -> tuple[tuple[int, ...], ...]:
+    """
+    Builds the rows ``0..rows`` of Pascal's triangle with Python integers, exact for any size.
+    """
+    triangle: list[tuple[int, ...]] = [(1,)]
+    for _ in range(rows):
+        previous = triangle[-1]
+        triangle.append((1, *(a + b for a, b in zip(previous, previous[1:])), 1))
+    return tuple(triangle)
+
+
+def binomial(n: int, k: int) -> int:
+    if k < 0 or k > n:
+        return 0
+    triangle = pascal_triangle(max(n, MAX_BALL))
+    return triangle[n][k]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PrizeTier:
+    """
+    A prize tier, ``prize`` is ``None`` for the jackpot which pays the accumulated amount.
+    """
+
+    hits: int
+    superbalota: bool = False
+    prize: int | None = None
+
+    @property
+    def is_jackpot(self) -> bool:
+        return self.prize is None
+
+    @property
+    def label(self) -> str:
+        return f"{self.hits} + SB" if self.superbalota else str(self.hits)
+
+
+# Reference prices and fixed prizes in COP, the operator adjusts them over time
+TICKET_PRICES: dict[GameType, int] = {
+    GameType.MILOTO: 4_000,
+    GameType.BALOTO: 5_700,
+    GameType.REVANCHA: 2_100,
+}
+
+_BALOTO_TIERS = (
+    PrizeTier(5, True),
+    PrizeTier(5, prize=50_000_000),
+    PrizeTier(4, True, prize=2_000_000),
+    PrizeTier(4, prize=150_000),
+    PrizeTier(3, True, prize=60_000),
+    PrizeTier(3, prize=10_000),
+    PrizeTier(2, True, prize=10_000),
+    PrizeTier(1, True, prize=5_700),
+    PrizeTier(0, True, prize=5_700),
+)
+
+PRIZE_TIERS: dict[GameType, tuple[PrizeTier, ...]] = {
+    GameType.MILOTO: (
+        PrizeTier(5),
+        PrizeTier(4, prize=250_000),
+        PrizeTier(3, prize=15_000),
+        PrizeTier(2, prize=4_000),
+    ),
+    GameType.BALOTO: _BALOTO_TIERS,
+    GameType.REVANCHA: _BALOTO_TIERS,
+}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class TierOdds:
+    tier: PrizeTier
+    probability: Fraction
+
+    @property
+    def one_in(self) -> Fraction:
+        return 1 / self.probability
+
+
+class Odds:
+    """
+    Exact probabilities and expected value of a ticket for every prize tier of a game.
+    """
+
+    def __init__(
+        self,
+        game: Game,
+        price: int | None = None,
+        tiers: tuple[PrizeTier, ...] | None = None,
+    ) -> None:
+        self.game = game
+        self.price = TICKET_PRICES[game.type] if price is None else price
+        self.tiers = tuple(
+            TierOdds(tier, self.probability(tier))
+            for tier in (PRIZE_TIERS[game.type] if tiers is None else tiers)
+        )
+
+    @property
+    def combinations(self) -> int:
+        return binomial(self.game.max_ball, self.game.balls)
+
+    def probability(self, tier: PrizeTier) -> Fraction:
+        """
+        The hypergeometric probability of exactly ``tier.hits`` hits, times the probability
+        of matching (or missing) the superbalota when the game has one.
+        """
+        balls = self.game.balls
+        probability = Fraction(
+            binomial(balls, tier.hits) * binomial(self.game.max_ball - balls, balls - tier.hits),
+            self.combinations,
+        )
+        if self.game.max_superbalota is not None:
+            match = Fraction(1, self.game.max_superbalota)
+            probability *= match if tier.superbalota else 1 - match
+        return probability
+
+    @property
+    def jackpot_probability(self) -> Fraction:
+        return sum((odds.probability for odds in self.tiers if odds.tier.is_jackpot), Fraction())
+
+    @property
+    def win_probability(self) -> Fraction:
+        return sum((odds.probability for odds in self.tiers), Fraction())
+
+    @property
+    def fixed_value(self) -> Fraction:
+        """
+        The expected winnings of the fixed prize tiers.
+        """
+        # The jackpot is the tier without a fixed prize
+        return sum(
+            (
+                odds.probability * odds.tier.prize
+                for odds in self.tiers
+                if odds.tier.prize is not None
+            ),
+            Fraction(),
+        )
+
+    def expected_value(self, jackpot: int) -> Fraction:
+        """
+        The exact expected net value of one ticket when the jackpot pays ``jackpot``.
+        """
+        return self.jackpot_probability * jackpot + self.fixed_value - self.price
+
+    def expected_values(self, jackpots: ArrayLike) -> NDArray[np.float64]:
+        """
+        The expected net value for every jackpot in ``jackpots`` at once.
+        """
+        jackpots = np.asarray(jackpots, dtype=np.float64)
+        return jackpots * float(self.jackpot_probability) + float(self.fixed_value - self.price)
+
+    def break_even(self) -> Fraction:
+        """
+        The jackpot from which a ticket has a positive expected value.
+        """
+        return (self.price - self.fixed_value) / self.jackpot_probability
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.games import BALLS_PER_DRAW
+from baloto.miloto.stats.frequency import frequencies
+from baloto.miloto.stats.frequency import position_distribution
+from baloto.miloto.stats.odds import binomial
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+    from baloto.miloto.stats.matrix import DrawMatrix
+
+
+__all__ = (
+    "TestResult",
+    "RandomnessCache",
+    "chi2_sf",
+    "normal_sf",
+    "run_battery",
+    "TESTS",
+)
+
+
+def _upper_gamma(a: float, x: float) -> float:
+    """
+    The regularized upper incomplete gamma function ``Q(a, x)``, by its series below
+    ``a + 1`` and by Lentz's continued fraction above.
+    """
+    if x <= 0:
+        return 1.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+
+def chi2_sf(statistic: float, dof: int) -> float:
+    """
+    The probability of a chi-square statistic at least as large, with ``dof`` degrees.
+    """
+    return _upper_gamma(dof / 2, statistic / 2)
+
+
+def normal_sf(z: float) -> float:
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class TestResult:
+    name: str
+    statistic: float
+    p_value: float
+    dof: int | None = None
+    detail: str = ""
+
+    def passed(self, alpha: float = 0.01) -> bool:
+        return self.p_value >= alpha
+
+
+def _chi_square(observed: NDArray, expected: NDArray) -> tuple[float, int]:
+    valid = expected > 0
+    statistic = float((((observed - expected) ** 2)[valid] / expected[valid]).sum())
+    return statistic, int(valid.sum()) - 1
+
+
+def uniformity(matrix: DrawMatrix, max_ball: int) -> TestResult:
+    """
+    Chi-square of the ball frequencies against ``5 / max_ball`` of the draws each.
+    """
+    observed = frequencies(matrix)[:max_ball].astype(np.float64)
+    expected = np.full(max_ball, len(matrix) * BALLS_PER_DRAW / max_ball)
+    statistic, dof = _chi_square(observed, expected)
+    hottest = int(observed.argmax()) + 1
+    return TestResult(
+        "Uniformidad (chi²)", statistic, chi2_sf(statistic, dof), dof, f"más frecuente {hottest}"
+    )
+
+
+def runs(matrix: DrawMatrix, max_ball: int) -> TestResult:
+    """
+    Wald-Wolfowitz runs test of the draw sums above and below their median.
+    """
+    sums = matrix.balls.astype(np.int64).sum(axis=1)
+    above = sums[sums != np.median(sums)] > np.median(sums)
+    n1, n2 = int(above.sum()), int((~above).sum())
+    if not n1 or not n2:
+        return TestResult("Rachas (suma)", 0.0, 1.0, detail="serie constante")
+
+    count = 1 + int(np.count_nonzero(above[1:] != above[:-1]))
+    n = n1 + n2
+    mean = 2 * n1 * n2 / n + 1
+    variance = 2 * n1 * n2 * (2 * n1 * n2 - n) / (n * n * (n - 1))
+    z = (count - mean) / math.sqrt(variance) if variance > 0 else 0.0
+    return TestResult("Rachas (suma)", z, 2 * normal_sf(abs(z)), detail=f"{count} rachas")
+
+
+def serial_correlation(matrix: DrawMatrix, max_ball: int) -> TestResult:
+    """
+    Lag one autocorrelation of the draw sums, ``r * sqrt(n)`` is standard normal.
+    """
+    sums = matrix.balls.astype(np.float64).sum(axis=1)
+    centered = sums - sums.mean()
+    denominator = float((centered**2).sum())
+    r = float((centered[1:] * centered[:-1]).sum()) / denominator if denominator else 0.0
+    z = r * math.sqrt(len(sums))
+    return TestResult("Correlación serial", r, 2 * normal_sf(abs(z)), detail=f"z = {z:.3f}")
+
+
+def repeats(matrix: DrawMatrix, max_ball: int) -> TestResult:
+    """
+    Chi-square of the balls repeated from the previous draw against the hypergeometric law.
+    """
+    onehot = matrix.onehot[:, :max_ball]
+    shared = (onehot[1:] & onehot[:-1]).sum(axis=1)
+    observed = np.bincount(shared, minlength=BALLS_PER_DRAW + 1).astype(np.float64)
+    total = binomial(max_ball, BALLS_PER_DRAW)
+    law = np.array(
+        [
+            binomial(BALLS_PER_DRAW, k) * binomial(max_ball - BALLS_PER_DRAW, BALLS_PER_DRAW - k)
+            for k in range(BALLS_PER_DRAW + 1)
+        ],
+        dtype=np.float64,
+    )
+    expected = law / total * len(shared)
+    # Two or more repeated balls are rare, they share one bin
+    observed = np.append(observed[:2], observed[2:].sum())
+    expected = np.append(expected[:2], expected[2:].sum())
+    statistic, dof = _chi_square(observed, expected)
+    return TestResult(
+        "Repetidas del sorteo anterior",
+        statistic,
+        chi2_sf(statistic, dof),
+        dof,
+        f"media {shared.mean():.3f}",
+    )
+
+
+def positions(matrix: DrawMatrix, max_ball: int) -> list[TestResult]:
+    """
+    Chi-square of every draw position. Sorted draws follow the order statistics law, the
+    ``k``-th smallest ball is ``b`` with probability ``C(b-1, k-1) C(N-b, 5-k) / C(N, 5)``.
+    """
+    distribution = position_distribution(matrix)[:, :max_ball].astype(np.float64)
+    balls = np.arange(1, max_ball + 1)
+    is_sorted = bool((np.diff(matrix.balls.astype(np.int16), axis=1) > 0).all())
+    total = binomial(max_ball, BALLS_PER_DRAW)
+
+    results = []
+    for position, observed in enumerate(distribution, start=1):
+        if is_sorted:
+            law = np.array(
+                [
+                    binomial(b - 1, position - 1)
+                    * binomial(max_ball - b, BALLS_PER_DRAW - position)
+                    for b in balls
+                ],
+                dtype=np.float64,
+            )
+            expected = law / total * len(matrix)
+        else:
+            expected = np.full(max_ball, len(matrix) / max_ball)
+        statistic, dof = _chi_square(observed, expected)
+        results.append(
+            TestResult(
+                f"Posición {position}",
+                statistic,
+                chi2_sf(statistic, dof),
+                dof,
+                "orden" if is_sorted else "uniforme",
+            )
+        )
+    return results
+
+
+TESTS: tuple[Callable[[DrawMatrix, int], TestResult | list[TestResult]], ...] = (
+    uniformity,
+    runs,
+    serial_correlation,
+    repeats,
+    positions,
+)
+
+
+def run_battery(matrix: DrawMatrix, max_ball: int, workers: int | None = None) -> list[TestResult]:
+    """
+    Runs every test of :data:`TESTS` on a thread pool, NumPy releases the GIL in the heavy
+    reductions. Results keep the order of :data:`TESTS`.
+    """
+    workers = workers or min(len(TESTS), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        outcomes = list(pool.map(lambda test: test(matrix, max_ball), TESTS))
+
+    results: list[TestResult] = []
+    for outcome in outcomes:
+        results.extend(outcome if isinstance(outcome, list) else [outcome])
+    return results
+
+
+class RandomnessCache:
+    """
+    Stores the battery results in a JSON file keyed by the draw table fingerprint.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def get(self, fingerprint: tuple[int, int]) -> list[TestResult] | None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if tuple(data.get("fingerprint", ())) != tuple(fingerprint):
+            return None
+        return [TestResult(**result) for result in data["results"]]
+
+    def put(self, fingerprint: tuple[int, int], results: list[TestResult]) -> None:
+        data = {
+            "fingerprint": list(fingerprint),
+            "results": [dataclasses.asdict(result) for result in results],
+        }
+        try:
+            tmp = self.path.with_name(f"{self.path.name}.tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            # A read-only cache directory only costs running the battery every time
+            pass
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.games import BALLS_PER_DRAW
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from baloto.miloto.database.tickets import MaskTable
+
+
+__all__ = ("TicketScores", "score_tickets")
+
+# Ticket x draw pairs scored per block, small enough for the hit matrix to stay in cache
+_BLOCK_SIZE = 1 << 16
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class TicketScores:
+    """
+    ``histogram[hits, superbalota]`` counts every ticket and draw pair, the ``ticket``,
+    ``draw``, ``hits`` and ``superbalota`` arrays list the pairs with at least ``min_hits``.
+    """
+
+    histogram: NDArray[np.int64]
+    ticket: NDArray[np.intp]
+    draw: NDArray[np.intp]
+    hits: NDArray[np.uint8]
+    superbalota: NDArray[np.bool_]
+
+    def __len__(self) -> int:
+        return len(self.ticket)
+
+
+def _score_block(
+    tickets: NDArray[np.uint64], draws: NDArray[np.uint64], min_hits: int
+) -> tuple[NDArray[np.int64], NDArray[np.intp], NDArray[np.uint8]]:
+    hits = np.bitwise_count(tickets[:, None] & draws[None, :]).ravel()
+    counts = np.zeros(BALLS_PER_DRAW + 1, dtype=np.int64)
+    for value in range(1, BALLS_PER_DRAW + 1):
+        counts[value] = np.count_nonzero(hits == value)
+    counts[0] = hits.size - counts.sum()
+    winners = np.flatnonzero(hits >= min_hits)
+    return counts, winners, hits[winners]
+
+
+def _score(
+    tickets: NDArray[np.uint64], draws: NDArray[np.uint64], min_hits: int
+) -> tuple[NDArray[np.int64], NDArray[np.intp], NDArray[np.intp], NDArray[np.uint8]]:
+    """
+    Scores ``tickets`` x ``draws`` in blocks, NumPy releases the GIL so blocks run in threads.
+    """
+    step = max(1, _BLOCK_SIZE // max(1, len(draws)))
+    starts = range(0, len(tickets), step)
+
+    def score(start: int) -> tuple[NDArray[np.int64], NDArray[np.intp], NDArray[np.uint8]]:
+        return _score_block(tickets[start : start + step], draws, min_hits)
+
+    if (os.cpu_count() or 1) == 1 or len(starts) == 1:
+        blocks = list(map(score, starts))
+    else:
+        with ThreadPoolExecutor() as pool:
+            blocks = list(pool.map(score, starts))
+
+    counts = np.zeros(BALLS_PER_DRAW + 1, dtype=np.int64)
+    ticket, draw, hits = [np.empty(0, np.intp)], [np.empty(0, np.intp)], [np.empty(0, np.uint8)]
+    for start, (block_counts, winners, block_hits) in zip(starts, blocks):
+        counts += block_counts
+        ticket.append(winners // len(draws) + start)
+        draw.append(winners % len(draws))
+        hits.append(block_hits)
+    return counts, np.concatenate(ticket), np.concatenate(draw), np.concatenate(hits)
+
+
+def score_tickets(tickets: MaskTable, draws: MaskTable, min_hits: int = 3) -> TicketScores:
+    """
+    Scores every ticket against every draw with ``popcount(ticket & draw)``.
+
+    Superbalota matches only happen between a ticket and a draw with the same superbalota,
+    so they are counted on those sub-blocks instead of the whole ticket x draw matrix.
+    """
+    histogram = np.zeros((BALLS_PER_DRAW + 1, 2), dtype=np.int64)
+    counts, ticket, draw, hits = _score(tickets.masks, draws.masks, min_hits)
+
+    for superbalota in np.unique(draws.superbalota[draws.superbalota > 0]):
+        matched, *_ = _score(
+            tickets.masks[tickets.superbalota == superbalota],
+            draws.masks[draws.superbalota == superbalota],
+            BALLS_PER_DRAW + 1,
+        )
+        histogram[:, 1] += matched
+    histogram[:, 0] = counts - histogram[:, 1]
+
+    ticket_sb = tickets.superbalota[ticket]
+    return TicketScores(
+        histogram,
+        ticket,
+        draw,
+        hits,
+        (ticket_sb > 0) & (ticket_sb == draws.superbalota[draw]),
+    )
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+from concurrent.futures import ProcessPoolExecutor
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.games import BALLS_PER_DRAW
+from baloto.miloto.stats.frequency import frequencies
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from baloto.miloto.games import Game
+    from baloto.miloto.stats.matrix import DrawMatrix
+
+
+__all__ = ("Strategy", "SimulationResult", "Simulator", "pick_ticket")
+
+# Draws simulated per task, fixed so results do not depend on the number of workers
+CHUNK_SIZE = 100_000
+
+
+class Strategy(StrEnum):
+    HOT = "hot"
+    COLD = "cold"
+    RANDOM = "random"
+    PAIRS = "pairs"
+
+
+def pick_ticket(strategy: Strategy, matrix: DrawMatrix, max_ball: int) -> NDArray[np.intp]:
+    """
+    Picks the five balls (zero based) a strategy plays according to the history.
+
+    ``hot`` and ``cold`` play the most and least drawn balls, ``pairs`` starts from the
+    most drawn pair and greedily adds the ball most often drawn with the chosen ones.
+    ``random`` plays a new random ticket every draw, so it has no fixed ticket.
+    """
+    counts = frequencies(matrix)[:max_ball]
+    if strategy is Strategy.HOT:
+        return np.sort(np.argsort(counts, kind="stable")[::-1][:BALLS_PER_DRAW])
+    if strategy is Strategy.COLD:
+        return np.sort(np.argsort(counts, kind="stable")[:BALLS_PER_DRAW])
+    if strategy is Strategy.PAIRS:
+        onehot = matrix.onehot[:, :max_ball].astype(np.int32)
+        pairs = onehot.T @ onehot
+        np.fill_diagonal(pairs, -1)
+        chosen = list(np.unravel_index(pairs.argmax(), pairs.shape))
+        while len(chosen) < BALLS_PER_DRAW:
+            score = pairs[chosen].sum(axis=0)
+            score[chosen] = np.iinfo(np.int32).min
+            chosen.append(int(score.argmax()))
+        return np.sort(np.array(chosen, dtype=np.intp))
+    return np.empty(0, dtype=np.intp)
+
+
+def _random_draws(generator: np.random.Generator, draws: int, max_ball: int) -> NDArray[np.intp]:
+    # The 5 smallest of uniform keys are a uniform 5-subset of the balls
+    keys = generator.random((draws, max_ball), dtype=np.float32)
+    return np.argpartition(keys, BALLS_PER_DRAW, axis=1)[:, :BALLS_PER_DRAW]
+
+
+def _simulate_chunk(
+    max_ball: int,
+    max_superbalota: int | None,
+    tickets: NDArray[np.intp],
+    draws: int,
+    seed: np.random.SeedSequence,
+) -> NDArray[np.int64]:
+    """
+    Simulates ``draws`` draws for every ticket, a ticket row of ``-1`` is a random ticket.
+
+    :return: a ``(tickets, 6, 2)`` array counting the draws by hits and superbalota match
+    """
+    generator = np.random.default_rng(seed)
+    balls = _random_draws(generator, draws, max_ball)
+    superbalota = np.zeros(draws, dtype=np.intp)
+    if max_superbalota is not None:
+        superbalota = (generator.integers(1, max_superbalota + 1, draws) == 1).astype(np.intp)
+
+    counts = np.zeros((len(tickets), BALLS_PER_DRAW + 1, 2), dtype=np.int64)
+    rows = np.arange(draws)[:, None]
+    for index, ticket in enumerate(tickets):
+        if ticket[0] < 0:
+            played = np.zeros((draws, max_ball), dtype=np.bool_)
+            played[rows, _random_draws(generator, draws, max_ball)] = True
+            hits = played[rows, balls].sum(axis=1)
+        else:
+            played = np.zeros(max_ball, dtype=np.bool_)
+            played[ticket] = True
+            hits = played[balls].sum(axis=1)
+        flat = np.bincount(hits * 2 + superbalota, minlength=(BALLS_PER_DRAW + 1) * 2)
+        counts[index] = flat.reshape(BALLS_PER_DRAW + 1, 2)
+    return counts
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SimulationResult:
+    strategy: Strategy
+    ticket: tuple[int, ...]
+    counts: NDArray[np.int64]
+
+    @property
+    def draws(self) -> int:
+        return int(self.counts.sum())
+
+    def hits(self, hits: int, superbalota: bool | None = None) -> int:
+        if superbalota is None:
+            return int(self.counts[hits].sum())
+        return int(self.counts[hits, int(superbalota)])
+
+
+class Simulator:
+    """
+    Plays ticket strategies against simulated draws.
+
+    The draws are split in fixed size chunks, every chunk gets its own
+    :class:`numpy.random.SeedSequence` spawned from ``seed`` and runs in a
+    :class:`~concurrent.futures.ProcessPoolExecutor`; results only depend on the seed.
+    """
+
+    def __init__(self, game: Game, seed: int | None = None, workers: int | None = None) -> None:
+        self.game = game
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+
+    def run(
+        self, strategies: Sequence[Strategy], matrix: DrawMatrix, draws: int
+    ) -> list[SimulationResult]:
+        tickets = np.full((len(strategies), BALLS_PER_DRAW), -1, dtype=np.intp)
+        for index, strategy in enumerate(strategies):
+            ticket = pick_ticket(strategy, matrix, self.game.max_ball)
+            if ticket.size:
+                tickets[index] = ticket
+
+        sizes = [CHUNK_SIZE] * (draws // CHUNK_SIZE)
+        if draws % CHUNK_SIZE:
+            sizes.append(draws % CHUNK_SIZE)
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        arguments = [
+            (self.game.max_ball, self.game.max_superbalota, tickets, size, seed)
+            for size, seed in zip(sizes, seeds)
+        ]
+
+        counts = np.zeros((len(strategies), BALLS_PER_DRAW + 1, 2), dtype=np.int64)
+        if self.workers == 1 or len(arguments) == 1:
+            for args in arguments:
+                counts += _simulate_chunk(*args)
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(arguments))) as pool:
+                for chunk in pool.map(_simulate_chunk, *zip(*arguments)):
+                    counts += chunk
+
+        return [
+            SimulationResult(
+                strategy=strategy,
+                ticket=tuple(int(ball) + 1 for ball in ticket if ball >= 0),
+                counts=counts[index],
+            )
+            for index, (strategy, ticket) in enumerate(zip(strategies, tickets))
+        ]
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.games import MAX_BALL
+from baloto.miloto.stats.matrix import DrawMatrix
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from baloto.miloto.games import GameType
+
+
+__all__ = ("StatsSnapshot", "ROLLING_WINDOWS")
+
+ROLLING_WINDOWS = (10, 20, 50, 100)
+
+UPSERT_BALL_COUNT = """
+    INSERT INTO stats_ball_counts (game, ball, count, last_date) VALUES (?, ?, ?, ?)
+    ON CONFLICT (game, ball) DO UPDATE SET
+        count = count + excluded.count,
+        last_date = MAX(last_date, excluded.last_date);
+"""
+
+UPSERT_PAIR_COUNT = """
+    INSERT INTO stats_pair_counts (game, ball_a, ball_b, count) VALUES (?, ?, ?, ?)
+    ON CONFLICT (game, ball_a, ball_b) DO UPDATE SET count = count + excluded.count;
+"""
+
+UPSERT_SNAPSHOT = """
+    INSERT INTO stats_snapshot (game, draws, last_draw_id, last_date) VALUES (?, ?, ?, ?)
+    ON CONFLICT (game) DO UPDATE SET
+        draws = draws + excluded.draws,
+        last_draw_id = excluded.last_draw_id,
+        last_date = MAX(IFNULL(last_date, ''), excluded.last_date),
+        updated_on = CURRENT_TIMESTAMP;
+"""
+
+# The newest draws of a game come straight from the sessions_game_date_mask index
+SELECT_ROLLING = """
+    SELECT ball, COUNT(*) FROM draw_numbers WHERE draw_id IN (
+        SELECT draw_id FROM sessions WHERE game = ?
+        ORDER BY lottery_date DESC, draw_id DESC LIMIT ?
+    ) GROUP BY ball;
+"""
+
+
+class StatsSnapshot:
+    """
+    Materialized statistics of a game: ball counts and last seen dates, pair counts and the
+    ball counts over the last :data:`ROLLING_WINDOWS` draws.
+
+    Counts are additive, so the draws inserted since the last refresh are added whatever
+    their date; the rolling windows are recounted from the newest draws, which costs the
+    same however long the history is. Report commands read these tables only.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, game: GameType) -> None:
+        self.connection = connection
+        self.game = game
+
+    def state(self) -> tuple[int, int, str | None] | None:
+        return self.connection.execute(
+            "SELECT draws, last_draw_id, last_date FROM stats_snapshot WHERE game = ?;",
+            (str(self.game),),
+        ).fetchone()
+
+    def refresh(self) -> None:
+        """
+        Adds the draws inserted since the snapshot was last refreshed.
+        """
+        state = self.state()
+        if state is None:
+            self.rebuild()
+            return
+
+        matrix = DrawMatrix.load(self.connection, self.game, after=state[1])
+        if len(matrix):
+            self._add(matrix)
+            self._roll()
+
+    def rebuild(self) -> None:
+        game = str(self.game)
+        for table in (
+            "stats_snapshot",
+            "stats_ball_counts",
+            "stats_pair_counts",
+            "stats_rolling_counts",
+        ):
+            self.connection.execute(f"DELETE FROM {table} WHERE game = ?;", (game,))
+        self._add(DrawMatrix.load(self.connection, self.game))
+        self._roll()
+
+    def _add(self, matrix: DrawMatrix) -> None:
+        if not len(matrix):
+            return
+
+        game = str(self.game)
+        onehot = matrix.onehot
+        counts = onehot.sum(axis=0)
+        dates = matrix.dates.astype(str)
+        # Index of the newest draw of every ball, draws are in date order
+        last = len(matrix) - 1 - onehot[::-1].argmax(axis=0)
+        self.connection.executemany(
+            UPSERT_BALL_COUNT,
+            [
+                (game, int(ball) + 1, int(counts[ball]), str(dates[last[ball]]))
+                for ball in np.flatnonzero(counts)
+            ],
+        )
+
+        pairs = onehot.astype(np.int32)
+        pairs = pairs.T @ pairs
+        a, b = np.nonzero(np.triu(pairs, k=1))
+        self.connection.executemany(
+            UPSERT_PAIR_COUNT,
+            [(game, int(x) + 1, int(y) + 1, int(pairs[x, y])) for x, y in zip(a, b)],
+        )
+        self.connection.execute(
+            UPSERT_SNAPSHOT,
+            (game, len(matrix), matrix.last_draw_id, str(dates[-1])),
+        )
+
+    def _roll(self) -> None:
+        game = str(self.game)
+        self.connection.execute("DELETE FROM stats_rolling_counts WHERE game = ?;", (game,))
+        for window in ROLLING_WINDOWS:
+            rows = self.connection.execute(SELECT_ROLLING, (game, window)).fetchall()
+            self.connection.executemany(
+                "INSERT INTO stats_rolling_counts (game, window_size, ball, count)"
+                " VALUES (?, ?, ?, ?);",
+                [(game, window, ball, count) for ball, count in rows],
+            )
+
+    def ball_counts(self) -> dict[int, tuple[int, str]]:
+        """
+        Returns the number of draws and last date of every drawn ball.
+        """
+        rows = self.connection.execute(
+            "SELECT ball, count, last_date FROM stats_ball_counts WHERE game = ? ORDER BY ball;",
+            (str(self.game),),
+        )
+        return {ball: (count, last_date) for ball, count, last_date in rows}
+
+    def rolling_counts(self, window: int) -> dict[int, int]:
+        if window not in ROLLING_WINDOWS:
+            raise ValueError(f"The snapshot keeps the windows {ROLLING_WINDOWS}, got {window}")
+        rows = self.connection.execute(
+            "SELECT ball, count FROM stats_rolling_counts WHERE game = ? AND window_size = ?;",
+            (str(self.game), window),
+        )
+        return dict(rows.fetchall())
+
+    def pair_counts(self) -> np.ndarray:
+        """
+        Returns the symmetric ``(MAX_BALL, MAX_BALL)`` matrix of pair counts.
+        """
+        pairs = np.zeros((MAX_BALL, MAX_BALL), dtype=np.int64)
+        rows = self.connection.execute(
+            "SELECT ball_a, ball_b, count FROM stats_pair_counts WHERE game = ?;",
+            (str(self.game),),
+        ).fetchall()
+        if rows:
+            a, b, counts = np.array(rows, dtype=np.int64).T
+            pairs[a - 1, b - 1] = counts
+            pairs[b - 1, a - 1] = counts
+        return pairs
+
+    def top_pairs(self, top: int = 10) -> list[tuple[int, int, int]]:
+        rows = self.connection.execute(
+            """SELECT ball_a, ball_b, count FROM stats_pair_counts WHERE game = ?
+            ORDER BY count DESC, ball_a, ball_b LIMIT ?;""",
+            (str(self.game), top),
+        )
+        return rows.fetchall()
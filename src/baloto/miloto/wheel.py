@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.games import BALLS_PER_DRAW
+from baloto.miloto.games import mask_balls
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+
+__all__ = ("Wheel", "combination_masks")
+
+# Target x ticket pairs tested per popcount block
+_BLOCK_SIZE = 1 << 22
+
+
+def combination_masks(numbers: Sequence[int], size: int) -> NDArray[np.uint64]:
+    """
+    Every ``size`` combination of ``numbers`` as a bitmask with bit ``ball - 1`` set.
+    """
+    bits = np.array([1 << (number - 1) for number in numbers], dtype=np.uint64)
+    combinations = np.array(
+        list(itertools.combinations(range(len(numbers)), size)), dtype=np.intp
+    ).reshape(-1, size)
+    masks: NDArray[np.uint64] = np.bitwise_or.reduce(bits[combinations], axis=1)
+    return masks
+
+
+def _csr(
+    keys: NDArray[np.intp], values: NDArray[np.intp], size: int
+) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    order = np.argsort(keys, kind="stable")
+    offsets = np.zeros(size + 1, dtype=np.intp)
+    np.cumsum(np.bincount(keys, minlength=size), out=offsets[1:])
+    return offsets, values[order]
+
+
+def _gather(
+    offsets: NDArray[np.intp], values: NDArray[np.intp], rows: NDArray[np.intp]
+) -> NDArray[np.intp]:
+    """
+    Concatenates the CSR rows ``rows`` without a Python loop.
+    """
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    total = int(lengths.sum())
+    if not total:
+        return values[:0]
+    shifts = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return values[shifts + np.arange(total)]
+
+
+class Wheel:
+    """
+    Builds covering designs, a set of tickets from ``numbers`` such that whenever
+    ``condition`` of the drawn balls are among ``numbers`` some ticket has at least
+    ``guarantee`` of them.
+
+    Tickets and targets are 64-bit masks, a ticket covers a target when the popcount of
+    their intersection reaches the guarantee. The design is built greedily and then
+    shrunk by a local search that drops redundant tickets and repairs random removals.
+    """
+
+    def __init__(self, numbers: Sequence[int], guarantee: int = 3, condition: int | None = None):
+        condition = guarantee if condition is None else condition
+        numbers = sorted(set(numbers))
+        if len(numbers) < BALLS_PER_DRAW:
+            raise ValueError(f"A wheel needs at least {BALLS_PER_DRAW} numbers")
+        if not 1 <= guarantee <= condition <= BALLS_PER_DRAW:
+            raise ValueError(
+                f"The guarantee and condition must satisfy 1 <= {guarantee} <= {condition}"
+                f" <= {BALLS_PER_DRAW}"
+            )
+
+        self.numbers = numbers
+        self.guarantee = guarantee
+        self.condition = condition
+        self.tickets = combination_masks(numbers, BALLS_PER_DRAW)
+        self.targets = combination_masks(numbers, condition)
+
+        targets, tickets = self._coverage()
+        self._by_ticket = _csr(tickets, targets, len(self.tickets))
+        self._by_target = _csr(targets, tickets, len(self.targets))
+
+    def _coverage(self) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+        step = max(1, _BLOCK_SIZE // len(self.tickets))
+        targets, tickets = [], []
+        for start in range(0, len(self.targets), step):
+            block = self.targets[start : start + step, None] & self.tickets[None, :]
+            target, ticket = np.nonzero(np.bitwise_count(block) >= self.guarantee)
+            targets.append(target + start)
+            tickets.append(ticket)
+        return np.concatenate(targets), np.concatenate(tickets)
+
+    def covered_by(self, tickets: NDArray[np.intp]) -> NDArray[np.intp]:
+        """
+        How many of ``tickets`` cover every target.
+        """
+        targets = _gather(*self._by_ticket, np.asarray(tickets, dtype=np.intp))
+        return np.bincount(targets, minlength=len(self.targets))
+
+    def _greedy(self, chosen: list[int], generator: np.random.Generator) -> list[int]:
+        covered = self.covered_by(np.array(chosen, dtype=np.intp)) > 0
+        uncovered = np.flatnonzero(~covered)
+        scores = np.bincount(
+            _gather(*self._by_target, uncovered), minlength=len(self.tickets)
+        ).astype(np.float64)
+
+        chosen = list(chosen)
+        while not covered.all():
+            # Random jitter below 1 only breaks ties between equally good tickets
+            best = int(np.argmax(scores + generator.random(len(scores)) * 0.5))
+            targets = _gather(*self._by_ticket, np.array([best]))
+            targets = targets[~covered[targets]]
+            covered[targets] = True
+            scores -= np.bincount(_gather(*self._by_target, targets), minlength=len(scores))
+            chosen.append(best)
+        return chosen
+
+    def _prune(self, chosen: list[int]) -> list[int]:
+        counts = self.covered_by(np.array(chosen, dtype=np.intp))
+        kept = []
+        for ticket in reversed(chosen):
+            targets = _gather(*self._by_ticket, np.array([ticket]))
+            if counts[targets].min() > 1:
+                counts[targets] -= 1
+            else:
+                kept.append(ticket)
+        return kept[::-1]
+
+    def design(self, iterations: int = 100, seed: int | None = None) -> list[tuple[int, ...]]:
+        """
+        Returns the smallest design found after ``iterations`` of local search.
+        """
+        generator = np.random.default_rng(seed)
+        best = self._prune(self._greedy([], generator))
+
+        for _ in range(iterations):
+            removed = max(1, len(best) // 10)
+            keep = generator.permutation(len(best))[removed:]
+            candidate = self._prune(self._greedy([best[i] for i in keep], generator))
+            if len(candidate) <= len(best):
+                best = candidate
+
+        return [mask_balls(int(self.tickets[ticket])) for ticket in sorted(best)]
+
+    def verify(self, tickets: Sequence[tuple[int, ...]]) -> bool:
+        """
+        Checks by brute force that ``tickets`` cover every target.
+        """
+        masks = np.array(
+            [sum(1 << (ball - 1) for ball in ticket) for ticket in tickets], dtype=np.uint64
+        )
+        hits = np.bitwise_count(self.targets[:, None] & masks[None, :])
+        return bool((hits >= self.guarantee).any(axis=1).all())
@@ -9,10 +9,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from pydantic_extra_types.pendulum_dt import DateTime, Date
-
 if TYPE_CHECKING:
-    pass
+    from pydantic_extra_types.pendulum_dt import DateTime, Date
 
 __all__ = (
     "StrIntFloat",
@@ -34,8 +32,6 @@ OptionalBool = bool | None
 OptionalStr = str | None
 OptionalInt = int | None
 OptionalIntFloat = OptionalInt, float
-OptionalDate = Date | None
-OptionalDateTime = DateTime | None
 DictStrAny = dict[str, Any]
 DictStrStr = dict[str | str]
 DictAny = dict[Any, Any]
@@ -46,3 +42,16 @@ ListStrIntFloat = list[StrIntFloat]
 IntStr = int | str
 OptionalAny = Any | None
 PathStr = Path | str
+
+# The pendulum aliases are built on first access, pendulum is slow to import
+_PENDULUM_ALIASES = {"OptionalDate": "Date", "OptionalDateTime": "DateTime"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _PENDULUM_ALIASES:
+        from pydantic_extra_types import pendulum_dt
+
+        alias = getattr(pendulum_dt, _PENDULUM_ALIASES[name]) | None
+        globals()[name] = alias
+        return alias
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
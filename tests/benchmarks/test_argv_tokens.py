@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from baloto.cleo.io.inputs.argument import Argument
+from baloto.cleo.io.inputs.argv_input import ArgvInput
+from baloto.cleo.io.inputs.definition import Definition
+from baloto.cleo.io.inputs.option import Option
+
+pytestmark = pytest.mark.benchmark
+
+
+def definition() -> Definition:
+    return Definition(
+        [
+            Argument.make("command"),
+            Argument.make("numbers", required=False, is_list=True),
+            Option.make("game", "g", flag=False),
+        ]
+    )
+
+
+def test_parse_long_argument_lists() -> None:
+    """Very long argument lists parse in linear time."""
+    numbers = [str(n % 43 + 1) for n in range(200_000)]
+    started = time.perf_counter()
+    ai = ArgvInput(["cli.py", "tickets", "--game", "miloto", *numbers])
+    ai.bind(definition())
+    elapsed = time.perf_counter() - started
+    assert elapsed < 2.0, f"parsing {len(numbers)} tokens took {elapsed:.2f}s"
+
+
+def test_raw_queries_do_not_scale_with_tokens() -> None:
+    """Once classified, repeated raw queries cost the same on small and large argv."""
+
+    def query_time(count: int) -> float:
+        ai = ArgvInput(["cli.py", "tickets", *(str(n % 43 + 1) for n in range(count)), "-v"])
+        ai.has_parameter_option("-v")
+        started = time.perf_counter()
+        for _ in range(1_000):
+            ai.has_parameter_option(["--quiet", "-q"], only_params=True)
+            ai.parameter_option("-v")
+        return time.perf_counter() - started
+
+    small = min(query_time(10) for _ in range(3))
+    large = min(query_time(200_000) for _ in range(3))
+    assert large < small * 10 + 0.01, f"{large:.4f}s with 200k tokens, {small:.4f}s with 10"
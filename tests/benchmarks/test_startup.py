@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+# Startup budget of the entry point in seconds, generous for slow CI machines, a
+# regression that pulls numpy or the settings back in goes well above it
+STARTUP_BUDGET_S = 0.75
+
+# What ``miloto --version`` does before the command runs: load the entry point module,
+# then main() imports and builds the application
+ENTRY_POINT = (
+    "import baloto.miloto.__main__\n"
+    "from baloto.miloto.application import Application\n"
+    "Application()\n"
+)
+
+
+def _run_time(code: str) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True)
+    return time.perf_counter() - started
+
+
+def test_entry_point_startup_budget() -> None:
+    """The entry point builds the application within the startup budget."""
+    # The best of three runs, the first one may pay for cold bytecode caches
+    interpreter = min(_run_time("pass") for _ in range(3))
+    startup = min(_run_time(ENTRY_POINT) for _ in range(3)) - interpreter
+    assert startup <= STARTUP_BUDGET_S, f"the entry point took {startup * 1000:.0f}ms to start"
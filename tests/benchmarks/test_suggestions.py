@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from baloto.cleo.utils import SuggestionIndex
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_suggestions_scale_to_many_commands() -> None:
+    """A lookup over hundreds of plugin commands stays around a millisecond."""
+    index = SuggestionIndex([f"plugin{p} command{c}" for p in range(40) for c in range(25)])
+    index.suggest("plugin3 comand7")
+    start = time.perf_counter()
+    for _ in range(20):
+        index.suggest("plugin3 comand7")
+    elapsed = (time.perf_counter() - start) / 20
+    assert elapsed < 0.005, f"a lookup took {elapsed * 1000:.2f}ms"
+
+
+def test_index_build_is_linear() -> None:
+    """Adding tens of thousands of names, duplicates included, does not scan the list."""
+    names = [f"plugin{n} command" for n in range(50_000)]
+    start = time.perf_counter()
+    SuggestionIndex([*names, *names])
+    elapsed = time.perf_counter() - start
+    assert elapsed < 1.0, f"building the index took {elapsed:.2f}s"
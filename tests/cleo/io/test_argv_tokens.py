@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from baloto.cleo.io.inputs.argument import Argument
+from baloto.cleo.io.inputs.argv_input import ArgvInput
+from baloto.cleo.io.inputs.definition import Definition
+from baloto.cleo.io.inputs.option import Option
+from baloto.cleo.io.inputs.tokens import TokenIndex
+from baloto.cleo.io.inputs.tokens import TokenKind
+
+
+def definition() -> Definition:
+    return Definition(
+        [
+            Argument.make("command"),
+            Argument.make("numbers", required=False, is_list=True),
+            Option.make("game", "g", flag=False),
+            Option.make("verbose", "v"),
+            Option.make("output", "o", flag=False, requires_value=False),
+        ]
+    )
+
+
+def test_token_kinds() -> None:
+    """Every token is classified once, nothing after '--' is an option."""
+    index = TokenIndex(["--game", "miloto", "-v", "-", "--", "--foo", "-x"])
+    assert index.kinds == [
+        TokenKind.LONG_OPTION,
+        TokenKind.ARGUMENT,
+        TokenKind.SHORT_OPTION,
+        TokenKind.ARGUMENT,
+        TokenKind.SEPARATOR,
+        TokenKind.ARGUMENT,
+        TokenKind.ARGUMENT,
+    ], "kinds follow the parse rules"
+    assert index.separator == 4, "the first '--' is the separator"
+    assert index.arguments() == [1, 3, 5, 6], "argument positions"
+
+
+def test_parse_options_and_arguments() -> None:
+    """Long, short, attached and explicit empty values parse as before."""
+    ai = ArgvInput(["cli.py", "tickets", "-vgbaloto", "--output=", "1", "--", "-2", "--game"])
+    ai.bind(definition())
+    assert ai.arguments == {"command": "tickets", "numbers": ["1", "-2", "--game"]}, "arguments"
+    assert ai.options["game"] == "baloto", "the value is attached to the shortcut"
+    assert ai.options["verbose"] is True, "flags in a shortcut set"
+    assert ai.options["output"] == "", "'--output=' does not take the next token"
+
+    ai = ArgvInput(["cli.py", "tickets", "--game", "miloto", "-o", "out.csv", "3"])
+    ai.bind(definition())
+    assert ai.options["game"] == "miloto", "the next token is the value"
+    assert ai.options["output"] == "out.csv", "optional values take the next token"
+    assert ai.arguments["numbers"] == ["3"], "the value is consumed"
+
+
+def test_raw_parameter_options() -> None:
+    """Raw queries answer from the index, values are the whole rest of the token."""
+    ai = ArgvInput(["cli.py", "--game=baloto", "-vvv", "-ofile", "--", "--ansi"])
+    assert ai.has_parameter_option("--game"), "'--name=value' answers '--name'"
+    assert ai.has_parameter_option(["-vv", "-q"]), "'-vvv' answers '-vv'"
+    assert ai.has_parameter_option("--ansi"), "tokens after '--' are raw parameters"
+    assert not ai.has_parameter_option("--ansi", only_params=True), "unless only params"
+    assert ai.parameter_option("--game") == "baloto", "the whole value"
+    assert ai.parameter_option("-o") == "file", "the attached short value"
+    assert ai.parameter_option(["--quiet", "-q"], default="x") == "x", "the default"
+    assert ai.first_argument == "--ansi", "options and '--' are not arguments, what follows is"
+
+    ai = ArgvInput(["cli.py", "--game", "miloto", "stats", "follow"])
+    assert ai.parameter_option("--game") == "miloto", "the next token"
+    assert ai.first_argument == "miloto", "unbound options do not consume values"
+
+
+def test_parse_long_argument_lists() -> None:
+    """Very long argument lists keep every value, raw lookups still see the options."""
+    numbers = [str(n % 43 + 1) for n in range(200_000)]
+    ai = ArgvInput(["cli.py", "tickets", "--game", "miloto", *numbers])
+    ai.bind(definition())
+    assert len(ai.arguments["numbers"]) == len(numbers), "every number is an argument"
+    assert ai.arguments["numbers"][-1] == numbers[-1], "the order is kept"
+    assert ai.parameter_option("--game") == "miloto", "raw lookups still work"
+
+
+def test_extract_options() -> None:
+    """Options of the definition move out with their values, the rest keeps its order."""
+    globals_ = Definition(
+        [
+            Option.make("verbose", "v|vv|vvv"),
+            Option.make("quiet", "q"),
+            Option.make("ansi"),
+            Option.make("directory", "C", flag=False),
+        ]
+    )
+    tokens = ["stats", "follow", "-vvv", "7", "--game", "baloto", "-qv", "-C", "db", "--"]
+    extracted, remaining = globals_.extract_options([*tokens, "--ansi"])
+    assert extracted == ["-vvv", "-qv", "-C", "db"], "global options and their values"
+    assert remaining == ["stats", "follow", "7", "--game", "baloto", "--", "--ansi"], "the rest"
+
+    extracted, remaining = globals_.extract_options(["--directory=db", "-Cdb", "-qx", "--ansi"])
+    assert extracted == ["--directory=db", "-Cdb", "--ansi"], "attached values"
+    assert remaining == ["-qx"], "sets with unknown shortcuts stay"
+    assert globals_.extract_options(["-C", "--ansi"]) == (["-C", "--ansi"], []), "no value"
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from baloto.cleo.utils import SuggestionIndex
+from baloto.cleo.utils import find_similar_names
+
+NAMES = [
+    "about",
+    "db import",
+    "db init",
+    "stats follow",
+    "stats frequency",
+    "stats gaps",
+    "tickets add",
+    "tickets check",
+    "wheel",
+    "db",
+    "stats",
+    "tickets",
+]
+
+
+def test_suggestions_rank_the_closest_names_first() -> None:
+    """Typos find their command, substrings rank before fuzzy matches."""
+    index = SuggestionIndex(NAMES)
+    assert index.suggest("stats frecuency")[0] == "stats frequency", "a typo is corrected"
+    assert index.suggest("whel") == ["wheel"], "short names are matched"
+    assert index.suggest("tick")[:3] == ["tickets", "tickets add", "tickets check"], "prefixes"
+    assert "about" not in index.suggest("db imprt"), "namespaced names only match namespaced"
+    assert index.suggest("zzzz") == [], "unrelated names are not suggested"
+
+
+def test_namespace_suggestions() -> None:
+    """A namespace lists its own commands."""
+    index = SuggestionIndex(NAMES)
+    assert sorted(index.suggest("db", namespace="db")) == ["db import", "db init"], "db commands"
+    assert index.suggest("x", namespace="missing") == [], "unknown namespaces have no commands"
+
+
+def test_find_similar_names_uses_the_index() -> None:
+    """The function keeps its signature for the exception messages."""
+    assert find_similar_names("stats gap", NAMES)[0] == "stats gaps", "the closest name first"
+
+
+def test_suggestions_among_many_commands() -> None:
+    """A typo still finds its command among hundreds of plugin commands."""
+    index = SuggestionIndex([f"plugin{p} command{c}" for p in range(40) for c in range(25)])
+    assert index.suggest("plugin3 comand7")[0] == "plugin3 command7", "the closest name first"
+
+
+def test_index_skips_duplicates() -> None:
+    """Tens of thousands of names, duplicates included, are added once."""
+    names = [f"plugin{n} command" for n in range(50_000)]
+    index = SuggestionIndex([*names, *names])
+    assert len(index) == len(names), "duplicates are added once"
+    assert names[-1] in index, "membership uses the name set"
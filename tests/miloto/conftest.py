@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import date
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.database.schema import migrate
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    import numpy as np
+
+
+@pytest.fixture(name="connection")
+def migrated_connection(tmp_path: Path) -> Iterator[sqlite3.Connection]:
+    conn = sqlite3.connect(tmp_path / "db.sqlite3")
+    migrate(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(name="draw_records")
+def draw_records_factory() -> Callable[..., list[DrawRecord]]:
+    """Miloto records for rows of balls, one draw a day from day ``start`` of 2020."""
+
+    def _records(balls: np.ndarray, start: int = 0) -> list[DrawRecord]:
+        return [
+            DrawRecord(
+                lottery_id=start + offset,
+                lottery_date=date(2020, 1, 1) + timedelta(days=start + offset),
+                accumulated=0,
+                balls=tuple(int(ball) for ball in row),
+            )
+            for offset, row in enumerate(balls)
+        ]
+
+    return _records
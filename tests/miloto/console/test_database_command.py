@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from baloto.cleo.io.inputs.argv_input import ArgvInput
+from baloto.cleo.io.io import IO
+from baloto.cleo.io.outputs.null_output import NullOutput
+from baloto.miloto.console.commands.database_command import DatabaseCommand
+from baloto.miloto.database.connection import ConnectionManager
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class ExitCodeCommand(DatabaseCommand):
+    name = "exit-code"
+
+    def __init__(self, path: Path, exit_code: int) -> None:
+        super().__init__()
+        self.path = path
+        self.exit_code = exit_code
+
+    def setup(self) -> int:
+        self._database = ConnectionManager(self.path)
+        return 0
+
+    def handle(self) -> int:
+        self.database.connection.execute("SELECT 1;")
+        self.database.reader.execute("SELECT 1;")
+        return self.exit_code
+
+
+@pytest.mark.parametrize("exit_code", [0, 1])
+def test_connections_are_closed_whatever_the_exit_code(tmp_path: Path, exit_code: int) -> None:
+    """The shared connection and reader are closed on success and on error exits."""
+    command = ExitCodeCommand(tmp_path / "db.sqlite3", exit_code)
+    io = IO(ArgvInput(["miloto"]), NullOutput(), NullOutput())
+    assert command.execute(io) == exit_code, "the exit code should be returned"
+    assert not command.database.is_open, "the connections should be closed"
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+import pytest
+
+from baloto.cleo.exceptions.errors import CleoLogicError
+from baloto.miloto.application import COMMANDS
+from baloto.miloto.console.loaders.command_loader import CommandLoader
+from baloto.miloto.console.loaders.manifest import CommandEntry
+from baloto.miloto.console.loaders.manifest import CommandManifest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SOURCE = """
+class StatsDemoCommand(Base):
+    name = "stats demo"
+    description: str = "A demo command."
+    aliases: ClassVar[list[str]] = ["demo", "sd"]
+    options = [option("game")]
+"""
+
+
+def test_entries_are_parsed_without_importing() -> None:
+    """Literal class attributes are read, the rest keeps the defaults."""
+    entry = CommandEntry.for_name("stats demo").parse(SOURCE)
+    assert entry.module == "baloto.miloto.console.commands.stats.demo", "the module path"
+    assert entry.description == "A demo command.", "annotated assignments are read"
+    assert entry.aliases == ("demo", "sd") and not entry.hidden, "aliases and hidden"
+    assert entry.namespace == "stats", "the namespace of the command"
+
+    with pytest.raises(ValueError):
+        CommandEntry.for_name("stats other").parse(SOURCE)
+
+
+def test_manifest_matches_the_commands(tmp_path: Path) -> None:
+    """Every entry describes its command class as the list output shows it."""
+    manifest = CommandManifest.load(COMMANDS, tmp_path / "commands.json")
+    assert manifest.names == COMMANDS, "every command should have an entry"
+    for entry in manifest:
+        command_class = getattr(import_module(entry.module), entry.class_name)
+        assert entry.description == command_class.description, f"{entry.name} description"
+        assert entry.aliases == tuple(command_class.aliases), f"{entry.name} aliases"
+        assert entry.hidden == command_class.hidden, f"{entry.name} hidden flag"
+
+
+def test_manifest_cache_is_refreshed(tmp_path: Path) -> None:
+    """A cached manifest is reused until a command module changes."""
+    path = tmp_path / "commands.json"
+    CommandManifest.load(COMMANDS, path)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["entries"][0]["description"] = "cached"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    assert next(iter(CommandManifest.load(COMMANDS, path))).description == "cached", "reused"
+
+    # An older modification time stands for an edited module
+    module = next(iter(data["modules"]))
+    data["modules"][module][1] -= 1
+    path.write_text(json.dumps(data), encoding="utf-8")
+    assert next(iter(CommandManifest.load(COMMANDS, path))).description != "cached", "rebuilt"
+
+
+def test_loader_resolves_aliases_lazily(tmp_path: Path) -> None:
+    """Aliases load their command, other command modules stay unimported."""
+    loader = CommandLoader.from_manifest(CommandManifest.load(COMMANDS, tmp_path / "c.json"))
+    sys.modules.pop("baloto.miloto.console.commands.db.init", None)
+    assert loader.has("ini") and not loader.has("nope"), "aliases come from the manifest"
+    assert "baloto.miloto.console.commands.db.init" not in sys.modules, "has() does not import"
+    assert loader.get("ini").name == "db init", "the alias loads its command"
+    with pytest.raises(CleoLogicError):
+        loader.register_factory("db init", lambda: loader.get("db init"))
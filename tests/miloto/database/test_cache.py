@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+from baloto.miloto.database.cache import DrawCache
+from baloto.miloto.database.cache import fingerprint
+from baloto.miloto.database.importer import DrawImporter
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.database.schema import migrate
+from baloto.miloto.games import GameType
+from baloto.miloto.stats.matrix import DrawMatrix
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+BALLS = [[1, 2, 3, 4, 5], [5, 1, 2, 30, 39], [2, 7, 1, 22, 39]]
+
+
+def _record(index: int) -> DrawRecord:
+    return DrawRecord.from_mapping(
+        {
+            "lottery_id": index,
+            "lottery_date": f"2025-03-{index:02d}",
+            "accumulated": 0,
+            "balls": BALLS[index - 1],
+        }
+    )
+
+
+def test_cache_round_trip_and_invalidation(tmp_path: Path) -> None:
+    """
+    The cache maps the same draws as SQLite and is rewritten when sessions change
+    """
+    conn = sqlite3.connect(tmp_path / "db.sqlite3")
+    migrate(conn)
+    DrawImporter(conn).import_draws([_record(1), _record(2)])
+    cache = DrawCache(tmp_path / "db.miloto.draws", GameType.MILOTO)
+
+    matrix = cache.load(conn)
+    assert not matrix.balls.flags.owndata, "The balls should be a view of the mapped file"
+    assert matrix.balls.tolist() == BALLS[:2], "The cached balls are unexpected"
+    assert matrix.dates.astype(str).tolist() == ["2025-03-01", "2025-03-02"], "Bad dates"
+    assert cache.is_fresh(fingerprint(conn, GameType.MILOTO)), "The cache should be fresh"
+
+    DrawImporter(conn).import_draws([_record(3)])
+    assert not cache.is_fresh(fingerprint(conn, GameType.MILOTO)), "The cache should be stale"
+
+    matrix = cache.load(conn)
+    expected = DrawMatrix.load(conn, GameType.MILOTO)
+    conn.close()
+
+    assert matrix.balls.tolist() == expected.balls.tolist(), "The refreshed balls differ"
+    assert matrix.draw_ids.tolist() == expected.draw_ids.tolist(), "The draw ids differ"
+    assert matrix.onehot.sum() == 15, "The one-hot matrix of the cache is unexpected"
+
+
+def test_cache_rejects_other_files(tmp_path: Path) -> None:
+    """
+    A file that is not a draw cache of the game is never considered fresh
+    """
+    path = tmp_path / "db.miloto.draws"
+    path.write_bytes(b"not a cache")
+
+    assert DrawCache(path, GameType.MILOTO).header() is None, "The header should be invalid"
+    assert not DrawCache(path, GameType.MILOTO).is_fresh((0, 0)), "The cache is not fresh"
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+
+from baloto.miloto.database.connection import ConnectionManager
+from baloto.miloto.database.schema import SCHEMA_VERSION
+from baloto.miloto.database.schema import current_version
+from baloto.miloto.database.schema import migrate
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_connections_are_lazy_and_shared(tmp_path: Path) -> None:
+    """Nothing is opened until first use, then the same connection is handed out."""
+    path = tmp_path / "db.sqlite3"
+    manager = ConnectionManager(path)
+    assert not manager.is_open, "no connection should be opened on creation"
+    assert not path.exists(), "the database file should not be created on creation"
+
+    assert manager.connection is manager.connection, "the connection should be shared"
+    assert manager.is_open, "the connection should be open after first use"
+    manager.close()
+    assert not manager.is_open, "close should release every connection"
+
+
+def test_pragma_profile(tmp_path: Path) -> None:
+    """The read-write connection gets the tuned pragma profile."""
+    with ConnectionManager(tmp_path / "db.sqlite3") as manager:
+        conn = manager.connection
+        assert conn.execute("PRAGMA journal_mode;").fetchone() == ("wal",), "should use WAL"
+        assert conn.execute("PRAGMA synchronous;").fetchone() == (1,), "should be NORMAL"
+        assert conn.execute("PRAGMA temp_store;").fetchone() == (2,), "should be MEMORY"
+        assert conn.execute("PRAGMA cache_size;").fetchone() == (-65536,), "64MiB page cache"
+
+
+def test_reader_is_read_only(tmp_path: Path) -> None:
+    """Report commands read through a connection that cannot write."""
+    with ConnectionManager(tmp_path / "db.sqlite3") as manager:
+        with manager.connection as conn:
+            migrate(conn)
+
+        reader = manager.reader
+        assert reader is not manager.connection, "the reader should be its own connection"
+        assert current_version(reader) == SCHEMA_VERSION, "the reader should see the schema"
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("DELETE FROM sessions;")
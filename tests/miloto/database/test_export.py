@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import date
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from baloto.miloto.database.export import EXPORT_TABLES
+from baloto.miloto.database.export import export_table
+from baloto.miloto.database.export import iter_chunks
+from baloto.miloto.database.export import load_npz
+from baloto.miloto.database.importer import DrawImporter
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.database.schema import migrate
+from baloto.miloto.exceptions.errors import BalotoRuntimeError
+from baloto.miloto.games import GameType
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(name="connection")
+def export_connection(connection: sqlite3.Connection) -> sqlite3.Connection:
+    generator = np.random.default_rng(2)
+    DrawImporter(connection).import_draws(
+        DrawRecord(
+            lottery_id=index,
+            lottery_date=date(2022, 1, 1) + timedelta(days=index),
+            accumulated=index * 1_000,
+            game=GameType.BALOTO,
+            balls=tuple(int(b) for b in sorted(generator.choice(43, 5, replace=False) + 1)),
+            superbalota=int(generator.integers(1, 17)) if index % 3 else None,
+        )
+        for index in range(1, 251)
+    )
+    return connection
+
+
+def test_chunks_are_bounded(connection: sqlite3.Connection) -> None:
+    """The export never reads more than one chunk of rows at a time."""
+    sizes = [
+        len(chunk["draw_id"]) for chunk in iter_chunks(connection, EXPORT_TABLES["sessions"], 64)
+    ]
+    assert sizes == [64, 64, 64, 58], "the sessions should be streamed in chunks"
+
+
+@pytest.mark.parametrize("size", [0, -1])
+def test_chunk_size_must_be_positive(
+    connection: sqlite3.Connection, tmp_path: Path, size: int
+) -> None:
+    """An empty chunk would end the stream, the export refuses it instead of writing nothing."""
+    with pytest.raises(BalotoRuntimeError):
+        export_table(connection, EXPORT_TABLES["sessions"], tmp_path, False, size)
+    assert not list(tmp_path.glob("sessions.npz*")), "no partial file should be left"
+
+
+def test_npz_export_round_trip(connection: sqlite3.Connection, tmp_path: Path) -> None:
+    """The chunked npz export loads back into the stored draws and statistics."""
+    path, rows = export_table(connection, EXPORT_TABLES["sessions"], tmp_path, False, 100)
+    assert path.suffix == ".npz" and rows == 250, "every session should be exported"
+
+    columns = load_npz(path)
+    stored = connection.execute(
+        "SELECT draw_id, lottery_date, accumulated, IFNULL(superbalota, 0), mask"
+        " FROM sessions ORDER BY draw_id;"
+    ).fetchall()
+    assert columns["draw_id"].tolist() == [row[0] for row in stored], "draw ids should match"
+    assert columns["lottery_date"].astype(str).tolist() == [row[1] for row in stored]
+    assert columns["superbalota"].tolist() == [row[3] for row in stored], "missing is 0"
+    masks = np.zeros(rows, dtype=np.uint64)
+    for position in range(1, 6):
+        masks |= np.uint64(1) << (columns[f"n{position}"].astype(np.uint64) - np.uint64(1))
+    assert np.array_equal(masks, columns["mask"]), "the balls should match the masks"
+
+    path, rows = export_table(connection, EXPORT_TABLES["pair_counts"], tmp_path, False)
+    assert load_npz(path)["count"].sum() == 250 * 10, "every draw has ten pairs"
+
+
+def test_empty_tables_keep_their_columns(tmp_path: Path) -> None:
+    """A table without rows exports zero-length columns with the table dtypes."""
+    conn = sqlite3.connect(tmp_path / "empty.sqlite3")
+    migrate(conn)
+    path, rows = export_table(conn, EXPORT_TABLES["sessions"], tmp_path, False)
+    conn.close()
+
+    columns = load_npz(path)
+    assert rows == 0, "there are no sessions"
+    expected = sorted(name for name, _ in EXPORT_TABLES["sessions"].columns)
+    assert list(columns) == expected, "every column should be exported"
+    assert columns["mask"].dtype == np.uint64 and not columns["mask"].size, "empty uint64 column"
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+
+from baloto.miloto.database.importer import DrawImporter
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.database.importer import read_draws
+from baloto.miloto.exceptions.errors import BalotoRuntimeError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+DRAWS = [
+    {"lottery_id": 1, "lottery_date": "2025-01-02", "accumulated": 120, "balls": "3 9 17 28 39"},
+    {"lottery_id": 2, "lottery_date": "2025-01-04", "accumulated": 140, "balls": "1 9 12 30 33"},
+    {"lottery_id": 3, "lottery_date": "2025-01-07", "accumulated": 165, "balls": "5 9 17 22 38"},
+]
+
+
+def test_read_draws_csv_and_json(tmp_path: Path) -> None:
+    """
+    The csv, json and jsonl readers yield the same records
+    """
+    csv_file = tmp_path / "draws.csv"
+    csv_file.write_text(
+        "lottery_id,lottery_date,accumulated,n1,n2,n3,n4,n5\n"
+        + "\n".join(
+            f"{d['lottery_id']},{d['lottery_date']},{d['accumulated']},{d['balls'].replace(' ', ',')}"
+            for d in DRAWS
+        )
+    )
+    json_file = tmp_path / "draws.json"
+    json_file.write_text(json.dumps({"draws": DRAWS}))
+    jsonl_file = tmp_path / "draws.jsonl"
+    jsonl_file.write_text("\n".join(json.dumps(d) for d in DRAWS))
+
+    expected = [DrawRecord.from_mapping(d) for d in DRAWS]
+    assert list(read_draws(csv_file)) == expected, "The csv records are unexpected"
+    assert list(read_draws(json_file)) == expected, "The json records are unexpected"
+    assert list(read_draws(jsonl_file)) == expected, "The jsonl records are unexpected"
+
+
+def test_import_draws_in_batches(connection: sqlite3.Connection) -> None:
+    """
+    The importer writes every record using batches and ignores duplicated draws
+    """
+    importer = DrawImporter(connection, batch_size=2)
+    result = importer.import_draws(DrawRecord.from_mapping(d) for d in DRAWS)
+
+    assert result.read == 3, "The number of read records is unexpected"
+    assert result.inserted == 3, "The number of inserted records is unexpected"
+    assert result.batches == 2, "The number of batches is unexpected"
+
+    result = importer.import_draws(DrawRecord.from_mapping(d) for d in DRAWS)
+    assert result.ignored == 3, "Duplicated draws should be ignored"
+
+    count = connection.execute("SELECT COUNT(*) FROM sessions;").fetchone()[0]
+    assert count == 3, "The sessions table row count is unexpected"
+    count = connection.execute("SELECT COUNT(*) FROM draw_numbers;").fetchone()[0]
+    assert count == 15, "The draw_numbers table row count is unexpected"
+    mode = connection.execute("PRAGMA journal_mode;").fetchone()[0]
+    assert mode == "wal", "The journal mode should be WAL"
+
+
+def test_import_draws_rolls_back_on_error(connection: sqlite3.Connection) -> None:
+    """
+    A failing record rolls back the whole import transaction
+    """
+
+    def records() -> Iterator[DrawRecord]:
+        yield DrawRecord.from_mapping(DRAWS[0])
+        yield DrawRecord.from_mapping({"lottery_id": "x"})
+
+    with pytest.raises(BalotoRuntimeError):
+        DrawImporter(connection, batch_size=1).import_draws(records())
+
+    count = connection.execute("SELECT COUNT(*) FROM sessions;").fetchone()[0]
+    assert count == 0, "The transaction was not rolled back"
+
+
+def test_draw_record_validates_balls() -> None:
+    """
+    Balls out of the game range are rejected
+    """
+    with pytest.raises(BalotoRuntimeError, match="between 1 and 39"):
+        DrawRecord.from_mapping({**DRAWS[0], "balls": "3 9 17 28 43"})
+
+    record = DrawRecord.from_mapping({**DRAWS[0], "balls": "3 9 17 28 43", "game": "baloto"})
+    assert record.mask == (1 << 2) | (1 << 8) | (1 << 16) | (1 << 27) | (1 << 42), "Bad mask"
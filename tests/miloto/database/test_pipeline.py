@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import date
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from baloto.miloto.database.importer import DrawImporter
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.database.importer import read_draws
+from baloto.miloto.database.pipeline import DrawModel
+from baloto.miloto.database.pipeline import IngestionPipeline
+from baloto.miloto.database.schema import migrate
+from baloto.miloto.exceptions.errors import BalotoRuntimeError
+from baloto.miloto.games import GameType
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_dumps(tmp_path: Path) -> list[Path]:
+    generator = np.random.default_rng(4)
+    rows = [
+        {
+            "lottery_id": index,
+            "lottery_date": (date(2021, 1, 1) + timedelta(days=index)).isoformat(),
+            "accumulated": index * 10,
+            "balls": " ".join(str(b) for b in sorted(generator.choice(39, 5, replace=False) + 1)),
+        }
+        for index in range(1, 601)
+    ]
+    jsonl_file = tmp_path / "draws.jsonl"
+    jsonl_file.write_text("\n".join(json.dumps(row) for row in rows[:350]))
+    csv_file = tmp_path / "draws.csv"
+    csv_file.write_text(
+        "lottery_id,lottery_date,accumulated,balls\n"
+        + "\n".join(
+            f"{r['lottery_id']},{r['lottery_date']},{r['accumulated']},{r['balls']}"
+            for r in rows[300:]
+        )
+    )
+    return [jsonl_file, csv_file]
+
+
+def _dump(path: Path) -> tuple[list, list]:
+    conn = sqlite3.connect(path)
+    sessions = conn.execute(
+        "SELECT game, lottery_id, lottery_date, accumulated, mask FROM sessions ORDER BY 2;"
+    ).fetchall()
+    state = conn.execute("SELECT * FROM ball_last_seen ORDER BY 1, 2;").fetchall()
+    conn.close()
+    return sessions, state
+
+
+def test_draw_model_matches_from_mapping() -> None:
+    """The pydantic model accepts and rejects the same rows as the sync reader."""
+    row = {
+        "lottery_id": "7",
+        "lottery_date": " 2025-01-02",
+        "accumulated": "12",
+        "n1": "3",
+        "n2": "9",
+        "n3": "17",
+        "n4": "28",
+        "n5": "39",
+        "superbalota": "",
+    }
+    assert DrawModel.parse(row, GameType.MILOTO) == DrawRecord.from_mapping(row), "same record"
+    with pytest.raises(BalotoRuntimeError):
+        DrawModel.parse({**row, "n5": "40"}, GameType.MILOTO)
+
+
+def test_pipeline_matches_sync_import(tmp_path: Path) -> None:
+    """Importing overlapping files concurrently stores the same draws as the sync importer."""
+    files = _write_dumps(tmp_path)
+    sync_path, async_path = tmp_path / "sync.sqlite3", tmp_path / "async.sqlite3"
+    for path in (sync_path, async_path):
+        conn = sqlite3.connect(path)
+        migrate(conn)
+        conn.close()
+
+    conn = sqlite3.connect(sync_path)
+    importer = DrawImporter(conn, batch_size=64)
+    for file in files:
+        importer.import_draws(read_draws(file))
+    conn.close()
+
+    pipeline = IngestionPipeline(lambda: sqlite3.connect(async_path), batch_size=64, queue_size=1)
+    result = pipeline.run([(file, GameType.MILOTO) for file in files])
+
+    assert result.read == 650, "every row of both files should be read"
+    assert result.inserted == 600, "the overlapping draws should be stored once"
+    assert result.games == {GameType.MILOTO}, "the imported games should be reported"
+    assert _dump(async_path) == _dump(sync_path), "both imports should store the same data"
+
+
+def test_pipeline_rolls_back_on_invalid_rows(tmp_path: Path) -> None:
+    """A failing stage cancels the pipeline and nothing is written."""
+    files = _write_dumps(tmp_path)
+    files[1].write_text(files[1].read_text() + "\n999,2030-01-01,0,1 2 3 4 99\n")
+    path = tmp_path / "db.sqlite3"
+    conn = sqlite3.connect(path)
+    migrate(conn)
+
+    pipeline = IngestionPipeline(lambda: sqlite3.connect(path), batch_size=50, queue_size=2)
+    with pytest.raises(BalotoRuntimeError):
+        pipeline.run([(file, GameType.MILOTO) for file in files])
+    assert conn.execute("SELECT COUNT(*) FROM sessions;").fetchone() == (0,), "should roll back"
+    conn.close()
+
+
+@pytest.mark.parametrize(
+    ("balls", "message"),
+    [
+        ("3 9 17 28", "balls"),
+        ("3 9 17 28 28", "distinct"),
+        ("0 9 17 28 39", "between"),
+    ],
+)
+def test_draw_model_field_validators(balls: str, message: str) -> None:
+    """Ball count, uniqueness and range are checked by the model fields."""
+    row = {"lottery_id": "1", "lottery_date": "2025-01-02", "accumulated": "0", "balls": balls}
+    with pytest.raises(BalotoRuntimeError, match=message):
+        DrawModel.parse(row, GameType.MILOTO)
+    record = DrawModel.parse({**row, "balls": "3 9 17 28 39"}, GameType.MILOTO)
+    assert record.balls == (3, 9, 17, 28, 39), "a valid row should parse"
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import date
+from typing import TYPE_CHECKING
+
+from baloto.miloto.database.importer import DrawImporter
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.database.queries import ball_frequencies
+from baloto.miloto.database.schema import MIGRATIONS
+from baloto.miloto.database.schema import SCHEMA_VERSION
+from baloto.miloto.database.schema import current_version
+from baloto.miloto.database.schema import migrate
+from baloto.miloto.games import GameType
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_migrate_empty_database(tmp_path: Path) -> None:
+    """
+    An empty database is migrated up to the latest schema version
+    """
+    conn = sqlite3.connect(tmp_path / "db.sqlite3")
+
+    assert current_version(conn) == 0, "An empty database should be version 0"
+    assert migrate(conn) == (0, SCHEMA_VERSION), "The migration versions are unexpected"
+    assert migrate(conn) == (SCHEMA_VERSION, SCHEMA_VERSION), "A second migration is a no-op"
+    conn.close()
+
+
+def test_migrate_version_one_in_place(tmp_path: Path) -> None:
+    """
+    The sessions of a version 1 database are preserved by the migration
+    """
+    conn = sqlite3.connect(tmp_path / "db.sqlite3")
+    for statement in MIGRATIONS[1]:
+        conn.execute(statement)
+    conn.execute("INSERT INTO sessions VALUES (7, '2025-10-01', 120);")
+    conn.commit()
+
+    assert current_version(conn) == 1, "A database without schema_version is version 1"
+    migrate(conn)
+
+    row = conn.execute("SELECT draw_id, game, lottery_id, mask FROM sessions;").fetchone()
+    assert row == (7, "miloto", 7, 0), "The migrated session row is unexpected"
+    conn.close()
+
+
+def test_statistics_queries_use_covering_index(tmp_path: Path) -> None:
+    """
+    Frequency and last seen queries are answered from the covering index
+    """
+    conn = sqlite3.connect(tmp_path / "db.sqlite3")
+    migrate(conn)
+    DrawImporter(conn).import_draws(
+        [
+            DrawRecord.from_mapping(
+                {
+                    "lottery_id": 1,
+                    "lottery_date": "2025-01-02",
+                    "accumulated": 1,
+                    "balls": "1 2 3 4 5",
+                }
+            ),
+            DrawRecord.from_mapping(
+                {
+                    "lottery_id": 2,
+                    "lottery_date": "2025-01-04",
+                    "accumulated": 1,
+                    "balls": "1 2 6 7 8",
+                }
+            ),
+        ]
+    )
+
+    frequencies = ball_frequencies(conn, GameType.MILOTO)
+    assert frequencies[1] == 2 and frequencies[8] == 1, "The ball frequencies are unexpected"
+    frequencies = ball_frequencies(conn, GameType.MILOTO, since=date(2025, 1, 3))
+    assert frequencies == {1: 1, 2: 1, 6: 1, 7: 1, 8: 1}, "Only the second draw is in the range"
+
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT ball, COUNT(*) FROM draw_numbers "
+        "WHERE game = ? AND lottery_date >= ? GROUP BY ball;",
+        ("miloto", "2025-01-01"),
+    ).fetchall()
+    assert "COVERING INDEX dn_game_ball_date" in str(plan), "The covering index was not used"
+    conn.close()
+
+
+def test_migrate_ranks_stored_masks(tmp_path: Path) -> None:
+    """
+    Version 7 ranks the masks of the stored draws and tickets
+    """
+    conn = sqlite3.connect(tmp_path / "db.sqlite3")
+    migrate(conn, target=6)
+    mask = (1 << 0) | (1 << 1) | (1 << 2) | (1 << 3) | (1 << 5)
+    conn.execute(
+        "INSERT INTO sessions (game, lottery_id, lottery_date, accumulated, mask)"
+        " VALUES ('miloto', 1, '2025-01-02', 1, ?), ('miloto', 2, '2025-01-04', 1, 0);",
+        (mask,),
+    )
+    conn.execute("INSERT INTO tickets (game, mask, label) VALUES ('miloto', ?, 'old');", (mask,))
+    conn.commit()
+
+    assert migrate(conn) == (6, SCHEMA_VERSION), "The migration versions are unexpected"
+    ranks = conn.execute("SELECT rank FROM sessions ORDER BY lottery_id;").fetchall()
+    assert ranks == [(1,), (None,)], "Draws without balls should not have a rank"
+    ticket = conn.execute("SELECT game, rank, label FROM tickets;").fetchone()
+    assert ticket == ("miloto", 1, "old"), "The migrated ticket row is unexpected"
+    conn.close()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import date
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from baloto.miloto.database.importer import DrawImporter
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.database.tickets import add_tickets
+from baloto.miloto.database.tickets import load_draws
+from baloto.miloto.database.tickets import load_tickets
+from baloto.miloto.games import GameType
+from baloto.miloto.stats.scoring import score_tickets
+
+
+@pytest.fixture(name="connection")
+def tickets_connection(connection: sqlite3.Connection) -> sqlite3.Connection:
+    generator = np.random.default_rng(5)
+    records = [
+        DrawRecord(
+            lottery_id=index,
+            lottery_date=date(2024, 1, 1) + timedelta(days=index),
+            accumulated=0,
+            game=GameType.BALOTO,
+            balls=tuple(int(ball) for ball in sorted(generator.choice(43, 5, replace=False) + 1)),
+            superbalota=int(generator.integers(1, 17)),
+        )
+        for index in range(60)
+    ]
+    DrawImporter(connection).import_draws(records)
+    return connection
+
+
+def test_add_tickets_validates(connection: sqlite3.Connection) -> None:
+    """Invalid tickets are rejected and nothing is stored."""
+    with pytest.raises(ValueError):
+        add_tickets(connection, GameType.BALOTO, [((1, 2, 3, 4, 5), 3), ((1, 2, 3, 4, 44), 1)])
+    assert not len(load_tickets(connection, GameType.BALOTO)), "no ticket should be stored"
+
+
+def test_score_tickets_matches_brute_force(connection: sqlite3.Connection) -> None:
+    """Popcount scoring agrees with comparing the ball sets of every pair."""
+    generator = np.random.default_rng(8)
+    tickets = [
+        (tuple(int(ball) for ball in generator.choice(43, 5, replace=False) + 1), sb)
+        for sb in generator.integers(1, 17, 300).tolist()
+    ]
+    add_tickets(connection, GameType.BALOTO, tickets, label="test")
+    draws = connection.execute(
+        "SELECT draw_id, superbalota FROM sessions WHERE lottery_date >= '2024-01-31'"
+        " ORDER BY lottery_date;"
+    ).fetchall()
+    balls = {
+        draw_id: {
+            row[0]
+            for row in connection.execute(
+                "SELECT ball FROM draw_numbers WHERE draw_id = ?;", (draw_id,)
+            )
+        }
+        for draw_id, _ in draws
+    }
+
+    scores = score_tickets(
+        load_tickets(connection, GameType.BALOTO),
+        load_draws(connection, GameType.BALOTO, since=date(2024, 1, 31)),
+        min_hits=2,
+    )
+
+    expected = np.zeros((6, 2), dtype=np.int64)
+    winners = 0
+    for ticket, ticket_sb in tickets:
+        for draw_id, draw_sb in draws:
+            hits = len(set(ticket) & balls[draw_id])
+            expected[hits, int(ticket_sb == draw_sb)] += 1
+            winners += hits >= 2
+    assert np.array_equal(scores.histogram, expected), "histogram should match brute force"
+    assert len(scores) == winners, "every pair with two hits should be listed"
+    assert (scores.hits >= 2).all(), "listed pairs should reach the minimum hits"
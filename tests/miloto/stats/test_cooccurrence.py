@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import sqlite3
+from itertools import combinations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from baloto.miloto.database.importer import DrawImporter
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.database.schema import migrate
+from baloto.miloto.games import GameType
+from baloto.miloto.stats.cooccurrence import CooccurrenceIndex
+from baloto.miloto.stats.matrix import DrawMatrix
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+BALLS = [
+    [1, 2, 3, 4, 5],
+    [5, 1, 2, 30, 39],
+    [2, 7, 1, 22, 39],
+]
+
+
+def _record(index: int, balls: list[int]) -> DrawRecord:
+    return DrawRecord.from_mapping(
+        {
+            "lottery_id": index,
+            "lottery_date": f"2025-02-{index:02d}",
+            "accumulated": 0,
+            "balls": balls,
+        }
+    )
+
+
+def test_counts_match_combinations() -> None:
+    """
+    Pair and triple counts match a plain python count of the combinations
+    """
+    index = CooccurrenceIndex.from_matrix(DrawMatrix(GameType.MILOTO, np.array(BALLS)))
+
+    assert index.pair_count(1, 2) == 3, "The pair 1-2 was drawn three times"
+    assert index.pair_count(39, 2) == 2, "The pair 2-39 was drawn twice"
+    assert index.pair_count(1, 1) == 3, "The diagonal holds the ball frequency"
+    assert index.triple_count(2, 1, 5) == 2, "The triple 1-2-5 was drawn twice"
+    assert index.triple_count(3, 7, 39) == 0, "The triple 3-7-39 was never drawn"
+
+    expected = sum(len(list(combinations(balls, 3))) for balls in BALLS)
+    assert int(index.triple_counts.sum()) == expected, "Every triple must be counted once"
+    assert index.top_pairs(1) == [(1, 2, 3)], "The top pair is unexpected"
+    assert index.top_triples(1)[0][3] == 2, "The top triple count is unexpected"
+
+
+def test_incremental_update_equals_full_build() -> None:
+    """
+    Adding draws one at a time gives the same counts as a full build
+    """
+    full = CooccurrenceIndex.from_matrix(DrawMatrix(GameType.MILOTO, np.array(BALLS)))
+    incremental = CooccurrenceIndex(GameType.MILOTO)
+    for balls in BALLS:
+        incremental.update(DrawMatrix(GameType.MILOTO, np.array([balls])))
+
+    assert np.array_equal(full.pairs, incremental.pairs), "The pair counts differ"
+    assert np.array_equal(full.triple_keys, incremental.triple_keys), "The triple keys differ"
+    assert np.array_equal(full.triple_counts, incremental.triple_counts), "The triples differ"
+
+
+def test_refresh_reads_only_new_draws(tmp_path: Path) -> None:
+    """
+    The persisted index is extended with the draws inserted after it was saved
+    """
+    conn = sqlite3.connect(tmp_path / "db.sqlite3")
+    migrate(conn)
+    path = tmp_path / "db.miloto.pairs.npz"
+
+    DrawImporter(conn).import_draws([_record(1, BALLS[0]), _record(2, BALLS[1])])
+    index = CooccurrenceIndex.refresh(conn, GameType.MILOTO, path)
+    assert index.draws == 2, "The first refresh should read the two draws"
+
+    DrawImporter(conn).import_draws([_record(3, BALLS[2])])
+    index = CooccurrenceIndex.refresh(conn, GameType.MILOTO, path)
+    conn.close()
+
+    assert index.draws == 3, "The second refresh should add the new draw"
+    assert index.last_draw_id == 3, "The last draw id is unexpected"
+    assert index.pair_count(1, 2) == 3, "The refreshed pair count is unexpected"
+
+
+def test_refresh_rebuilds_a_recreated_database(tmp_path: Path) -> None:
+    """
+    A cached index of another database is rebuilt instead of extended
+    """
+    path = tmp_path / "db.miloto.pairs.npz"
+    conn = sqlite3.connect(tmp_path / "db.sqlite3")
+    migrate(conn)
+    DrawImporter(conn).import_draws([_record(i + 1, balls) for i, balls in enumerate(BALLS)])
+    CooccurrenceIndex.refresh(conn, GameType.MILOTO, path)
+    conn.close()
+
+    conn = sqlite3.connect(tmp_path / "new.sqlite3")
+    migrate(conn)
+    DrawImporter(conn).import_draws([_record(1, BALLS[2]), _record(2, BALLS[1])])
+    index = CooccurrenceIndex.refresh(conn, GameType.MILOTO, path)
+    conn.close()
+
+    assert index.draws == 2, "The stale counts should be dropped"
+    assert index.pair_count(1, 2) == 2, "The pair count should come from the new draws"
+    assert index.triple_count(3, 4, 5) == 0, "The triples of the old database should be gone"
+    assert CooccurrenceIndex.load(path, GameType.MILOTO).fingerprint == (2, 2), "The key is saved"
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from baloto.miloto.database.importer import DrawImporter
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.games import GameType
+from baloto.miloto.stats.features import FeatureIndex
+from baloto.miloto.stats.features import PatternFilter
+from baloto.miloto.stats.features import draw_features
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def test_draw_features() -> None:
+    """Every feature of a few hand checked draws."""
+    balls = np.array([[1, 2, 3, 20, 21], [39, 5, 17, 30, 12], [7, 9, 11, 13, 15]], dtype=np.uint8)
+    features = draw_features(balls, 39)
+
+    assert features["odd"].tolist() == [3, 3, 5], "odd balls should be counted"
+    assert features["high"].tolist() == [2, 2, 0], "balls above 19 should be high"
+    assert features["total"].tolist() == [47, 103, 55], "the balls should be added up"
+    assert features["spread"].tolist() == [20, 34, 8], "the spread is the highest minus lowest"
+    assert features["consecutive"].tolist() == [2, 0, 0], "every run counts once"
+    assert features["decades"].tolist() == ["30200", "12020", "23000"], "balls per decade"
+
+
+def test_index_is_incremental(
+    connection: sqlite3.Connection, draw_records: Callable[..., list[DrawRecord]]
+) -> None:
+    """Imports extend the features table to the same rows a rebuild writes."""
+    generator = np.random.default_rng(5)
+    history = np.array([generator.choice(39, 5, replace=False) + 1 for _ in range(120)])
+    importer = DrawImporter(connection)
+    importer.import_draws(draw_records(history[:80]))
+    importer.import_draws(draw_records(history[80:], 80))
+    incremental = connection.execute("SELECT * FROM draw_features ORDER BY draw_id;").fetchall()
+
+    index = FeatureIndex(connection, GameType.MILOTO)
+    index.rebuild()
+    rebuilt = connection.execute("SELECT * FROM draw_features ORDER BY draw_id;").fetchall()
+    assert rebuilt == incremental, "a rebuild should not change the features"
+    assert len(rebuilt) == len(history), "every draw should have its features"
+
+    odd = (history % 2).sum(axis=1)
+    total = history.sum(axis=1)
+    assert index.histogram("odd") == {
+        int(value): int(count) for value, count in zip(*np.unique(odd, return_counts=True))
+    }, "the odd histogram should match the draws"
+    pattern = PatternFilter(odd=3, min_total=80, max_total=120)
+    assert index.count(pattern) == int(
+        ((odd == 3) & (total >= 80) & (total <= 120)).sum()
+    ), "the filtered count should match the draws"
+    bins = total // 20 * 20
+    assert index.histogram("total", width=20) == {
+        int(value): int(count) for value, count in zip(*np.unique(bins, return_counts=True))
+    }, "the sums should be binned by their lower bound"
+    with pytest.raises(ValueError):
+        index.histogram("balls")
+    with pytest.raises(ValueError):
+        index.histogram("decades", width=2)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from baloto.miloto.games import GameType
+from baloto.miloto.stats.follow import MAX_LAG
+from baloto.miloto.stats.follow import FollowCache
+from baloto.miloto.stats.follow import FollowTensor
+from baloto.miloto.stats.matrix import DrawMatrix
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(name="matrix", scope="module")
+def random_matrix() -> DrawMatrix:
+    generator = np.random.default_rng(11)
+    balls = np.array([generator.choice(39, 5, replace=False) + 1 for _ in range(60)])
+    return DrawMatrix(GameType.MILOTO, balls.astype(np.uint8))
+
+
+def _brute_force(matrix: DrawMatrix, ball: int, target: int, lag: int) -> tuple[int, int, int]:
+    draws = [set(row.tolist()) for row in matrix.balls]
+    starts = range(len(draws) - lag)
+    sources = [t for t in starts if ball in draws[t]]
+    at = sum(target in draws[t + lag] for t in sources)
+    within = sum(any(target in draws[t + k] for k in range(1, lag + 1)) for t in sources)
+    return len(sources), at, within
+
+
+def test_tensor_matches_brute_force(matrix: DrawMatrix) -> None:
+    """The shifted products count the same pairs as walking the draws."""
+    tensor = FollowTensor.build(matrix)
+    for ball, target in ((1, 2), (7, 30), (15, 15), (39, 4)):
+        for lag in (1, 3, MAX_LAG):
+            sources, at, within = _brute_force(matrix, ball, target, lag)
+            index = lag - 1
+            assert tensor.sources[index, ball - 1] == sources, "draws with the ball"
+            assert tensor.at[index, ball - 1, target - 1] == at, f"exactly {lag} draws later"
+            assert tensor.within[index, ball - 1, target - 1] == within, f"within {lag} draws"
+
+    assert tensor.starts.tolist() == [
+        len(matrix) - lag for lag in range(1, MAX_LAG + 1)
+    ], "only the draws with lag draws after them are counted"
+    with pytest.raises(ValueError):
+        tensor.probabilities(1, MAX_LAG + 1)
+
+
+def test_cache_extends_incrementally(tmp_path: Path, matrix: DrawMatrix) -> None:
+    """A cached tensor extended with new draws equals one built at once."""
+    cache = FollowCache(tmp_path / "follow.npz")
+    cache.load(DrawMatrix(matrix.game, matrix.balls[:25]))
+    cache.load(DrawMatrix(matrix.game, matrix.balls[:27]))
+    extended = cache.load(matrix)
+    built = FollowTensor.build(matrix)
+    for name, array in built.arrays().items():
+        assert np.array_equal(getattr(extended, name), array), f"{name} should not change"
+
+    reordered = DrawMatrix(matrix.game, matrix.balls, draw_ids=matrix.draw_ids[::-1].copy())
+    assert not cache.get().extends(reordered), "changed draws should not extend the tensor"
+    rebuilt = cache.load(reordered)
+    assert np.array_equal(rebuilt.draw_ids, reordered.draw_ids), "changed draws are rebuilt"
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from baloto.miloto.database.importer import DrawImporter
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.database.schema import migrate
+from baloto.miloto.games import GameType
+from baloto.miloto.stats.frequency import frequencies
+from baloto.miloto.stats.frequency import position_distribution
+from baloto.miloto.stats.frequency import rolling_frequencies
+from baloto.miloto.stats.matrix import DrawMatrix
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+BALLS = [
+    [1, 2, 3, 4, 5],
+    [1, 7, 9, 30, 39],
+    [2, 7, 11, 22, 39],
+    [1, 2, 12, 13, 14],
+]
+
+
+@pytest.fixture(name="matrix", scope="module")
+def draw_matrix() -> DrawMatrix:
+    return DrawMatrix(GameType.MILOTO, np.array(BALLS, dtype=np.uint8))
+
+
+def test_onehot_matrix(matrix: DrawMatrix) -> None:
+    """
+    The one-hot matrix has a column per ball and five balls per row
+    """
+    assert matrix.onehot.shape == (4, 43), "The one-hot shape is unexpected"
+    assert matrix.onehot.sum(axis=1).tolist() == [5, 5, 5, 5], "Every row must have 5 balls"
+    assert matrix.onehot[1, 38], "Ball 39 of the second draw is not set"
+
+
+def test_frequencies(matrix: DrawMatrix) -> None:
+    """
+    The frequencies match a plain python count
+    """
+    counts = frequencies(matrix)
+    expected = np.bincount(np.array(BALLS).ravel() - 1, minlength=43)
+
+    assert counts.tolist() == expected.tolist(), "The frequencies are unexpected"
+
+
+def test_rolling_frequencies(matrix: DrawMatrix) -> None:
+    """
+    Every rolling window row equals the frequencies of that slice of draws
+    """
+    rolling = rolling_frequencies(matrix, 2)
+
+    assert rolling.shape == (3, 43), "The rolling frequencies shape is unexpected"
+    for start, row in enumerate(rolling):
+        expected = frequencies(DrawMatrix(GameType.MILOTO, np.array(BALLS[start : start + 2])))
+        assert row.tolist() == expected.tolist(), f"The window {start} is unexpected"
+
+    assert rolling_frequencies(matrix, 5).shape == (0, 43), "A window too large is empty"
+
+
+def test_position_distribution(matrix: DrawMatrix) -> None:
+    """
+    Position distributions count the balls drawn in every position
+    """
+    distribution = position_distribution(matrix)
+
+    assert distribution.shape == (5, 43), "The distribution shape is unexpected"
+    assert distribution[0, 0] == 3, "Ball 1 was drawn three times in the first position"
+    assert distribution[4, 38] == 2, "Ball 39 was drawn twice in the last position"
+    assert distribution.sum() == 20, "Every drawn ball must be counted once"
+
+
+def test_load_matrix_from_database(tmp_path: Path) -> None:
+    """
+    The matrix loads the draws in chronological order
+    """
+    conn = sqlite3.connect(tmp_path / "db.sqlite3")
+    migrate(conn)
+    records = [
+        DrawRecord.from_mapping(
+            {
+                "lottery_id": index,
+                "lottery_date": f"2025-01-{10 - index:02d}",
+                "accumulated": 0,
+                "balls": balls,
+            }
+        )
+        for index, balls in enumerate(BALLS, start=1)
+    ]
+    DrawImporter(conn).import_draws(records)
+
+    matrix = DrawMatrix.load(conn, GameType.MILOTO)
+    conn.close()
+
+    assert matrix.balls.tolist() == BALLS[::-1], "The draws are not sorted by date"
+    assert matrix.draw_ids.tolist() == [4, 3, 2, 1], "The draw ids are unexpected"
+    assert str(matrix.dates[0]) == "2025-01-06", "The first date is unexpected"
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from baloto.miloto.database.importer import DrawImporter
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.games import GameType
+from baloto.miloto.stats.gaps import GapIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _expected_gaps(balls: np.ndarray, ball: int) -> list[int]:
+    hits = [index for index, row in enumerate(balls) if ball in row]
+    return [b - a - 1 for a, b in zip(hits, hits[1:])]
+
+
+@pytest.fixture(name="history", scope="module")
+def random_history() -> np.ndarray:
+    generator = np.random.default_rng(7)
+    return np.array([generator.choice(39, 5, replace=False) + 1 for _ in range(120)])
+
+
+def test_incremental_index_matches_history(
+    connection: sqlite3.Connection,
+    history: np.ndarray,
+    draw_records: Callable[..., list[DrawRecord]],
+) -> None:
+    """
+    Importing the history in chunks builds the same gaps as a brute force count
+    """
+    for start in range(0, len(history), 25):
+        DrawImporter(connection).import_draws(draw_records(history[start : start + 25], start + 1))
+
+    index = GapIndex(connection, GameType.MILOTO)
+    for gaps in index.report():
+        expected = _expected_gaps(history, gaps.ball)
+        hits = [i for i, row in enumerate(history) if gaps.ball in row]
+
+        assert gaps.hits == len(hits), f"The hits of ball {gaps.ball} are unexpected"
+        assert gaps.current == len(history) - 1 - hits[-1], f"Bad current gap {gaps.ball}"
+        assert gaps.maximum == max(expected, default=0), f"Bad max gap {gaps.ball}"
+        assert gaps.mean == pytest.approx(np.mean(expected) if expected else 0.0)
+        assert sum(index.distribution(gaps.ball).values()) == len(expected)
+
+
+def test_out_of_order_import_rebuilds(
+    connection: sqlite3.Connection,
+    history: np.ndarray,
+    draw_records: Callable[..., list[DrawRecord]],
+) -> None:
+    """
+    Importing older draws after newer ones rebuilds the index
+    """
+    DrawImporter(connection).import_draws(draw_records(history[60:], 61))
+    DrawImporter(connection).import_draws(draw_records(history[:60], 1))
+
+    report = {gaps.ball: gaps for gaps in GapIndex(connection, GameType.MILOTO).report()}
+    for ball, gaps in report.items():
+        expected = _expected_gaps(history, ball)
+        assert gaps.maximum == max(expected, default=0), f"Bad max gap {ball}"
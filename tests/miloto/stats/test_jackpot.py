@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from baloto.miloto.stats.jackpot import JackpotSeries
+from baloto.miloto.stats.jackpot import rolling_max
+from baloto.miloto.stats.jackpot import rolling_mean
+from baloto.miloto.stats.jackpot import run_lengths
+
+
+@pytest.mark.parametrize("window", [1, 2, 3, 7, 10, 64])
+def test_rolling_kernels_match_naive(window: int) -> None:
+    """The O(n) kernels agree with computing every window on its own."""
+    values = np.random.default_rng(window).integers(0, 10**9, 200, dtype=np.int64)
+    naive_mean = [values[i : i + window].mean() for i in range(len(values) - window + 1)]
+    naive_max = [values[i : i + window].max() for i in range(len(values) - window + 1)]
+    assert np.allclose(rolling_mean(values, window), naive_mean), "rolling means should match"
+    assert rolling_max(values, window).tolist() == naive_max, "rolling maxima should match"
+    assert rolling_max(values[: window - 1], window).size == 0, "short series have no window"
+
+
+def test_run_lengths() -> None:
+    """Runs of consecutive true values are measured in order."""
+    flags = np.array([1, 1, 0, 1, 0, 0, 1, 1, 1], dtype=np.bool_)
+    assert run_lengths(flags).tolist() == [2, 1, 3], "the runs should be measured"
+    assert run_lengths(np.zeros(3, dtype=np.bool_)).size == 0, "no runs without true values"
+
+
+def test_jackpot_series_streaks_and_growth() -> None:
+    """Rollovers, won jackpots and growth are derived from the accumulated series."""
+    accumulated = np.array([100, 110, 121, 100, 150, 150, 165, 180], dtype=np.int64)
+    series = JackpotSeries(np.arange(8).astype("datetime64[D]"), accumulated)
+
+    assert series.rollovers.tolist() == [True, True, False, True, False, True, True]
+    assert series.streaks().tolist() == [2, 1, 2], "streaks are runs of rollovers"
+    assert series.current_streak() == 2, "the last two draws rolled over"
+    assert series.mean_growth() == pytest.approx((10 + 11 + 50 + 15 + 15) / 5)
+    assert series.median_growth_rate() == pytest.approx(0.1), "the median growth is 10%"
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import date
+from itertools import combinations
+from math import comb
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from baloto.miloto.combinations import COMBINATIONS
+from baloto.miloto.combinations import rank
+from baloto.miloto.database.importer import DrawImporter
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.games import GameType
+from baloto.miloto.stats.features import PatternFilter
+from baloto.miloto.stats.occupancy import Occupancy
+from baloto.miloto.stats.occupancy import OccupancyCache
+from baloto.miloto.stats.occupancy import never_drawn
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+DRAWS = [
+    (GameType.BALOTO, date(2025, 1, 1), (1, 2, 3, 4, 5)),
+    (GameType.BALOTO, date(2025, 2, 1), (7, 8, 20, 33, 43)),
+    (GameType.REVANCHA, date(2025, 1, 1), (1, 2, 3, 4, 6)),
+]
+
+
+@pytest.fixture(name="connection")
+def occupancy_connection(connection: sqlite3.Connection) -> sqlite3.Connection:
+    DrawImporter(connection).import_draws(
+        [
+            DrawRecord(lottery_id=day, lottery_date=when, accumulated=0, game=game, balls=balls)
+            for day, (game, when, balls) in enumerate(DRAWS, start=1)
+        ]
+    )
+    return connection
+
+
+def test_set_operations(connection: sqlite3.Connection) -> None:
+    """Bitmaps of games and date ranges combine like sets of combinations."""
+    baloto = Occupancy.query(connection, GameType.BALOTO)
+    revancha = Occupancy.query(connection, GameType.REVANCHA)
+    january = Occupancy.query(connection, GameType.BALOTO, until=date(2025, 1, 31))
+
+    assert len(baloto) == 2 and (7, 8, 20, 33, 43) in baloto, "the baloto draws are set"
+    assert len(january) == 1 and (7, 8, 20, 33, 43) not in january, "the range filters"
+    assert len(baloto | revancha) == 3, "the union has every draw"
+    assert len(baloto & revancha) == 0, "no combination was drawn in both games"
+    assert baloto - january == Occupancy.from_ranks([rank((7, 8, 20, 33, 43))]), "difference"
+    assert len(~baloto) == COMBINATIONS - 2, "the complement ignores the padding bits"
+
+
+def test_never_drawn_streams_filtered_combinations(connection: sqlite3.Connection) -> None:
+    """The unseen combinations match a brute force enumeration."""
+    drawn = {balls for _, _, balls in DRAWS}
+    occupancy = Occupancy.from_ranks(rank(balls) for balls in drawn)
+    pattern = PatternFilter(odd=4, max_total=40)
+
+    streamed = [
+        tuple(row)
+        for chunk in never_drawn(occupancy, 12, pattern, include=[1], chunk_size=100)
+        for row in chunk.tolist()
+    ]
+    expected = [
+        balls
+        for balls in combinations(range(1, 13), 5)
+        if balls not in drawn
+        and 1 in balls
+        and sum(ball % 2 for ball in balls) == 4
+        and sum(balls) <= 40
+    ]
+    assert sorted(streamed) == sorted(expected), "the filtered unseen combinations"
+    unseen = sum(len(chunk) for chunk in never_drawn(occupancy, 12))
+    assert unseen == comb(12, 5) - 2, "only the draws below 13 are excluded"
+
+
+def test_cache_follows_the_draws(tmp_path: Path, connection: sqlite3.Connection) -> None:
+    """The cached bitmap is rebuilt once the draws change."""
+    cache = OccupancyCache(tmp_path / "baloto.occupancy.npz")
+    assert len(cache.load(connection, GameType.BALOTO)) == 2, "the bitmap is built"
+
+    DrawImporter(connection).import_draws(
+        [DrawRecord(9, date(2025, 3, 1), 0, GameType.BALOTO, (9, 10, 11, 12, 13))]
+    )
+    assert len(cache.load(connection, GameType.BALOTO)) == 3, "the new draw is counted"
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from fractions import Fraction
+from math import comb
+
+import numpy as np
+import pytest
+
+from baloto.miloto.games import GameType
+from baloto.miloto.games import get_game
+from baloto.miloto.stats.odds import Odds
+from baloto.miloto.stats.odds import binomial
+from baloto.miloto.stats.odds import pascal_triangle
+
+
+def test_pascal_triangle_matches_comb() -> None:
+    """Every entry of the table is the exact binomial coefficient."""
+    triangle = pascal_triangle(60)
+    for n, row in enumerate(triangle):
+        assert row == tuple(comb(n, k) for k in range(n + 1)), f"row {n} should match comb"
+    assert binomial(43, 5) == 962_598, "there are 962598 baloto combinations"
+    assert binomial(5, 6) == 0, "choosing more than available should be zero"
+
+
+@pytest.mark.parametrize("game_type", list(GameType))
+def test_probabilities_add_up(game_type: GameType) -> None:
+    """The tiers plus the losing outcomes cover the whole probability space."""
+    game = get_game(game_type)
+    odds = Odds(game)
+    losing = 1 - odds.win_probability
+    assert 0 < losing < 1, "some outcomes should lose"
+    assert odds.jackpot_probability == Fraction(
+        1, comb(game.max_ball, 5) * (game.max_superbalota or 1)
+    ), "the jackpot needs every ball"
+
+
+def test_expected_value_sweep_matches_exact() -> None:
+    """The vectorized sweep agrees with the exact expected value and break-even point."""
+    odds = Odds(get_game(GameType.BALOTO))
+    jackpots = np.array([0, 1_000_000_000, 20_000_000_000])
+    exact = [float(odds.expected_value(int(jackpot))) for jackpot in jackpots]
+    assert np.allclose(odds.expected_values(jackpots), exact), "sweep should match exact values"
+    assert odds.expected_value(0) < 0, "a ticket without jackpot should lose money"
+    assert odds.expected_value(int(odds.break_even()) + 1) > 0, "break-even should be positive"
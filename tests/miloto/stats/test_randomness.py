@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from baloto.miloto.games import GameType
+from baloto.miloto.stats.matrix import DrawMatrix
+from baloto.miloto.stats.randomness import RandomnessCache
+from baloto.miloto.stats.randomness import chi2_sf
+from baloto.miloto.stats.randomness import normal_sf
+from baloto.miloto.stats.randomness import run_battery
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    ("statistic", "dof", "expected"),
+    [(3.841458820694124, 1, 0.05), (10.0, 5, 0.07523524614651217), (42.0, 42, 0.4709743638)],
+)
+def test_chi2_sf(statistic: float, dof: int, expected: float) -> None:
+    """The chi-square survival function matches reference values."""
+    assert chi2_sf(statistic, dof) == pytest.approx(expected, rel=1e-6)
+    assert normal_sf(1.959963984540054) == pytest.approx(0.025), "the normal tail is 2.5%"
+
+
+def _matrix(balls: np.ndarray) -> DrawMatrix:
+    return DrawMatrix(GameType.MILOTO, balls.astype(np.uint8))
+
+
+def test_battery_accepts_random_and_flags_biased_draws() -> None:
+    """Uniform random draws pass every test and a biased history fails uniformity."""
+    generator = np.random.default_rng(21)
+    fair = np.sort(np.array([generator.choice(39, 5, replace=False) + 1 for _ in range(2000)]))
+    results = run_battery(_matrix(fair), 39)
+    names = [result.name for result in results]
+    assert len(names) == len(set(names)) == 9, "every test and position should report"
+    assert all(result.p_value > 1e-4 for result in results), "fair draws should pass"
+
+    weights = np.ones(39)
+    weights[:5] = 3
+    biased = np.array(
+        [generator.choice(39, 5, replace=False, p=weights / weights.sum()) + 1 for _ in range(2000)]
+    )
+    uniformity = run_battery(_matrix(biased), 39)[0]
+    assert uniformity.p_value < 1e-6, "a biased history should fail the uniformity test"
+
+
+def test_cache_is_keyed_by_fingerprint(tmp_path: Path) -> None:
+    """Cached results are only returned for the same draw table fingerprint."""
+    cache = RandomnessCache(tmp_path / "randomness.json")
+    generator = np.random.default_rng(1)
+    results = run_battery(
+        _matrix(np.array([generator.choice(39, 5, replace=False) + 1 for _ in range(100)])), 39
+    )
+    assert cache.get((100, 100)) is None, "an empty cache has no results"
+    cache.put((100, 100), results)
+    assert cache.get((100, 100)) == results, "the same fingerprint should hit the cache"
+    assert cache.get((101, 101)) is None, "a new draw should invalidate the cache"
+
+
+def test_cache_skips_unwritable_directories(tmp_path: Path) -> None:
+    """A cache that cannot be written is skipped instead of failing the command."""
+    cache = RandomnessCache(tmp_path / "missing" / "randomness.json")
+    cache.put((1, 1), [])
+    assert cache.get((1, 1)) is None, "nothing should be cached"
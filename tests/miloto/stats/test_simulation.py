@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from math import comb
+
+import numpy as np
+import pytest
+
+from baloto.miloto.games import GameType
+from baloto.miloto.games import get_game
+from baloto.miloto.stats.matrix import DrawMatrix
+from baloto.miloto.stats.simulation import Simulator
+from baloto.miloto.stats.simulation import Strategy
+from baloto.miloto.stats.simulation import pick_ticket
+
+
+@pytest.fixture(name="matrix", scope="module")
+def history_matrix() -> DrawMatrix:
+    generator = np.random.default_rng(11)
+    balls = np.array([generator.choice(39, 5, replace=False) + 1 for _ in range(200)])
+    return DrawMatrix(GameType.MILOTO, balls.astype(np.uint8))
+
+
+def test_pick_ticket_hot_and_cold(matrix: DrawMatrix) -> None:
+    """Hot and cold tickets are the most and least drawn balls."""
+    counts = np.bincount(matrix.balls.ravel().astype(np.intp), minlength=40)[1:]
+    hot = pick_ticket(Strategy.HOT, matrix, 39)
+    cold = pick_ticket(Strategy.COLD, matrix, 39)
+    assert len(set(hot.tolist())) == 5, "hot ticket should have five distinct balls"
+    assert counts[hot].min() >= np.sort(counts)[-5], "hot ticket should play the top balls"
+    assert counts[cold].max() <= np.sort(counts)[4], "cold ticket should play the bottom balls"
+    assert pick_ticket(Strategy.RANDOM, matrix, 39).size == 0, "random has no fixed ticket"
+
+
+def test_simulation_is_reproducible_by_seed(matrix: DrawMatrix) -> None:
+    """The same seed gives the same counts whatever the number of workers."""
+    game = get_game(GameType.MILOTO)
+    strategies = list(Strategy)
+    first = Simulator(game, seed=5, workers=1).run(strategies, matrix, 150_000)
+    second = Simulator(game, seed=5, workers=2).run(strategies, matrix, 150_000)
+    other = Simulator(game, seed=6, workers=1).run(strategies, matrix, 150_000)
+
+    for a, b in zip(first, second):
+        assert np.array_equal(a.counts, b.counts), f"{a.strategy} should be reproducible"
+        assert a.draws == 150_000, "every simulated draw should be counted once"
+    assert any(
+        not np.array_equal(a.counts, b.counts) for a, b in zip(first, other)
+    ), "a different seed should give different counts"
+
+
+def test_simulation_matches_exact_probabilities(matrix: DrawMatrix) -> None:
+    """Hit frequencies converge to the hypergeometric distribution."""
+    game = get_game(GameType.BALOTO)
+    results = Simulator(game, seed=1, workers=1).run(
+        [Strategy.HOT, Strategy.RANDOM], matrix, 200_000
+    )
+    total = comb(43, 5)
+    for result in results:
+        for hits in range(3):
+            expected = comb(5, hits) * comb(38, 5 - hits) / total
+            observed = result.hits(hits) / result.draws
+            assert abs(observed - expected) < 0.01, f"{result.strategy} {hits} hits off"
+        superbalota = sum(result.hits(h, superbalota=True) for h in range(6)) / result.draws
+        assert abs(superbalota - 1 / 16) < 0.005, "superbalota should match one in sixteen"
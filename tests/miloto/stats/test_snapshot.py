@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from baloto.miloto.database.importer import DrawImporter
+from baloto.miloto.database.importer import DrawRecord
+from baloto.miloto.games import GameType
+from baloto.miloto.stats.snapshot import ROLLING_WINDOWS
+from baloto.miloto.stats.snapshot import StatsSnapshot
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _snapshot(connection: sqlite3.Connection) -> tuple:
+    tables = ("stats_ball_counts", "stats_pair_counts", "stats_rolling_counts")
+    return tuple(
+        connection.execute(f"SELECT * FROM {table} ORDER BY 1, 2, 3;").fetchall()
+        for table in tables
+    ) + (connection.execute("SELECT draws, last_date FROM stats_snapshot;").fetchall(),)
+
+
+@pytest.fixture(name="history", scope="module")
+def random_history() -> np.ndarray:
+    generator = np.random.default_rng(3)
+    return np.array([generator.choice(39, 5, replace=False) + 1 for _ in range(150)])
+
+
+def test_snapshot_matches_the_draws(
+    connection: sqlite3.Connection,
+    history: np.ndarray,
+    draw_records: Callable[..., list[DrawRecord]],
+) -> None:
+    """Counts, pairs and rolling windows agree with the raw draws."""
+    DrawImporter(connection).import_draws(draw_records(history))
+    snapshot = StatsSnapshot(connection, GameType.MILOTO)
+
+    counts = np.bincount(history.ravel(), minlength=40)
+    assert {ball: c for ball, (c, _) in snapshot.ball_counts().items()} == {
+        ball: int(counts[ball]) for ball in np.flatnonzero(counts)
+    }, "ball counts should match the draws"
+
+    onehot = np.zeros((len(history), 43), dtype=np.int64)
+    np.put_along_axis(onehot, history - 1, 1, axis=1)
+    pairs = onehot.T @ onehot
+    np.fill_diagonal(pairs, 0)
+    assert np.array_equal(snapshot.pair_counts(), pairs), "pair counts should match the draws"
+
+    for window in ROLLING_WINDOWS:
+        recent = np.bincount(history[-window:].ravel(), minlength=40)
+        assert snapshot.rolling_counts(window) == {
+            ball: int(recent[ball]) for ball in np.flatnonzero(recent)
+        }, f"the last {window} draws should be counted"
+
+
+def test_incremental_refresh_equals_rebuild(
+    connection: sqlite3.Connection,
+    history: np.ndarray,
+    draw_records: Callable[..., list[DrawRecord]],
+) -> None:
+    """Imports in batches, even out of date order, leave the same snapshot as a rebuild."""
+    importer = DrawImporter(connection)
+    importer.import_draws(draw_records(history[:100]))
+    importer.import_draws(draw_records(history[120:], 120))
+    importer.import_draws(draw_records(history[100:120], 100))
+    incremental = _snapshot(connection)
+
+    connection.execute("BEGIN;")
+    StatsSnapshot(connection, GameType.MILOTO).rebuild()
+    connection.execute("COMMIT;")
+    assert _snapshot(connection) == incremental, "a rebuild should not change the snapshot"
+    assert incremental[3] == [(150, "2020-05-29")], "the snapshot should count every draw"
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from itertools import combinations
+from math import comb
+
+import numpy as np
+import pytest
+
+from baloto.miloto.combinations import COMBINATIONS
+from baloto.miloto.combinations import masks_to_ranks
+from baloto.miloto.combinations import rank
+from baloto.miloto.combinations import ranks
+from baloto.miloto.combinations import ranks_to_masks
+from baloto.miloto.combinations import unrank
+from baloto.miloto.combinations import unranks
+from baloto.miloto.games import ball_mask
+
+
+def test_ranks_follow_colexicographic_order() -> None:
+    """Combinations of the first balls rank first, every rank is used once."""
+    expected = sorted(combinations(range(1, 11), 5), key=lambda balls: balls[::-1])
+    assert [rank(balls) for balls in expected] == list(range(comb(10, 5))), "colex order"
+    assert rank((5, 1, 4, 3, 2)) == 0, "the balls may come in any order"
+    assert unrank(COMBINATIONS - 1) == (39, 40, 41, 42, 43), "the last combination"
+    assert rank((35, 36, 37, 38, 39)) == comb(39, 5) - 1, "miloto ranks below C(39, 5)"
+
+
+def test_vectorized_codec_round_trips() -> None:
+    """Every rank unranks to sorted balls that rank back to it."""
+    values = np.arange(COMBINATIONS)
+    balls = unranks(values)
+    assert np.all(np.diff(balls.astype(np.int64), axis=1) > 0), "the balls should be sorted"
+    assert np.array_equal(ranks(balls), values), "every rank should round trip"
+
+    sample = balls[::9973]
+    masks = np.array([ball_mask(row.tolist()) for row in sample], dtype=np.uint64)
+    assert np.array_equal(ranks_to_masks(values[::9973]), masks), "ranks to masks"
+    assert np.array_equal(masks_to_ranks(masks), values[::9973]), "masks to ranks"
+
+
+def test_codec_rejects_invalid_input() -> None:
+    """Out of range ranks and balls are errors."""
+    with pytest.raises(ValueError):
+        unranks([COMBINATIONS])
+    with pytest.raises(ValueError):
+        rank((1, 1, 2, 3, 4))
+    with pytest.raises(ValueError):
+        masks_to_ranks([0b1111])
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules only the commands that need them may import
+DEFERRED = (
+    "argparse",
+    "glom",
+    "numpy",
+    "pendulum",
+    "pydantic_settings",
+    "rich.syntax",
+    "sqlite3",
+    "baloto.core.config.settings",
+    "baloto.miloto.miloto",
+)
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """
+    The cumulative microseconds of every module imported by ``module``, from ``-X importtime``.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_main_module_defers_the_application() -> None:
+    """Running the entry point module imports nothing until main() runs."""
+    times = _import_times("baloto.miloto.__main__")
+    assert "baloto.miloto.application" not in times, "the application is imported by main()"
+
+
+@pytest.mark.parametrize("module", DEFERRED)
+def test_application_defers_heavy_imports(module: str) -> None:
+    """Building the command table does not import the command dependencies."""
+    assert module not in _import_times("baloto.miloto.application"), f"{module} is imported"
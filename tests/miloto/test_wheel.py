@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from baloto.miloto.wheel import Wheel
+from baloto.miloto.wheel import combination_masks
+
+
+def test_combination_masks() -> None:
+    """Every combination is packed with one bit per ball."""
+    masks = combination_masks([1, 5, 43], 2)
+    assert masks.dtype == np.uint64, "masks should be 64-bit"
+    assert masks.tolist() == [0b10001, (1 << 42) | 1, (1 << 42) | (1 << 4)], "bit ball-1 is set"
+
+
+@pytest.mark.parametrize(
+    ("numbers", "guarantee", "condition"), [(8, 3, 3), (12, 3, 4), (10, 4, 5), (15, 2, 2)]
+)
+def test_design_covers_every_target(numbers: int, guarantee: int, condition: int) -> None:
+    """Any drawn combination meeting the condition shares the guarantee with some ticket."""
+    wheel = Wheel(range(1, numbers + 1), guarantee, condition)
+    tickets = wheel.design(iterations=20, seed=3)
+
+    assert wheel.verify(tickets), "the design should cover every target"
+    assert len(tickets) < len(wheel.tickets), "the design should not play every combination"
+    for target in combinations(range(1, numbers + 1), condition):
+        assert any(
+            len(set(target) & set(ticket)) >= guarantee for ticket in tickets
+        ), f"{target} should be covered"
+
+
+def test_design_is_reproducible_and_minimal() -> None:
+    """Designs depend on the seed only and have no redundant ticket."""
+    wheel = Wheel(range(1, 11), 3)
+    tickets = wheel.design(iterations=10, seed=9)
+    assert tickets == wheel.design(iterations=10, seed=9), "the same seed gives the same design"
+    for index in range(len(tickets)):
+        assert not wheel.verify(tickets[:index] + tickets[index + 1 :]), "no ticket is redundant"
+
+
+def test_invalid_wheel() -> None:
+    """Too few numbers or an impossible guarantee are rejected."""
+    with pytest.raises(ValueError):
+        Wheel([1, 2, 3, 4])
+    with pytest.raises(ValueError):
+        Wheel(range(1, 10), guarantee=4, condition=3)